@@ -0,0 +1,384 @@
+"""Ability engine. Card.ability text is compiled once into Ability objects
+made of Effects, so using an ability is a function call instead of reading
+the text every time it is played.
+
+Ability text is made of sentences. Each sentence is one Effect, optionally
+starting with a trigger ("When this dies, ...") or a condition ("If it
+dies, ...") and optionally ending with a duration ("... until the end of
+your turn."). Supported effects:
+    Deal 4 damage to an enemy.
+    Give a creature you control +1 STR/+1 FOR.
+    Firebug gains +2 STR, +2 FOR.
+    Heal your summoner for 3.
+    Draw 2 cards.
+    SPELL DAMAGE +1."""
+from enum import Enum
+from functools import lru_cache
+import re
+from deckbuild import Card, CardType
+from modifiers import Layer
+
+class Target(Enum):
+    """Who or what an Effect applies to."""
+    ENEMY = 0
+    ENEMY_CREATURE = 1
+    ENEMY_SUMMONER = 2
+    FRIENDLY_CREATURE = 3
+    FRIENDLY_SUMMONER = 4
+    ANY_CREATURE = 5
+    ALL_FRIENDLY_CREATURES = 6
+    ALL_OTHER_FRIENDLY_CREATURES = 7
+    ALL_ENEMY_CREATURES = 8
+    SELF = 9
+    IT = 10 # The previous target, or the subject of the triggering event.
+
+class Duration(Enum):
+    """How long an Effect lasts."""
+    PERMANENT = 0
+    END_OF_TURN = 1
+
+class Trigger(Enum):
+    """When an Ability is used."""
+    ON_PLAY = 0
+    ON_DEATH = 1
+    ON_ATTACK = 2
+    ON_ENEMY_ATTACK = 3
+    ON_CREATURE_DIED = 4
+    ON_ENEMY_SPELL = 5
+    START_OF_TURN = 6
+    END_OF_TURN = 7
+
+class Condition(Enum):
+    """Condition that must be met for an Effect to happen."""
+    ALWAYS = 0
+    IT_DIED = 1
+    IT_SURVIVED = 2
+
+TARGET_PHRASES = {
+    'an enemy': Target.ENEMY,
+    'an enemy creature': Target.ENEMY_CREATURE,
+    'the enemy summoner': Target.ENEMY_SUMMONER,
+    'the enemy': Target.ENEMY_SUMMONER,
+    'a creature you control': Target.FRIENDLY_CREATURE,
+    'your summoner': Target.FRIENDLY_SUMMONER,
+    'a creature': Target.ANY_CREATURE,
+    'all creatures you control': Target.ALL_FRIENDLY_CREATURES,
+    'all other creatures you control': Target.ALL_OTHER_FRIENDLY_CREATURES,
+    'all enemy creatures': Target.ALL_ENEMY_CREATURES,
+    'this creature': Target.SELF,
+    'this': Target.SELF,
+    'it': Target.IT
+}
+
+TRIGGER_PHRASES = {
+    'when this dies': Trigger.ON_DEATH,
+    'when this attacks': Trigger.ON_ATTACK,
+    'when an enemy creature attacks': Trigger.ON_ENEMY_ATTACK,
+    'when a creature dies': Trigger.ON_CREATURE_DIED,
+    'when your opponent casts a spell': Trigger.ON_ENEMY_SPELL,
+    'at the start of your turn': Trigger.START_OF_TURN,
+    'at the end of your turn': Trigger.END_OF_TURN
+}
+
+CONDITION_PHRASES = {
+    'if it dies': Condition.IT_DIED,
+    'if it survives': Condition.IT_SURVIVED
+}
+
+DAMAGE_PATTERN = re.compile(r'deal (\d+) damage to (.+)')
+GIVE_PATTERN = re.compile(r'give (.+?) ([+-]\d+ (?:str|for)(?:\s*(?:/|,|and)\s*[+-]\d+ (?:str|for))?)')
+GAINS_PATTERN = re.compile(r'(.+?) gains? ([+-]\d+ (?:str|for)(?:\s*(?:/|,|and)\s*[+-]\d+ (?:str|for))?)')
+STAT_PATTERN = re.compile(r'([+-]\d+) (str|for)')
+HEAL_PATTERN = re.compile(r'heal (.+?) for (\d+)')
+DRAW_PATTERN = re.compile(r'draw (\d+|a) cards?')
+SPELL_DAMAGE_PATTERN = re.compile(r'spell damage \+(\d+)')
+DURATION_SUFFIX = ' until the end of your turn'
+
+class AbilityContext:
+    """Everything an Ability needs while it is being used: the card using
+    it, its Summoner and Battlefield, the targets chosen by the player (used
+    in order by single-target Effects) and the subject of the triggering
+    event, if any. If no target was chosen, chooser(candidates) picks one,
+    defaulting to the first candidate. If restrict_to is given, Effects only
+    apply to that creature, whether they target one creature or a group."""
+    def __init__(self, source, summoner, battlefield=None, targets: list | None = None, subject=None, chooser=None, restrict_to=None):
+        self.source = source
+        self.summoner = summoner
+        self.battlefield = battlefield
+        self.targets = list(targets) if targets is not None else []
+        self.last_target = subject
+        self.chooser = chooser
+        self.restrict_to = restrict_to
+
+    def choose(self, candidates: list):
+        """Use the next chosen target, or pick one of the candidates."""
+        if len(self.targets) != 0:
+            return [self.targets.pop(0)]
+        if len(candidates) == 0:
+            return []
+        if self.chooser is not None:
+            return [self.chooser(candidates)]
+        return [candidates[0]]
+
+    def friendly_creatures(self):
+        """Creatures controlled by the Summoner using the ability."""
+        if self.battlefield is None:
+            return []
+        return self.battlefield.creatures(self.summoner)
+
+    def enemy_creatures(self):
+        """Creatures controlled by the opposing Summoner."""
+        if self.battlefield is None:
+            return []
+        return self.battlefield.creatures(self.battlefield.opponent(self.summoner))
+
+    def enemy_summoner(self):
+        """The opposing Summoner."""
+        if self.battlefield is None:
+            return None
+        return self.battlefield.opponent(self.summoner)
+
+    def restrict(self, creatures: list):
+        """Filter candidates down to restrict_to, if it is set."""
+        if self.restrict_to is None:
+            return list(creatures)
+        return [item for item in creatures if item is self.restrict_to]
+
+    def resolve(self, target: Target):
+        """Return the list of objects an Effect with this Target applies to."""
+        if target == Target.SELF:
+            return [self.source]
+        elif target == Target.IT:
+            return [self.last_target] if self.last_target is not None else []
+        elif target == Target.FRIENDLY_SUMMONER:
+            return [self.summoner]
+        elif target == Target.ENEMY_SUMMONER:
+            enemy = self.enemy_summoner()
+            return [enemy] if enemy is not None else []
+        elif target == Target.ALL_FRIENDLY_CREATURES:
+            return self.restrict(self.friendly_creatures())
+        elif target == Target.ALL_OTHER_FRIENDLY_CREATURES:
+            return [item for item in self.restrict(self.friendly_creatures()) if item is not self.source]
+        elif target == Target.ALL_ENEMY_CREATURES:
+            return self.restrict(self.enemy_creatures())
+        elif target == Target.FRIENDLY_CREATURE:
+            return self.choose(self.restrict(self.friendly_creatures()))
+        elif target == Target.ENEMY_CREATURE:
+            return self.choose(self.restrict(self.enemy_creatures()))
+        elif target == Target.ANY_CREATURE:
+            return self.choose(self.restrict(self.friendly_creatures() + self.enemy_creatures()))
+        enemy = self.enemy_summoner()
+        return self.choose(self.restrict(([enemy] if enemy is not None else []) + self.enemy_creatures()))
+
+class Effect:
+    """A single compiled sentence of an ability."""
+    def __init__(self, target: Target | None = None, duration: Duration = Duration.PERMANENT, condition: Condition = Condition.ALWAYS):
+        self.target = target
+        self.duration = duration
+        self.condition = condition
+
+    def check_condition(self, context: AbilityContext):
+        """Check if the Effect's Condition is met by the previous target."""
+        if self.condition == Condition.ALWAYS:
+            return True
+        died = context.last_target is not None and (not getattr(context.last_target, 'alive', True) or context.last_target.fortitude <= 0)
+        if self.condition == Condition.IT_DIED:
+            return died
+        return not died
+
+    def __call__(self, context: AbilityContext):
+        if not self.check_condition(context):
+            return
+        targets = context.resolve(self.target) if self.target is not None else [None]
+        for item in targets:
+            self.apply(item, context)
+            if item is not None:
+                context.last_target = item
+
+    def apply(self, target, context: AbilityContext):
+        """Apply the Effect to one target."""
+        raise NotImplementedError
+
+class DealDamage(Effect):
+    """Deal damage to the target. Spells add the Summoner's spell damage."""
+    def __init__(self, amount: int, target: Target, duration: Duration = Duration.PERMANENT, condition: Condition = Condition.ALWAYS):
+        super().__init__(target, duration, condition)
+        self.amount = amount
+
+    def apply(self, target, context: AbilityContext):
+        amount = self.amount
+        if context.source.card_type in (CardType.FAST_SPELL, CardType.SLOW_SPELL):
+            amount += getattr(context.summoner, 'spell_damage', 0)
+        target.take_damage(amount)
+        if hasattr(target, 'check_alive'):
+            target.check_alive()
+
+class ModifyStats(Effect):
+    """Change the target's STR and FOR, until the end of the turn if the
+    duration is Duration.END_OF_TURN. Creatures with StatModifiers get the
+    change in the END_OF_TURN layer, or in the AURA layer if the source is
+    an aura, so it can be removed without touching other creatures."""
+    def __init__(self, strength: int, fortitude: int, target: Target, duration: Duration = Duration.PERMANENT, condition: Condition = Condition.ALWAYS):
+        super().__init__(target, duration, condition)
+        self.strength = strength
+        self.fortitude = fortitude
+
+    def apply(self, target, context: AbilityContext):
+        modifiers = getattr(target, 'modifiers', None)
+        if modifiers is not None:
+            if context.source.card_type == CardType.AURA:
+                modifiers.add(Layer.AURA, context.source, self.strength, self.fortitude)
+                if context.battlefield is not None:
+                    context.battlefield.aura_targets.setdefault(context.source, []).append(target)
+            elif self.duration == Duration.END_OF_TURN:
+                modifiers.add(Layer.END_OF_TURN, self, self.strength, self.fortitude)
+                if context.battlefield is not None:
+                    context.battlefield.end_of_turn_targets.add(target)
+            else:
+                modifiers.add(Layer.BASE, self, self.strength, self.fortitude)
+            return
+        target.strength += self.strength
+        target.fortitude += self.fortitude
+        if self.duration == Duration.END_OF_TURN and context.battlefield is not None:
+            context.battlefield.until_end_of_turn.append(lambda: self.revert(target))
+
+    def revert(self, target):
+        """Undo the change to the target's STR and FOR."""
+        target.strength -= self.strength
+        target.fortitude -= self.fortitude
+
+class Heal(Effect):
+    """Heal the target's FOR."""
+    def __init__(self, amount: int, target: Target, duration: Duration = Duration.PERMANENT, condition: Condition = Condition.ALWAYS):
+        super().__init__(target, duration, condition)
+        self.amount = amount
+
+    def apply(self, target, context: AbilityContext):
+        target.heal(self.amount)
+
+class DrawCards(Effect):
+    """Draw cards for the Summoner using the ability."""
+    def __init__(self, amount: int, duration: Duration = Duration.PERMANENT, condition: Condition = Condition.ALWAYS):
+        super().__init__(None, duration, condition)
+        self.amount = amount
+
+    def apply(self, target, context: AbilityContext):
+        for i in range(self.amount):
+            context.summoner.draw_card()
+
+class SpellDamage(Effect):
+    """Increase the Summoner's spell damage."""
+    def __init__(self, amount: int, duration: Duration = Duration.PERMANENT, condition: Condition = Condition.ALWAYS):
+        super().__init__(None, duration, condition)
+        self.amount = amount
+
+    def apply(self, target, context: AbilityContext):
+        summoner = context.summoner
+        summoner.spell_damage = getattr(summoner, 'spell_damage', 0) + self.amount
+        if self.duration == Duration.END_OF_TURN and context.battlefield is not None:
+            context.battlefield.until_end_of_turn.append(lambda: self.revert(summoner))
+
+    def revert(self, summoner):
+        """Undo the change to the Summoner's spell damage."""
+        summoner.spell_damage -= self.amount
+
+class Ability:
+    """Compiled ability: a Trigger and the Effects it runs in order."""
+    def __init__(self, text: str, trigger: Trigger, effects: tuple):
+        self.text = text
+        self.trigger = trigger
+        self.effects = effects
+
+    def __call__(self, context: AbilityContext):
+        for effect in self.effects:
+            effect(context)
+
+def parse_target(phrase: str, name: str | None):
+    """Return the Target for a target phrase."""
+    phrase = phrase.strip()
+    if name is not None and phrase == name.lower():
+        return Target.SELF
+    if phrase not in TARGET_PHRASES:
+        raise ValueError(f'Unknown ability target: {phrase!r}')
+    return TARGET_PHRASES[phrase]
+
+def parse_stats(phrase: str):
+    """Return the STR and FOR changes in a phrase like '+1 STR/+1 FOR'."""
+    strength = 0
+    fortitude = 0
+    for amount, stat in STAT_PATTERN.findall(phrase):
+        if stat == 'str':
+            strength += int(amount)
+        else:
+            fortitude += int(amount)
+    return strength, fortitude
+
+def parse_sentence(sentence: str, name: str | None):
+    """Compile one sentence of ability text into a Trigger and an Effect."""
+    trigger = None
+    condition = Condition.ALWAYS
+    duration = Duration.PERMANENT
+    if ',' in sentence:
+        prefix, rest = sentence.split(',', 1)
+        if prefix in TRIGGER_PHRASES:
+            trigger = TRIGGER_PHRASES[prefix]
+            sentence = rest.strip()
+        elif prefix in CONDITION_PHRASES:
+            condition = CONDITION_PHRASES[prefix]
+            sentence = rest.strip()
+    if sentence.endswith(DURATION_SUFFIX):
+        duration = Duration.END_OF_TURN
+        sentence = sentence[:-len(DURATION_SUFFIX)]
+    match = DAMAGE_PATTERN.fullmatch(sentence)
+    if match:
+        return trigger, DealDamage(int(match.group(1)), parse_target(match.group(2), name), duration, condition)
+    match = GIVE_PATTERN.fullmatch(sentence) or GAINS_PATTERN.fullmatch(sentence)
+    if match:
+        strength, fortitude = parse_stats(match.group(2))
+        return trigger, ModifyStats(strength, fortitude, parse_target(match.group(1), name), duration, condition)
+    match = HEAL_PATTERN.fullmatch(sentence)
+    if match:
+        return trigger, Heal(int(match.group(2)), parse_target(match.group(1), name), duration, condition)
+    match = DRAW_PATTERN.fullmatch(sentence)
+    if match:
+        amount = 1 if match.group(1) == 'a' else int(match.group(1))
+        return trigger, DrawCards(amount, duration, condition)
+    match = SPELL_DAMAGE_PATTERN.fullmatch(sentence)
+    if match:
+        return trigger, SpellDamage(int(match.group(1)), duration, condition)
+    raise ValueError(f'Unknown ability text: {sentence!r}')
+
+@lru_cache(maxsize=None)
+def compile_ability(text: str, name: str | None = None):
+    """Compile ability text into an Ability. The card name lets the text
+    refer to the card itself, e.g. 'Firebug gains +2 STR'. Raises ValueError
+    if the text can't be compiled."""
+    trigger = Trigger.ON_PLAY
+    effects = []
+    for sentence in text.lower().split('.'):
+        sentence = ' '.join(sentence.split())
+        if sentence == '':
+            continue
+        sentence_trigger, effect = parse_sentence(sentence, name)
+        if sentence_trigger is not None:
+            trigger = sentence_trigger
+        effects.append(effect)
+    return Ability(text, trigger, tuple(effects))
+
+def get_ability(card: Card):
+    """Return the compiled Ability of a Card, or None if it has none."""
+    if card.ability is None:
+        return None
+    return compile_ability(card.ability, card.name)
+
+def compile_cards(cards):
+    """Compile the abilities of many Cards ahead of time. Returns a
+    dictionary of card name to error message for every Card whose ability
+    can't be compiled."""
+    errors = {}
+    for item in cards:
+        try:
+            get_ability(item)
+        except ValueError as error:
+            errors[item.name] = str(error)
+    return errors
@@ -0,0 +1,92 @@
+"""Mana curves, card breakdowns and draw probabilities for Decks."""
+from functools import lru_cache
+from math import comb
+from deckbuild import Card, CardType, Deck
+
+@lru_cache(maxsize=None)
+def hypergeometric_at_least(deck_size: int, successes: int, draws: int, at_least: int = 1):
+    """Chance of drawing at least at_least of the successes cards when
+    drawing draws cards from a deck of deck_size cards."""
+    draws = min(draws, deck_size)
+    if at_least > min(draws, successes):
+        return 0.0
+    total = comb(deck_size, draws)
+    missed = 0
+    for k in range(at_least):
+        missed += comb(successes, k) * comb(deck_size - successes, draws - k)
+    return 1 - missed / total
+
+class DeckAnalytics:
+    """Statistics for a Deck. Summoner.mulligan draws an opening hand of 7
+    cards and Summoner.draw_phase draws one card every turn, including the
+    first."""
+    def __init__(self, deck: Deck, opening_hand: int = 7, draw_on_first_turn: bool = True):
+        self.deck = deck
+        self.opening_hand = opening_hand
+        self.draw_on_first_turn = draw_on_first_turn
+
+    def mana_curve(self):
+        """Return a dictionary of mana cost to number of cards, sorted by
+        mana cost."""
+        curve = {}
+        for item in self.deck.cards:
+            curve[item.mana_cost] = curve.get(item.mana_cost, 0) + 1
+        return dict(sorted(curve.items()))
+
+    def faction_breakdown(self):
+        """Return a dictionary of CardFaction to number of cards."""
+        breakdown = {}
+        for item in self.deck.cards:
+            breakdown[item.faction] = breakdown.get(item.faction, 0) + 1
+        return breakdown
+
+    def type_breakdown(self):
+        """Return a dictionary of CardType to number of cards."""
+        breakdown = {}
+        for item in self.deck.cards:
+            breakdown[item.card_type] = breakdown.get(item.card_type, 0) + 1
+        return breakdown
+
+    def average_mana_cost(self):
+        """Average mana cost of the non mana crystal cards in the Deck."""
+        costs = [item.mana_cost for item in self.deck.cards if item.card_type != CardType.MANA_CRYSTAL]
+        if len(costs) == 0:
+            return 0.0
+        return sum(costs) / len(costs)
+
+    def cards_seen(self, turn: int):
+        """Number of cards drawn by the given turn, counting the opening hand."""
+        if self.draw_on_first_turn:
+            return self.opening_hand + turn
+        return self.opening_hand + turn - 1
+
+    def count_matching(self, condition):
+        """Count the cards in the Deck for which condition(card) is True."""
+        return sum(1 for item in self.deck.cards if condition(item))
+
+    def probability_by_turn(self, condition, turn: int, at_least: int = 1):
+        """Chance of having drawn at least at_least cards matching
+        condition(card) by the given turn."""
+        successes = self.count_matching(condition)
+        return hypergeometric_at_least(len(self.deck), successes, self.cards_seen(turn), at_least)
+
+    def probability_of_card_by_turn(self, card: Card, turn: int, at_least: int = 1):
+        """Chance of having drawn at least at_least copies of a Card by the
+        given turn."""
+        successes = self.deck.card_counts.get(card.name, 0)
+        return hypergeometric_at_least(len(self.deck), successes, self.cards_seen(turn), at_least)
+
+    def curve_probabilities(self, card_type: CardType | None = CardType.CREATURE):
+        """Return a dictionary of mana cost to the chance of having drawn a
+        card of that cost (and card_type, if given) by the turn equal to
+        its cost, e.g. the chance of a 2-drop on turn 2."""
+        deck_size = len(self.deck)
+        counts = {}
+        for item in self.deck.cards:
+            if card_type is None or item.card_type == card_type:
+                counts[item.mana_cost] = counts.get(item.mana_cost, 0) + 1
+        probabilities = {}
+        for cost in sorted(counts):
+            turn = max(cost, 1)
+            probabilities[cost] = hypergeometric_at_least(deck_size, counts[cost], self.cards_seen(turn))
+        return probabilities
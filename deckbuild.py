@@ -90,24 +90,169 @@ class Card:
 
 class Deck:
     """Decks consist of between 40 and 60 cards before being playable.
-    Only 3 duplicates of each card can be in a playable deck."""
+    Only 3 duplicates of each card can be in a playable deck.
+    Deck.playable is kept current by the Deck methods and by setting
+    card_faction, card_min, card_max or copy_max, so Deck.cards is a
+    read-only tuple. Cards are shared between Decks, so after changing the
+    faction of a Card already in a Deck call Deck.recount()."""
     def __init__(self, name: str):
         self.name = name
-        self.cards = []
+        self.__cards = []
+        self.__cards_view = ()
         self.playable = False
-        self.card_max = 60
-        self.card_min = 40
-        self.card_faction = None
+        self.__card_max = 60
+        self.__card_min = 40
+        self.__copy_max = 3
+        self.__card_faction = None
+        self.card_counts = {}
+        self.over_copy_max = 0
+        self.off_faction = 0
+
+    def __len__(self):
+        return len(self.__cards)
+
+    @property
+    def cards(self):
+        """Cards in the Deck, in the order they were added."""
+        if self.__cards_view is None:
+            self.__cards_view = tuple(self.__cards)
+        return self.__cards_view
+
+    @property
+    def card_faction(self):
+        """CardFaction every Card must belong to, or None for any."""
+        return self.__card_faction
+
+    @card_faction.setter
+    def card_faction(self, faction: CardFaction | None):
+        self.set_card_faction(faction)
+
+    @property
+    def card_min(self):
+        """Fewest cards in a playable Deck."""
+        return self.__card_min
+
+    @card_min.setter
+    def card_min(self, card_min: int):
+        self.__card_min = card_min
+        self.update_playable()
+
+    @property
+    def card_max(self):
+        """Most cards in a playable Deck."""
+        return self.__card_max
+
+    @card_max.setter
+    def card_max(self, card_max: int):
+        self.__card_max = card_max
+        self.update_playable()
+
+    @property
+    def copy_max(self):
+        """Most copies of one card in a playable Deck."""
+        return self.__copy_max
+
+    @copy_max.setter
+    def copy_max(self, copy_max: int):
+        self.__copy_max = copy_max
+        self.recount()
+
+    def check_faction(self, card: Card):
+        """Check if a Card can be played in a Deck of Deck.card_faction.
+        CardFaction.NONE cards can be played in any Deck."""
+        return self.__card_faction is None or card.faction == CardFaction.NONE or card.faction == self.__card_faction
+
+    def set_card_faction(self, faction: CardFaction | None):
+        """Set the Deck.card_faction and recount the off-faction cards."""
+        self.__card_faction = faction
+        self.off_faction = 0
+        for item in self.__cards:
+            if not self.check_faction(item):
+                self.off_faction += 1
+        self.update_playable()
+
+    def recount(self):
+        """Rebuild the copy and faction counts from the cards."""
+        self.card_counts = {}
+        self.over_copy_max = 0
+        self.off_faction = 0
+        for item in self.__cards:
+            self.__count_card(item, 1)
+        self.update_playable()
+
+    def update_playable(self):
+        """Set Deck.playable from the running card, copy and faction counts."""
+        self.playable = self.__card_min <= len(self.__cards) <= self.__card_max and self.over_copy_max == 0 and self.off_faction == 0
+
+    def __count_card(self, card: Card, amount: int):
+        self.__cards_view = None
+        count = self.card_counts.get(card.name, 0)
+        if count > self.__copy_max:
+            self.over_copy_max -= 1
+        count += amount
+        if count > self.__copy_max:
+            self.over_copy_max += 1
+        if count == 0:
+            self.card_counts.pop(card.name, None)
+        else:
+            self.card_counts[card.name] = count
+        if not self.check_faction(card):
+            self.off_faction += amount
 
     def add_cards(self, *cards: Card):
         """Add multiple cards to the Deck."""
         for item in cards:
-            self.cards.append(item)
+            self.__cards.append(item)
+            self.__count_card(item, 1)
+        self.update_playable()
 
     def add_card(self, card: Card):
         """Add a Card to the Deck"""
-        self.cards.append(card)
+        self.__cards.append(card)
+        self.__count_card(card, 1)
+        self.update_playable()
 
     def remove_card(self, card: Card):
         """Remove a Card from the Deck"""
-        self.cards.remove(card)
+        self.__cards.remove(card)
+        self.__count_card(card, -1)
+        self.update_playable()
+
+class DeckValidator:
+    """Check many Decks against the deckbuilding rules at once, reporting
+    every rule a Deck breaks. Used for validating uploaded Decks in bulk."""
+    def __init__(self, card_min: int = 40, card_max: int = 60, copy_max: int = 3):
+        self.card_min = card_min
+        self.card_max = card_max
+        self.copy_max = copy_max
+
+    def validate_cards(self, cards: list, faction: CardFaction | None = None):
+        """Return a list of problems with a list of Cards. An empty list
+        means the Cards make a playable Deck."""
+        problems = []
+        size = len(cards)
+        if size < self.card_min:
+            problems.append(f'Deck has {size} cards, minimum is {self.card_min}.')
+        elif size > self.card_max:
+            problems.append(f'Deck has {size} cards, maximum is {self.card_max}.')
+        counts = {}
+        off_faction = set()
+        for item in cards:
+            counts[item.name] = counts.get(item.name, 0) + 1
+            if faction is not None and item.faction != faction and item.faction != CardFaction.NONE:
+                off_faction.add(item.name)
+        for name, count in counts.items():
+            if count > self.copy_max:
+                problems.append(f'{name} has {count} copies, maximum is {self.copy_max}.')
+        for name in sorted(off_faction):
+            problems.append(f'{name} is not a {faction.name} card.')
+        return problems
+
+    def validate(self, deck: Deck):
+        """Return a list of problems with a Deck."""
+        return self.validate_cards(deck.cards, deck.card_faction)
+
+    def validate_many(self, decks):
+        """Validate each Deck, returning a list of problems for every Deck in
+        the order given. A playable Deck has an empty list."""
+        return [self.validate_cards(deck.cards, deck.card_faction) for deck in decks]
@@ -0,0 +1,195 @@
+"""Genetic search for strong, playable Decks from a pool of Cards."""
+import json
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from deckbuild import CardFaction, Deck, DeckValidator
+from profiling import profiled_call, write_collapsed
+from simulation import win_rate
+
+def deck_fingerprint(cards: list):
+    """Order-independent key for a list of Cards, used to avoid simulating
+    the same list twice."""
+    return '|'.join(sorted(item.name for item in cards))
+
+def evaluate_fitness(cards: list, gauntlet: list, games: int, seed: int):
+    """Fitness of a list of Cards: its win rate against the gauntlet."""
+    return win_rate(cards, gauntlet, games, seed)
+
+class DeckOptimizer:
+    """Evolve playable Decks from a card pool. Each generation the fittest
+    Decks are kept, and the rest of the population is refilled by
+    recombining and mutating them. Fitness is the win rate in simulated
+    matches against the gauntlet Decks, played in a process pool and cached
+    by Deck fingerprint. The population is saved to checkpoint_path after
+    every generation when it is given. If profile is 'cprofile' or
+    'sample', every simulation is profiled, in the workers too, and run()
+    writes the collapsed stacks to profile_path."""
+    def __init__(self, card_pool: list, gauntlet: list, faction: CardFaction | None = None,
+                 population_size: int = 24, deck_size: int = 40, games: int = 10,
+                 mutation_rate: float = 0.1, elite: int = 4, workers: int | None = None,
+                 checkpoint_path: str | None = None, seed: int | None = None,
+                 profile: str | None = None, profile_path: str = 'deckoptimizer.folded'):
+        self.validator = DeckValidator()
+        self.faction = faction
+        self.card_pool = [item for item in card_pool if faction is None or item.faction in (faction, CardFaction.NONE)]
+        self.cards_by_name = {item.name: item for item in self.card_pool}
+        if len(self.cards_by_name) * self.validator.copy_max < self.validator.card_min:
+            raise ValueError('Card pool is too small to build a playable Deck.')
+        self.gauntlet = [deck.cards for deck in gauntlet]
+        self.population_size = population_size
+        self.deck_size = max(self.validator.card_min, min(deck_size, self.validator.card_max, len(self.cards_by_name) * self.validator.copy_max))
+        self.games = games
+        self.mutation_rate = mutation_rate
+        self.elite = elite
+        self.workers = workers
+        self.checkpoint_path = checkpoint_path
+        self.rng = random.Random(seed)
+        self.seed = self.rng.randrange(2**32)
+        self.generation = 0
+        self.population = []
+        self.best = None
+        self.executor = None
+        self.fitness_cache = {}
+        self.profile = profile
+        self.profile_path = profile_path
+        self.profile_stacks = Counter()
+
+    def random_cards(self):
+        """Build a random playable list of Cards from the card pool."""
+        names = list(self.cards_by_name) * self.validator.copy_max
+        return [self.cards_by_name[name] for name in self.rng.sample(names, self.deck_size)]
+
+    def repair(self, cards: list):
+        """Trim copies over the copy limit and fill the list back up to
+        the Deck size with random Cards that are under the limit."""
+        counts = {}
+        repaired = []
+        for item in cards:
+            if counts.get(item.name, 0) < self.validator.copy_max and len(repaired) < self.deck_size:
+                counts[item.name] = counts.get(item.name, 0) + 1
+                repaired.append(item)
+        while len(repaired) < self.deck_size:
+            name = self.rng.choice(list(self.cards_by_name))
+            if counts.get(name, 0) < self.validator.copy_max:
+                counts[name] = counts.get(name, 0) + 1
+                repaired.append(self.cards_by_name[name])
+        return repaired
+
+    def crossover(self, parent1: list, parent2: list):
+        """Combine two parents by drawing Cards from both of their lists."""
+        combined = parent1 + parent2
+        self.rng.shuffle(combined)
+        return self.repair(combined)
+
+    def mutate(self, cards: list):
+        """Swap out each Card for a random Card from the pool with a chance
+        of mutation_rate."""
+        mutated = [item if self.rng.random() >= self.mutation_rate else self.rng.choice(self.card_pool) for item in cards]
+        return self.repair(mutated)
+
+    def evaluate(self, population: list):
+        """Return the fitness of each list of Cards in the population,
+        simulating only the lists that are not already cached."""
+        pending = {}
+        for cards in population:
+            key = deck_fingerprint(cards)
+            if key not in self.fitness_cache and key not in pending:
+                pending[key] = cards
+        if len(pending) != 0:
+            keys = list(pending)
+            args = ([pending[key] for key in keys], [self.gauntlet] * len(keys), [self.games] * len(keys), [self.seed] * len(keys))
+            function = evaluate_fitness if self.profile is None else partial(profiled_call, self.profile, evaluate_fitness)
+            chunksize = max(1, len(keys) // 32)
+            if self.workers == 0:
+                results = map(function, *args)
+            elif self.executor is not None:
+                results = self.executor.map(function, *args, chunksize=chunksize)
+            else:
+                with ProcessPoolExecutor(self.workers) as executor:
+                    results = list(executor.map(function, *args, chunksize=chunksize))
+            for key, fitness in zip(keys, results):
+                if self.profile is not None:
+                    fitness, stacks = fitness
+                    self.profile_stacks.update(stacks)
+                self.fitness_cache[key] = fitness
+        return [self.fitness_cache[deck_fingerprint(cards)] for cards in population]
+
+    def step(self):
+        """Run one generation and return the best list of Cards and its
+        fitness. They are kept in DeckOptimizer.best."""
+        if len(self.population) == 0:
+            self.population = [self.random_cards() for i in range(self.population_size)]
+        fitness = self.evaluate(self.population)
+        ranked = [cards for score, cards in sorted(zip(fitness, self.population), key=lambda item: item[0], reverse=True)]
+        self.best = (ranked[0], max(fitness))
+        parents = ranked[:max(2, self.population_size // 2)]
+        next_population = ranked[:self.elite]
+        while len(next_population) < self.population_size:
+            parent1, parent2 = self.rng.sample(parents, 2)
+            next_population.append(self.mutate(self.crossover(parent1, parent2)))
+        self.population = next_population
+        self.generation += 1
+        if self.checkpoint_path is not None:
+            self.save_checkpoint(self.checkpoint_path)
+        return self.best
+
+    def run(self, generations: int):
+        """Run several generations and return the best playable Deck found.
+        One process pool is shared by every generation."""
+        if self.workers == 0:
+            for i in range(generations):
+                self.step()
+        else:
+            with ProcessPoolExecutor(self.workers) as executor:
+                self.executor = executor
+                try:
+                    for i in range(generations):
+                        self.step()
+                finally:
+                    self.executor = None
+        if self.profile is not None:
+            write_collapsed(self.profile_path, self.profile_stacks)
+        return self.best_deck()
+
+    def best_deck(self, name: str = 'Optimized Deck'):
+        """Build a Deck from the fittest list of Cards of the last
+        generation. Before the first step, the population is evaluated."""
+        if self.best is not None:
+            cards = self.best[0]
+        else:
+            fitness = self.evaluate(self.population)
+            cards = max(zip(fitness, self.population), key=lambda item: item[0])[1]
+        deck = Deck(name)
+        deck.set_card_faction(self.faction)
+        deck.add_cards(*cards)
+        return deck
+
+    def save_checkpoint(self, path: str):
+        """Write the generation, population and fitness cache to a JSON
+        file. The file is replaced atomically."""
+        data = {
+            'generation': self.generation,
+            'seed': self.seed,
+            'population': [[item.name for item in cards] for cards in self.population],
+            'fitness': self.fitness_cache,
+            'rng_state': self.rng.getstate()
+        }
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file)
+        os.replace(temp_path, path)
+
+    def load_checkpoint(self, path: str):
+        """Resume from a checkpoint written by save_checkpoint. Every card
+        name in the checkpoint must be in the card pool."""
+        with open(path, encoding='utf-8') as file:
+            data = json.load(file)
+        self.generation = data['generation']
+        self.seed = data['seed']
+        self.population = [[self.cards_by_name[name] for name in names] for names in data['population']]
+        self.fitness_cache.update(data['fitness'])
+        state = data['rng_state']
+        self.rng.setstate((state[0], tuple(state[1]), state[2]))
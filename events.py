@@ -0,0 +1,67 @@
+"""Event dispatch for the Battlefield. Listeners subscribe to an EventType
+for a specific source (a Summoner or a card) or for every source, and are
+indexed by both, so dispatching an event only calls the listeners that
+asked for it."""
+from enum import Enum
+
+class EventType(Enum):
+    """Things that happen on the Battlefield."""
+    CARD_PLAYED = 0
+    SPELL_CAST = 1
+    ATTACK_DECLARED = 2
+    CREATURE_DIED = 3
+    TURN_STARTED = 4
+    TURN_ENDED = 5
+
+class Event:
+    """Event passed to listeners. summoner is the Summoner the event
+    happened to and subject is the card it happened to, if any."""
+    __slots__ = ('event_type', 'summoner', 'subject')
+
+    def __init__(self, event_type: EventType, summoner=None, subject=None):
+        self.event_type = event_type
+        self.summoner = summoner
+        self.subject = subject
+
+class EventDispatcher:
+    """Index of listeners by (EventType, source). A source of None listens to
+    the EventType from every source."""
+    def __init__(self):
+        self.listeners = {}
+        self.owned = {}
+
+    def subscribe(self, event_type: EventType, listener, source=None, owner=None):
+        """Call listener(event) for every event_type event from source. If
+        owner is given, the subscription is removed by unsubscribe_owner."""
+        key = (event_type, source)
+        self.listeners.setdefault(key, []).append(listener)
+        if owner is not None:
+            self.owned.setdefault(owner, []).append((key, listener))
+
+    def unsubscribe(self, event_type: EventType, listener, source=None):
+        """Remove a listener."""
+        key = (event_type, source)
+        listeners = self.listeners.get(key)
+        if listeners is not None and listener in listeners:
+            listeners.remove(listener)
+            if len(listeners) == 0:
+                self.listeners.pop(key)
+
+    def unsubscribe_owner(self, owner):
+        """Remove every listener subscribed with this owner."""
+        for key, listener in self.owned.pop(owner, []):
+            self.unsubscribe(key[0], listener, key[1])
+
+    def dispatch(self, event_type: EventType, summoner=None, subject=None):
+        """Send an event to the listeners for every source, for the Summoner
+        and for the subject."""
+        found = self.listeners.get((event_type, None), ())
+        if summoner is not None and (event_type, summoner) in self.listeners:
+            found = tuple(found) + tuple(self.listeners[(event_type, summoner)])
+        if subject is not None and (event_type, subject) in self.listeners:
+            found = tuple(found) + tuple(self.listeners[(event_type, subject)])
+        if len(found) == 0:
+            return
+        event = Event(event_type, summoner, subject)
+        for listener in tuple(found):
+            listener(event)
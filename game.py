@@ -1,34 +1,322 @@
+"""Graphical client for the card games. Game logic advances in fixed steps
+that are separate from rendering: each step updates the view from a
+snapshot of the game, while every frame only advances animations and
+repaints the rectangles that changed.
+
+    python game.py            hold'em demo table
+    python game.py summoner   Summoner demo match
+
+Games can also be rendered without a display for review. export_frames
+replays a list of snapshots offscreen with SDL's dummy video driver, as
+fast as frames can be drawn and saved, and writes a numbered PNG sequence
+that encoders read directly:
+
+    python game.py export holdem 200 7     200 steps of hold'em, seed 7
+    python game.py replay output/game.json  a recording from write_recording
+    ffmpeg -framerate 30 -i output/holdem/frame_%05d.png holdem.mp4"""
+import json
+import os
+import shutil
+import sys
 import pygame
+from deckbuild import Card, CardFaction, CardRarity, CardTribe, CardType
+from holdem.betting import Action, BettingRound, Street
+from holdem.deals import deal_hands
+from holdem.evaluator import evaluate
+from profiling import Profiler, write_collapsed
+from render import DirtyRenderer, build_holdem_atlas
+from rng import GameRandom
+from simulation import SimSummoner
+from views import BattlefieldView, HoldemView, holdem_state, match_state, summoner_atlas
+
+SCREEN_SIZE = (800, 480)
+FPS = 60
+EXPORT_FPS = 30
+OUTPUT_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'output')
+STEP_SECONDS = 0.6
+BOARD_SIZES = {Street.PREFLOP: 0, Street.FLOP: 3, Street.TURN: 4, Street.RIVER: 5, Street.SHOWDOWN: 5}
+
+class HoldemDemo:
+    """Hands of hold'em between computer players who mostly check and call.
+    Every step is one action, one street or the end of a hand."""
+    def __init__(self, names: list, stack: int = 1000, big_blind: int = 20, rng: GameRandom | None = None):
+        self.names = names
+        self.stacks = [stack] * len(names)
+        self.big_blind = big_blind
+        self.rng = rng if rng is not None else GameRandom()
+        self.button = len(names) - 1
+        self.won = None
+        self.start_hand()
+
+    def start_hand(self):
+        """Move the button, post the blinds and deal."""
+        self.button = (self.button + 1) % len(self.names)
+        for seat in range(len(self.stacks)):
+            if self.stacks[seat] == 0:
+                self.stacks[seat] = self.big_blind * 50
+        small, big = (self.button + 1) % len(self.names), (self.button + 2) % len(self.names)
+        self.betting = BettingRound(self.stacks, self.big_blind, self.button, {small: self.big_blind // 2, big: self.big_blind},
+                                    (self.button + 3) % len(self.names))
+        self.holes, self.deal_board = next(deal_hands(1, len(self.names), self.rng))
+        self.won = None
+
+    def choose(self):
+        """Action and amount for the acting seat."""
+        betting = self.betting
+        roll = self.rng.random_float()
+        if roll < 0.15 and betting.is_legal(Action.RAISE, betting.min_raise_to()):
+            return Action.RAISE, betting.min_raise_to()
+        if roll < 0.15 and betting.is_legal(Action.BET, betting.min_raise_to()):
+            return Action.BET, betting.min_raise_to()
+        if roll > 0.9 and betting.to_call() > 0:
+            return Action.FOLD, 0
+        if betting.is_legal(Action.CHECK):
+            return Action.CHECK, 0
+        return Action.CALL, 0
+
+    def step(self):
+        """Take the next action, deal the next street or settle the hand."""
+        betting = self.betting
+        if self.won is not None:
+            self.stacks = list(betting.stacks)
+            self.start_hand()
+        elif not betting.round_complete():
+            betting.act(*self.choose())
+        elif not betting.hand_over():
+            betting.next_street()
+        else:
+            board = self.board()
+            scores = {seat: evaluate(self.holes[seat] + board) for seat in betting.in_hand()}
+            self.won = betting.payouts(scores)
+            for seat, amount in enumerate(self.won):
+                betting.stacks[seat] += amount
+            betting.street_bets = [0] * betting.seats
+            betting.pot = 0
+
+    def board(self):
+        """Board cards dealt so far."""
+        return self.deal_board[:BOARD_SIZES[self.betting.street]]
+
+    def state(self):
+        """Snapshot for the view."""
+        showdown = self.won is not None and self.betting.live > 1
+        return holdem_state(self.names, self.betting, self.holes, self.board(), self.button, showdown, self.won)
+
+def demo_cards():
+    """Small Summoner card pool for the demo match."""
+    creatures = [
+        ('Firefly', CardFaction.FIRE, 1, 2, 1), ('Firebug', CardFaction.FIRE, 1, 1, 1),
+        ('Ember Hound', CardFaction.FIRE, 2, 3, 2), ('Cinder Giant', CardFaction.FIRE, 5, 6, 5),
+        ('Squire', CardFaction.BLADE, 1, 1, 2), ('Knight Errant', CardFaction.BLADE, 3, 3, 3),
+        ('Frost Wisp', CardFaction.ICE, 2, 1, 4), ('Glacier Troll', CardFaction.ICE, 4, 4, 6)
+    ]
+    cards = [Card(name, faction, CardTribe.NONE, mana, None, CardType.CREATURE, CardRarity.COMMON, strength, fortitude)
+             for name, faction, mana, strength, fortitude in creatures]
+    crystal = Card('Mana Crystal', CardFaction.NONE, CardTribe.NONE, 0, None, CardType.MANA_CRYSTAL, CardRarity.COMMON)
+    return cards * 3 + [crystal] * 16
+
+class SummonerDemo:
+    """Simulated Summoner match between two copies of the demo cards. Every
+    step is one Summoner's turn."""
+    def __init__(self, names: list = ['North', 'South'], rng: GameRandom | None = None, max_turns: int = 60):
+        self.names = names
+        self.rng = rng if rng is not None else GameRandom()
+        self.max_turns = max_turns
+        self.start_match()
+
+    def start_match(self):
+        """Shuffle and draw opening hands."""
+        self.summoners = [SimSummoner(demo_cards(), self.rng), SimSummoner(demo_cards(), self.rng)]
+        self.turn = 0
+        self.result = None
+
+    def step(self):
+        """Take the next turn, or start a new match once one is decided."""
+        if self.result is not None:
+            self.start_match()
+            return
+        active = self.summoners[self.turn % 2]
+        opponent = self.summoners[1 - self.turn % 2]
+        active.take_turn(opponent)
+        self.turn += 1
+        if opponent.fortitude <= 0:
+            self.result = 1 if active is self.summoners[0] else 2
+        elif self.turn >= 2 * self.max_turns:
+            self.result = 0
+
+    def state(self):
+        """Snapshot for the view."""
+        return match_state(self.names, self.summoners, self.turn, self.result)
+
+def table_background(size: tuple, color: str):
+    """Background surface with a felt-colored oval."""
+    background = pygame.Surface(size)
+    background.fill('black')
+    pygame.draw.ellipse(background, color, background.get_rect().inflate(-40, -40))
+    return background
+
+def create_view(mode: str, seats: int, size: tuple = SCREEN_SIZE):
+    """Renderer and view for 'holdem' or 'summoner'. Needs pygame and its
+    display to be initialized."""
+    font = pygame.font.Font(None, 20)
+    if mode == 'holdem':
+        renderer = DirtyRenderer(table_background(size, 'darkgreen'), build_holdem_atlas(font).convert())
+        view = HoldemView(renderer, font, seats)
+    elif mode == 'summoner':
+        renderer = DirtyRenderer(table_background(size, 'darkslategray'), summoner_atlas())
+        view = BattlefieldView(renderer, font)
+    else:
+        raise ValueError(f'Unknown client mode: {mode}')
+    return renderer, view
+
+def create_game(mode: str, rng: GameRandom | None = None):
+    """Demo game driver for 'holdem' or 'summoner'."""
+    if mode == 'holdem':
+        return HoldemDemo(['You', 'Ada', 'Ben', 'Cy'], rng=rng)
+    if mode == 'summoner':
+        return SummonerDemo(rng=rng)
+    raise ValueError(f'Unknown client mode: {mode}')
+
+def create_client(mode: str, size: tuple = SCREEN_SIZE, rng: GameRandom | None = None):
+    """Game driver, renderer and view for 'holdem' or 'summoner'. Needs
+    pygame and its display to be initialized."""
+    game = create_game(mode, rng)
+    renderer, view = create_view(mode, len(game.names), size)
+    view.update(game.state())
+    return game, renderer, view
+
+def record(mode: str, steps: int, seed: int | None = None, profile: str | None = None, profile_path: str = 'game.folded'):
+    """Play a demo game without rendering it. Returns the seed and the
+    snapshots before the first step and after every step. If profile is
+    'cprofile' or 'sample', the game is profiled and the collapsed stacks are
+    written to profile_path."""
+    rng = GameRandom(seed)
+    profiler = Profiler(profile) if profile is not None else None
+    if profiler is not None:
+        profiler.start()
+    try:
+        game = create_game(mode, rng)
+        states = [game.state()]
+        for i in range(steps):
+            game.step()
+            states.append(game.state())
+    finally:
+        if profiler is not None:
+            write_collapsed(profile_path, profiler.stop())
+    return rng.seed, states
+
+def write_recording(path: str, mode: str, seed: int, states: list):
+    """Save snapshots to a JSON file."""
+    with open(path, 'w') as file:
+        json.dump({'mode': mode, 'seed': seed, 'states': states}, file)
+
+def read_recording(path: str):
+    """Load a recording saved by write_recording. Returns the mode and the
+    snapshots."""
+    with open(path) as file:
+        recording = json.load(file)
+    return recording['mode'], recording['states']
+
+def export_frames(mode: str, states: list, directory: str, fps: int = EXPORT_FPS, step_seconds: float = STEP_SECONDS, size: tuple = SCREEN_SIZE):
+    """Render snapshots offscreen as frame_00000.png, frame_00001.png, ... in
+    a directory, one snapshot every step_seconds of video at fps frames per
+    second. Frames are drawn as fast as possible instead of at the client's
+    frame rate. A frame where nothing was repainted is a copy of the last
+    file rather than a new PNG. The dummy video driver is used even if
+    another one is set or a window is open; any open display is closed.
+    Returns the number of frames written."""
+    driver = os.environ.get('SDL_VIDEODRIVER')
+    pygame.display.quit()
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    try:
+        pygame.display.init()
+        pygame.font.init()
+        pygame.display.set_mode(size)
+        os.makedirs(directory, exist_ok=True)
+        seats = len(states[0]['names']) if mode == 'holdem' else 2
+        renderer, view = create_view(mode, seats, size)
+        frame = pygame.Surface(size)
+        dt = 1 / fps
+        index = 0
+        since_step = 0
+        frames = 0
+        previous = None
+        view.update(states[0])
+        while index < len(states) - 1 or since_step < step_seconds:
+            path = os.path.join(directory, f'frame_{frames:05d}.png')
+            if len(renderer.draw(frame)) != 0 or previous is None:
+                pygame.image.save(frame, path)
+            else:
+                shutil.copyfile(previous, path)
+            previous = path
+            frames += 1
+            since_step += dt
+            while since_step >= step_seconds and index < len(states) - 1:
+                since_step -= step_seconds
+                index += 1
+                view.update(states[index])
+            view.animate(dt)
+    finally:
+        pygame.display.quit()
+        if driver is None:
+            os.environ.pop('SDL_VIDEODRIVER', None)
+        else:
+            os.environ['SDL_VIDEODRIVER'] = driver
+    return frames
+
+def main(mode: str = 'holdem'):
+    """Run the client until the window is closed."""
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+    pygame.display.set_caption('Card Game Prototype')
+    clock = pygame.time.Clock()
+    game, renderer, view = create_client(mode)
+    running = True
+    dt = 0
+    since_step = 0
 
-pygame.init()
-screen = pygame.display.set_mode((600,400))
-clock = pygame.time.Clock()
-running = True
-dt = 0
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                running = False
 
-player_pos = pygame.Vector2(screen.get_width()/2, screen.get_height()/2)
+        since_step += dt
+        while since_step >= STEP_SECONDS:
+            since_step -= STEP_SECONDS
+            game.step()
+            view.update(game.state())
 
-while running:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-    
-    screen.fill('black')
+        view.animate(dt)
+        pygame.display.update(renderer.draw(screen))
 
-    pygame.draw.circle(screen, 'red', player_pos, 30)
+        dt = clock.tick(FPS) / 1000
 
-    keys = pygame.key.get_pressed()
-    if keys[pygame.K_w]:
-        player_pos.y -= 300 * dt
-    if keys[pygame.K_s]:
-        player_pos.y += 300 * dt
-    if keys[pygame.K_a]:
-        player_pos.x -= 300 * dt
-    if keys[pygame.K_d]:
-        player_pos.x += 300 * dt
+    pygame.quit()
 
-    pygame.display.flip()
+def export_main(arguments: list):
+    """Record a demo game and export its frames to output/<mode>/."""
+    mode = arguments[0] if len(arguments) > 0 else 'holdem'
+    steps = int(arguments[1]) if len(arguments) > 1 else 100
+    seed = int(arguments[2]) if len(arguments) > 2 else None
+    seed, states = record(mode, steps, seed)
+    os.makedirs(OUTPUT_DIRECTORY, exist_ok=True)
+    write_recording(os.path.join(OUTPUT_DIRECTORY, f'{mode}.json'), mode, seed, states)
+    frames = export_frames(mode, states, os.path.join(OUTPUT_DIRECTORY, mode))
+    print(f'Wrote {frames} frames of {mode} (seed {seed}) to {os.path.join(OUTPUT_DIRECTORY, mode)}')
 
-    dt = clock.tick(60) / 1000
+def replay_main(path: str):
+    """Export the frames of a saved recording next to it."""
+    mode, states = read_recording(path)
+    directory = os.path.splitext(path)[0]
+    frames = export_frames(mode, states, directory)
+    print(f'Wrote {frames} frames of {mode} to {directory}')
 
-pygame.quit()
\ No newline at end of file
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == 'export':
+        export_main(sys.argv[2:])
+    elif len(sys.argv) > 2 and sys.argv[1] == 'replay':
+        replay_main(sys.argv[2])
+    else:
+        main(sys.argv[1] if len(sys.argv) > 1 else 'holdem')
@@ -1,5 +1,11 @@
 from deckbuild import Card, CardType, CardFaction, Deck
-import random
+from abilities import AbilityContext, Trigger, get_ability
+from events import EventDispatcher, EventType
+from modifiers import Layer, StatModifiers
+from spellstack import SpellStack
+from hand import Hand
+from rng import GameRandom
+from instrumentation import instruments
 from enum import Enum
 
 class Battlefield:
@@ -21,6 +27,11 @@ class Battlefield:
         self.s2_mc = []
         self.summoner1 = summoner1
         self.summoner2 = summoner2
+        self.until_end_of_turn = []
+        self.end_of_turn_targets = set()
+        self.aura_targets = {}
+        self.events = EventDispatcher()
+        self.stack = SpellStack(self)
 
     def move_card(self, card, curr_pos: list, new_pos: list):
         """Remove card from one list and add it to another."""
@@ -46,6 +57,7 @@ class Battlefield:
     def check_summoner_move(self, card, summoner, list1a: list, list1b: list, list2a: list, list2b: list):
         """Check if target summoner is 1 or 2 and then moves the card 
         to the appropriate list."""
+        instruments.count('gameplay.graveyard_moves')
         if self.summoner1 == summoner:
             self.move_card(card, list1a, list1b)
         elif self.summoner2 == summoner:
@@ -59,6 +71,7 @@ class Battlefield:
         """Moves the target card to the target summoner's graveyard 
         dlist from the traps list."""
         self.check_summoner_move(card, summoner, self.s1_traps, self.s1_graveyard, self.s2_traps, self.s2_graveyard)
+        self.events.unsubscribe_owner(card)
 
     def set_aura(self, card, summoner):
         """Appends the target card to the target summoner's aura list."""
@@ -68,6 +81,10 @@ class Battlefield:
         """Moves the target card to the target summoner's graveyard list 
         from the aura list."""
         self.check_summoner_move(card, summoner, self.s1_aura, self.s1_graveyard, self.s2_aura, self.s2_graveyard)
+        self.events.unsubscribe_owner(card)
+        for item in self.aura_targets.pop(card, []):
+            item.modifiers.remove(Layer.AURA, card)
+            item.check_alive()
 
     def set_mc(self, card, summoner):
         """Appends the target card to the target summoner's mana crystal 
@@ -83,11 +100,62 @@ class Battlefield:
         """Moves the target active card from the active list to the 
         graveyard list."""
         self.check_summoner_move(card, summoner, self.s1_active, self.s1_graveyard, self.s2_active, self.s2_graveyard)
+        self.events.unsubscribe_owner(card)
 
     def set_active(self, card, summoner):
         """Appends the target card to the target summoner's active list."""
         self.check_summoner_set(card, summoner, self.s1_active, self.s2_active)
 
+    def opponent(self, summoner):
+        """Return the Summoner opposing the target summoner."""
+        if self.summoner1 == summoner:
+            return self.summoner2
+        return self.summoner1
+
+    def creatures(self, summoner):
+        """Return the creatures the target summoner has in play."""
+        if self.summoner1 == summoner:
+            cards = self.s1_active + self.s1_inactive
+        else:
+            cards = self.s2_active + self.s2_inactive
+        return [item for item in cards if item.card_type == CardType.CREATURE]
+
+    def end_turn(self, summoner=None):
+        """Undo every effect that lasts until the end of the turn. If the
+        summoner whose turn is ending is given, dispatch TURN_ENDED first."""
+        with instruments.timer('gameplay.end_turn'):
+            if summoner is not None:
+                self.events.dispatch(EventType.TURN_ENDED, summoner)
+            for revert in self.until_end_of_turn:
+                revert()
+            self.until_end_of_turn = []
+            targets = self.end_of_turn_targets
+            self.end_of_turn_targets = set()
+            for item in targets:
+                item.modifiers.clear(Layer.END_OF_TURN)
+                item.check_alive()
+
+    def resolve_spell(self, card, summoner, targets: list | None = None):
+        """Play a spell from the stack, use its ability and send it to the
+        graveyard."""
+        spell = PlayedCard(self, summoner, card)
+        spell.use_ability(targets)
+        spell.send_to_graveyard()
+
+    def auras(self, summoner):
+        """Return the auras the target summoner has in play."""
+        if self.summoner1 == summoner:
+            return self.s1_aura
+        return self.s2_aura
+
+    def apply_auras(self, creature):
+        """Apply the auras of a creature's summoner to a creature entering
+        play."""
+        for aura in self.auras(creature.summoner):
+            ability = get_ability(aura)
+            if ability is not None and ability.trigger == Trigger.ON_PLAY:
+                ability(AbilityContext(aura, aura.summoner, self, restrict_to=creature))
+
 class Phase(Enum):
     """Turn Phases"""
     NONE = 0
@@ -99,9 +167,12 @@ class Phase(Enum):
     END = 6
 
 class Summoner:
-    """Player character."""
-    def __init__(self, deck: Deck, faction: CardFaction, battlefield: Battlefield | None = None):
+    """Player character. The Summoner plays from a library copied from
+    their Deck, so drawing doesn't change the Deck. The library is shuffled
+    with rng, so a seeded Summoner always draws the same cards."""
+    def __init__(self, deck: Deck, faction: CardFaction, battlefield: Battlefield | None = None, rng: GameRandom | None = None):
         self.deck = deck
+        self.rng = rng if rng is not None else GameRandom()
         self.faction = faction
         self.battlefield = battlefield
         self.win = False
@@ -110,10 +181,17 @@ class Summoner:
         self.fortitude = 40
         self.max_fortitude = 40
         self.mana = 0
-        self.deck_size = len(self.deck.cards)
-        self.hand_size = 0
+        self.spell_damage = 0
+        self.deck_size = len(self.deck)
+        self.library = list(self.deck.cards)
         self.max_hand_size = 10
-        self.hand = []
+        self.hand = Hand()
+        self.responses = self.hand.responses
+
+    @property
+    def hand_size(self):
+        """Number of cards in the hand."""
+        return len(self.hand)
 
     def set_battlefield(self, battlefield: Battlefield):
         """Set the battlefield the Summoner is a member of."""
@@ -123,20 +201,27 @@ class Summoner:
         """Move a Card from the hand to another list."""
         curr_pos.remove(card)
         new_pos.append(card)
-        if curr_pos == self.hand:
-            self.set_hand_numbers()
 
-    def discard_card(self, hand_number: int):
+    def remove_from_hand(self, card: Card):
+        """Remove a Card from the hand without moving it anywhere else."""
+        self.hand.remove(card)
+
+    def discard_card(self, hand_number: int | str):
         """Discard a Card from the hand to the appropriate graveyard."""
-        for item in self.hand:
-            if item.hand_number == hand_number:
-                if self.battlefield.summoner1 == self:
-                    self.move_card(item, self.hand, self.battlefield.s1_graveyard)
-                    print('Summoner 1 discarded', item.name)
-                elif self.battlefield.summoner2 == self:
-                    self.move_card(item, self.hand, self.battlefield.s2_graveyard)
-                    print('Summoner 2 discarded', item.name)
-        self.set_hand_numbers()
+        if isinstance(hand_number, str):
+            if not hand_number.strip().isdigit():
+                return
+            hand_number = int(hand_number)
+        item = self.hand.remove_number(hand_number)
+        if item is None:
+            return
+        instruments.count('gameplay.graveyard_moves')
+        if self.battlefield.summoner1 == self:
+            self.battlefield.s1_graveyard.append(item)
+            print('Summoner 1 discarded', item.name)
+        elif self.battlefield.summoner2 == self:
+            self.battlefield.s2_graveyard.append(item)
+            print('Summoner 2 discarded', item.name)
 
     def check_hand_size(self):
         """While your hand size is greater than 10, discard cards until you 
@@ -148,7 +233,7 @@ class Summoner:
 
     def shuffle(self):
         """Shuffle the summoner's deck."""
-        random.shuffle(self.deck.cards)
+        self.rng.shuffle(self.library)
 
     def draw_phase(self):
         """Actions for the DRAW Phase of the turn."""
@@ -158,24 +243,21 @@ class Summoner:
             self.phase = Phase.CAST
 
     def draw_card(self):
-        """Move a card from the deck.cards to hand."""
-        if len(self.deck.cards) != 0:
-            self.hand.append(self.deck.cards.pop(-1))
-            self.set_hand_numbers()
+        """Move the top card of the library to the hand."""
+        if len(self.library) != 0:
+            self.hand.append(self.library.pop())
 
     def mulligan(self, cards=7):
         """Draw 7 cards and return a card to the deck to shuffle and draw a 
         different card."""
         for i in range(cards):
             self.draw_card()
-            self.hand[i].hand_number = i
         self.display_hand()
 
     def play_card(self, card, battlefield: Battlefield):
         """Remove card from hand and play on active zone of the Battlefield."""
-        self.hand.remove(card)
-        battlefield.set_active(card)
-        self.set_hand_numbers()
+        self.remove_from_hand(card)
+        battlefield.set_active(card, self)
 
     def heal(self, heal: int):
         """Heal Summoner's fortitude by specified amount, but not greater than the 
@@ -186,13 +268,26 @@ class Summoner:
             self.fortitude += heal
 
     def start_turn(self):
-        """Start turn"""
+        """Start turn. If the opponent hasn't ended their turn yet, end it
+        first."""
+        opponent = self.battlefield.opponent(self)
+        if opponent.turn and opponent.phase != Phase.END:
+            opponent.end_turn()
         if self.battlefield.summoner1 == self and self.battlefield.summoner2.phase == Phase.END:
             self.battlefield.summoner2.turn = False
         if self.battlefield.summoner2 == self and self.battlefield.summoner1.phase == Phase.END:
             self.battlefield.summoner1.turn = False
         self.turn = True
         self.phase = Phase.DRAW
+        with instruments.timer('gameplay.start_turn'):
+            self.battlefield.events.dispatch(EventType.TURN_STARTED, self)
+
+    def end_turn(self):
+        """Pass the turn: switch to the END Phase and undo the effects
+        that last until the end of the turn."""
+        if self.turn and self.phase != Phase.END:
+            self.phase = Phase.END
+            self.battlefield.end_turn(self)
 
     def end_cast_phase(self):
         """If Phase is CAST, switch to the ATTACK Phase."""
@@ -210,11 +305,20 @@ class Summoner:
         if self.phase == Phase.BLOCK:
             self.phase = Phase.NONE
 
+    def has_fast_spell(self):
+        """Check if there is a fast spell in the hand."""
+        return self.hand.has_type(CardType.FAST_SPELL)
+
     def check_interrupt(self):
-        """Check if Phase can INTERRUPT opponent."""
-        for item in self.hand:
-            if item.card_type == CardType.FAST_SPELL:
-                self.phase = Phase.INTERRUPT
+        """Check if Phase can INTERRUPT opponent with a fast spell the
+        Summoner can afford."""
+        if self.responses.can_respond(self.mana):
+            self.phase = Phase.INTERRUPT
+
+    def cast_spell(self, card: Card, targets: list | None = None):
+        """Cast a spell from the hand onto the Battlefield's spell stack.
+        Returns True if the spell was cast."""
+        return self.battlefield.stack.cast(self, card, targets)
 
     def add_current_mana(self):
         """Add mana at the beginning of your turn based on the number
@@ -272,38 +376,34 @@ class Summoner:
         self.fortitude -= damage
         self.check_win()
 
-    def __display_list(self, list1: list):
-        x = 0
-        for item in list1:
+    def __display_list(self, numbered: list):
+        for x, item in numbered:
             if item.card_type is not CardType.CREATURE:
-                print(str(x), list1[x].name, '| Mana:', list1[x].mana_cost, '| Ability:', list1[x].ability)
+                print(str(x), item.name, '| Mana:', item.mana_cost, '| Ability:', item.ability)
             elif item.card_type is CardType.CREATURE:
-                print(str(x), list1[x].name, '| Mana:', list1[x].mana_cost, '| STR/FOR:', str(list1[x].strength)+'/'+str(list1[x].fortitude), '| Ability:', list1[x].ability)
-            x += 1
-
-    def set_hand_numbers(self):
-        """Set hand numbers for cards in hand."""
-        x = 0
-        for item in self.hand:
-            item.hand_number = x
-            x += 1
+                print(str(x), item.name, '| Mana:', item.mana_cost, '| STR/FOR:', str(item.strength)+'/'+str(item.fortitude), '| Ability:', item.ability)
 
     def display_creatures(self, battlefield: Battlefield):
         """Print creatures on board to the console."""
         if self == battlefield.summoner1:
-            self.__display_list(battlefield.s1_inactive)
+            self.__display_list(list(enumerate(battlefield.s1_inactive)))
         elif self == battlefield.summoner2:
-            self.__display_list(battlefield.s2_inactive)
+            self.__display_list(list(enumerate(battlefield.s2_inactive)))
 
     def display_hand(self):
-        """Print cards in hand to the console."""
-        self.set_hand_numbers()
-        self.__display_list(self.hand)
+        """Print cards in hand to the console, numbered by hand number."""
+        self.__display_list(self.hand.items())
 
 class PlayedCard(Card):
     """Card that is played, can be moved around the battlefield and 
-    modified."""
-    def __init__(self, battlefield: Battlefield, summoner: Summoner):
+    modified. If card is given, the PlayedCard is a copy of it.
+    PlayedCard.strength and PlayedCard.fortitude are the effective stats
+    from PlayedCard.modifiers."""
+    def __init__(self, battlefield: Battlefield, summoner: Summoner, card: Card | None = None):
+        if card is not None:
+            self.__dict__.update(card.__dict__)
+        self.modifiers = StatModifiers(self.__dict__.pop('strength', None), self.__dict__.pop('fortitude', None))
+        self.__dict__.pop('max_fortitude', None)
         self.alive = True
         self.ready_to_attack = False
         self.battlefield = battlefield
@@ -338,6 +438,74 @@ class PlayedCard(Card):
             elif self.card_type == CardType.MANA_CRYSTAL:
                 self.battlefield.s2_mc.append(self)
                 self.position = self.battlefield.s2_mc
+        if card is not None:
+            self.subscribe_ability()
+            if self.card_type == CardType.CREATURE:
+                self.battlefield.apply_auras(self)
+            elif self.card_type == CardType.AURA:
+                self.use_ability()
+            events = self.battlefield.events
+            events.dispatch(EventType.CARD_PLAYED, self.summoner, self)
+            if self.card_type == CardType.FAST_SPELL or self.card_type == CardType.SLOW_SPELL:
+                events.dispatch(EventType.SPELL_CAST, self.summoner, self)
+
+    @property
+    def strength(self):
+        """Effective STR."""
+        return self.modifiers.strength
+
+    @strength.setter
+    def strength(self, strength: int):
+        self.modifiers.set_strength(strength)
+
+    @property
+    def fortitude(self):
+        """Effective FOR, after damage."""
+        return self.modifiers.fortitude
+
+    @fortitude.setter
+    def fortitude(self, fortitude: int):
+        self.modifiers.set_fortitude(fortitude)
+
+    @property
+    def max_fortitude(self):
+        """Effective FOR before damage."""
+        return self.modifiers.max_fortitude
+
+    def subscribe_ability(self):
+        """Subscribe a triggered ability to the Battlefield events that
+        trigger it. Traps are sent to the graveyard after triggering once."""
+        ability = get_ability(self)
+        if ability is None or ability.trigger == Trigger.ON_PLAY:
+            return
+        opponent = self.battlefield.opponent(self.summoner)
+        if ability.trigger == Trigger.ON_DEATH:
+            event_type, source = EventType.CREATURE_DIED, self
+        elif ability.trigger == Trigger.ON_ATTACK:
+            event_type, source = EventType.ATTACK_DECLARED, self
+        elif ability.trigger == Trigger.ON_ENEMY_ATTACK:
+            event_type, source = EventType.ATTACK_DECLARED, opponent
+        elif ability.trigger == Trigger.ON_CREATURE_DIED:
+            event_type, source = EventType.CREATURE_DIED, None
+        elif ability.trigger == Trigger.ON_ENEMY_SPELL:
+            event_type, source = EventType.SPELL_CAST, opponent
+        elif ability.trigger == Trigger.START_OF_TURN:
+            event_type, source = EventType.TURN_STARTED, self.summoner
+        else:
+            event_type, source = EventType.TURN_ENDED, self.summoner
+        self.battlefield.events.subscribe(event_type, self.trigger_ability, source, self)
+
+    def trigger_ability(self, event):
+        """Use the PlayedCard's ability in response to an event."""
+        self.use_ability(subject=event.subject)
+        if self.card_type == CardType.TRAP and self.position is not None and self in self.position:
+            self.battlefield.remove_trap(self, self.summoner)
+
+    def use_ability(self, targets: list | None = None, subject=None):
+        """Use the PlayedCard's compiled ability on the chosen targets."""
+        ability = get_ability(self)
+        if ability is not None:
+            ability(AbilityContext(self, self.summoner, self.battlefield, targets, subject))
 
     def take_damage(self, damage: int):
         """Decrease the fortitude attribute."""
@@ -348,26 +516,33 @@ class PlayedCard(Card):
         greater than the max_fortitude, increase the attribute only by
         enough to make fortitude equal to max_fortitude."""
         if self.fortitude + heal > self.max_fortitude:
-            self.fortitude += ((self.fortitude+heal)-self.max_fortitude)
+            self.fortitude = self.max_fortitude
         else:
             self.fortitude += heal
 
     def check_alive(self):
         """Check if a creature is alive or not. If not, set booleans and 
         send the PlayedCard to the graveyard."""
-        if self.fortitude <= 0 and self.card_type == CardType.CREATURE:
+        if self.alive and self.fortitude <= 0 and self.card_type == CardType.CREATURE:
             self.alive = False
             self.ready_to_attack = False
             self.send_to_graveyard()
+            self.battlefield.events.dispatch(EventType.CREATURE_DIED, self.summoner, self)
+            self.battlefield.events.unsubscribe_owner(self)
 
     def send_to_graveyard(self):
         """Remove PlayedCard from current position and send to the
-        graveyard of the PlayedCard's summoner."""
+        graveyard of the PlayedCard's summoner. Its triggered ability stops
+        listening for events, except a creature's, which is unsubscribed by
+        check_alive after CREATURE_DIED so ON_DEATH abilities still fire."""
+        instruments.count('gameplay.graveyard_moves')
         self.position.remove(self)
         if self.summoner == self.battlefield.summoner1:
             self.battlefield.s1_graveyard.append(self)
         elif self.summoner == self.battlefield.summoner2:
             self.battlefield.s2_graveyard.append(self)
+        if self.card_type != CardType.CREATURE:
+            self.battlefield.events.unsubscribe_owner(self)
 
     def __attack_creature(self, item, target, damage):
         if item == target:
@@ -411,10 +586,14 @@ class PlayedCard(Card):
     def attack(self):
         """Attack the enemy summoner"""
         if self.card_type == CardType.CREATURE:
-            if not self.blocked:
-                if self.summoner == self.battlefield.summoner1:
-                    self.battlefield.summoner2.fortitude -= self.strength
-                elif self.summoner == self.battlefield.summoner2:
-                    self.battlefield.summoner1.fortitude -= self.strength
-            elif self.blocked:
-                self.blocker.block(self)
+            with instruments.timer('gameplay.combat'):
+                self.battlefield.events.dispatch(EventType.ATTACK_DECLARED, self.summoner, self)
+                if not self.alive:
+                    return
+                if not self.blocked:
+                    if self.summoner == self.battlefield.summoner1:
+                        self.battlefield.summoner2.fortitude -= self.strength
+                    elif self.summoner == self.battlefield.summoner2:
+                        self.battlefield.summoner1.fortitude -= self.strength
+                elif self.blocked:
+                    self.blocker.block(self)
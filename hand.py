@@ -0,0 +1,77 @@
+"""Summoner's hand of Cards."""
+from deckbuild import Card, CardType
+from spellstack import ResponseTracker
+
+class Hand:
+    """Cards in a Summoner's hand, indexed by hand number and by CardType.
+    A card keeps the hand number it was given when it entered the hand until
+    it leaves, so cards never need renumbering. Decks can hold the same Card
+    object several times, so the hand numbers of each Card are tracked
+    separately from Card.hand_number."""
+    def __init__(self):
+        self.cards = {}
+        self.by_type = {card_type: {} for card_type in CardType}
+        self.numbers = {}
+        self.next_number = 0
+        self.responses = ResponseTracker()
+
+    def __len__(self):
+        return len(self.cards)
+
+    def __iter__(self):
+        return iter(list(self.cards.values()))
+
+    def __contains__(self, card: Card):
+        return id(card) in self.numbers
+
+    def items(self):
+        """Return (hand number, Card) pairs in the order the cards entered."""
+        return list(self.cards.items())
+
+    def append(self, card: Card):
+        """Add a Card to the hand and return its hand number."""
+        number = self.next_number
+        self.next_number += 1
+        self.cards[number] = card
+        self.by_type[card.card_type][number] = card
+        self.numbers.setdefault(id(card), []).append(number)
+        card.hand_number = number
+        self.responses.add(card)
+        return number
+
+    def remove(self, card: Card):
+        """Remove a Card from the hand. Raises ValueError if it isn't in
+        the hand."""
+        numbers = self.numbers.get(id(card))
+        if numbers is None:
+            raise ValueError('Card is not in the hand.')
+        self.remove_number(numbers[-1])
+
+    def remove_number(self, number: int):
+        """Remove and return the Card with a hand number, or None if no Card
+        in the hand has it."""
+        card = self.cards.pop(number, None)
+        if card is None:
+            return None
+        self.by_type[card.card_type].pop(number)
+        numbers = self.numbers[id(card)]
+        numbers.remove(number)
+        if len(numbers) == 0:
+            self.numbers.pop(id(card))
+            card.hand_number = None
+        else:
+            card.hand_number = numbers[-1]
+        self.responses.remove(card)
+        return card
+
+    def get(self, number: int):
+        """Return the Card with a hand number, or None."""
+        return self.cards.get(number)
+
+    def of_type(self, card_type: CardType):
+        """Return the Cards in the hand of a CardType."""
+        return list(self.by_type[card_type].values())
+
+    def has_type(self, card_type: CardType):
+        """Check if the hand holds a Card of a CardType."""
+        return len(self.by_type[card_type]) != 0
@@ -0,0 +1,21 @@
+"""Texas Hold'Em. The package exposes the cards, the Table and its
+Players, the betting state machine, seating and the hand evaluator.
+Heavier parts are imported from their modules when needed:
+
+    holdem.deals      bulk dealing on compact card ids
+    holdem.preflop    precomputed preflop equity
+    holdem.ranges     hand ranges and range equity
+    holdem.ledger     write-ahead chip ledger
+    holdem.stats      player statistics
+    holdem.store      SQLite player and session store"""
+from holdem.cards import Card, Deck, Suit
+from holdem.table import Chips, Pool, PlayerTexasHoldEm, Table, TexasHoldEmPoints
+from holdem.board import BoardAnalyzer
+from holdem.betting import Action, BettingRound, Street
+from holdem.seats import SeatRing
+from holdem.evaluator import category, category_name, equity, evaluate
+
+__all__ = [
+    'Action', 'BettingRound', 'BoardAnalyzer', 'Card', 'Chips', 'Deck', 'PlayerTexasHoldEm', 'Pool',
+    'SeatRing', 'Street', 'Suit', 'Table', 'TexasHoldEmPoints', 'category', 'category_name', 'equity', 'evaluate'
+]
@@ -0,0 +1,235 @@
+"""Betting state machine for a hand of Texas Hold'Em. It tracks the street,
+the current bet, the minimum raise, the last aggressor, the acting seat and
+how many players still have to act, so checking if an action is legal and if
+a betting round is complete never scans the table. Seats that fold or go all
+in are unlinked from a ring of acting seats, so finding the next player to
+act doesn't scan past them either."""
+from enum import Enum
+
+class Street(Enum):
+    """Betting rounds of a hand."""
+    PREFLOP = 0
+    FLOP = 1
+    TURN = 2
+    RIVER = 3
+    SHOWDOWN = 4
+
+class Action(Enum):
+    """Betting actions."""
+    FOLD = 0
+    CHECK = 1
+    CALL = 2
+    BET = 3
+    RAISE = 4
+
+class BettingRound:
+    """Betting for one hand, from the blinds to showdown. stacks are the
+    players' chips by seat before the blinds; blinds maps seat to the amount
+    it posts. Preflop, first_to_act acts first; after the flop the first
+    active seat after the button acts first."""
+    def __init__(self, stacks: list, big_blind: int, button: int = 0, blinds: dict | None = None, first_to_act: int | None = None):
+        self.seats = len(stacks)
+        self.stacks = list(stacks)
+        self.big_blind = big_blind
+        self.button = button
+        self.street = Street.PREFLOP
+        self.street_bets = [0] * self.seats
+        self.committed = [0] * self.seats
+        self.folded = [False] * self.seats
+        self.all_in = [False] * self.seats
+        self.acted = [False] * self.seats
+        self.next_seat = [(seat + 1) % self.seats for seat in range(self.seats)]
+        self.previous_seat = [(seat - 1) % self.seats for seat in range(self.seats)]
+        self.acting_count = self.seats
+        self.live = self.seats
+        self.pot = 0
+        self.current_bet = 0
+        self.min_raise = big_blind
+        self.last_aggressor = None
+        if blinds is not None:
+            for seat, amount in blinds.items():
+                self.put_in(seat, min(amount, self.stacks[seat]))
+            self.current_bet = max(self.street_bets)
+        for seat in range(self.seats):
+            if self.stacks[seat] == 0 and not self.all_in[seat]:
+                self.set_all_in(seat)
+        if first_to_act is None:
+            first_to_act = (button + 1) % self.seats
+        self.acting = self.first_active(first_to_act)
+        self.to_act = self.acting_count
+
+    def put_in(self, seat: int, amount: int):
+        """Move chips from a seat's stack into the pot."""
+        self.stacks[seat] -= amount
+        self.street_bets[seat] += amount
+        self.committed[seat] += amount
+        self.pot += amount
+        if self.stacks[seat] == 0:
+            self.set_all_in(seat)
+
+    def unlink(self, seat: int):
+        """Remove a seat from the ring of acting seats."""
+        before = self.previous_seat[seat]
+        after = self.next_seat[seat]
+        self.next_seat[before] = after
+        self.previous_seat[after] = before
+        self.acting_count -= 1
+
+    def set_all_in(self, seat: int):
+        """Mark a seat as all in; it no longer acts."""
+        if not self.all_in[seat] and not self.folded[seat]:
+            self.all_in[seat] = True
+            self.unlink(seat)
+
+    def can_act(self, seat: int):
+        """Check if a seat is still in the ring of acting seats."""
+        return not self.folded[seat] and not self.all_in[seat]
+
+    def first_active(self, seat: int):
+        """First seat at or after seat that can act, or None."""
+        if self.acting_count == 0:
+            return None
+        for i in range(self.seats):
+            candidate = (seat + i) % self.seats
+            if self.can_act(candidate):
+                return candidate
+        return None
+
+    def to_call(self, seat: int | None = None):
+        """Chips the seat needs to put in to call."""
+        if seat is None:
+            seat = self.acting
+        return min(self.current_bet - self.street_bets[seat], self.stacks[seat])
+
+    def min_raise_to(self):
+        """Smallest total street bet the acting seat can raise to."""
+        return self.current_bet + self.min_raise
+
+    def max_raise_to(self, seat: int | None = None):
+        """Largest total street bet the seat can make (all in)."""
+        if seat is None:
+            seat = self.acting
+        return self.street_bets[seat] + self.stacks[seat]
+
+    def is_legal(self, action: Action, amount: int = 0):
+        """Check if the acting seat can take an action. For BET and RAISE,
+        amount is the total street bet to raise to; a raise smaller than the
+        minimum is only legal as an all in. A seat that has acted since the
+        last full bet or raise can't raise again."""
+        seat = self.acting
+        if seat is None or self.round_complete():
+            return False
+        owed = self.current_bet - self.street_bets[seat]
+        if action == Action.FOLD:
+            return True
+        if action == Action.CHECK:
+            return owed == 0
+        if action == Action.CALL:
+            return owed > 0
+        if action == Action.BET and self.current_bet != 0:
+            return False
+        if action == Action.RAISE and self.current_bet == 0:
+            return False
+        if self.acted[seat]:
+            return False
+        if amount <= self.current_bet or amount > self.max_raise_to(seat):
+            return False
+        return amount >= self.min_raise_to() or amount == self.max_raise_to(seat)
+
+    def legal_actions(self):
+        """Actions the acting seat can take."""
+        return [action for action in Action if self.is_legal(action, self.max_raise_to() if action in (Action.BET, Action.RAISE) else 0)]
+
+    def act(self, action: Action, amount: int = 0):
+        """Take an action for the acting seat and move to the next seat.
+        Raises ValueError if the action is illegal. Returns the chips put in.
+        An all in raise smaller than the minimum raise makes the other seats
+        call it but doesn't reopen the betting to seats that already acted."""
+        if not self.is_legal(action, amount):
+            raise ValueError(f'Illegal action: {action.name} {amount}')
+        seat = self.acting
+        put_in = 0
+        self.to_act -= 1
+        self.acted[seat] = True
+        if action == Action.FOLD:
+            self.folded[seat] = True
+            self.live -= 1
+            self.unlink(seat)
+        elif action == Action.CALL:
+            put_in = self.to_call(seat)
+            self.put_in(seat, put_in)
+        elif action == Action.BET or action == Action.RAISE:
+            put_in = amount - self.street_bets[seat]
+            if amount - self.current_bet >= self.min_raise:
+                self.min_raise = amount - self.current_bet
+                self.last_aggressor = seat
+                self.acted = [False] * self.seats
+                self.acted[seat] = True
+            self.current_bet = amount
+            self.put_in(seat, put_in)
+            self.to_act = self.acting_count if self.all_in[seat] else self.acting_count - 1
+        if self.acting_count == 0 or self.live == 1:
+            self.to_act = 0
+        if self.to_act == 0:
+            self.acting = None
+        elif self.can_act(seat):
+            self.acting = self.next_seat[seat]
+        else:
+            self.acting = self.first_active(seat)
+        return put_in
+
+    def round_complete(self):
+        """Check if every player still in the hand has acted on the current
+        bet, or if only one player is left."""
+        return self.to_act == 0 or self.live == 1
+
+    def hand_over(self):
+        """Check if the hand is over: one player left or showdown reached."""
+        return self.live == 1 or self.street == Street.SHOWDOWN
+
+    def next_street(self):
+        """Start the next betting round. If fewer than two players can still
+        bet, the rest of the streets have no betting."""
+        self.street = Street(self.street.value + 1)
+        self.street_bets = [0] * self.seats
+        self.acted = [False] * self.seats
+        self.current_bet = 0
+        self.min_raise = self.big_blind
+        self.last_aggressor = None
+        self.acting = self.first_active((self.button + 1) % self.seats)
+        self.to_act = self.acting_count if self.acting_count > 1 else 0
+        if self.to_act == 0:
+            self.acting = None
+        return self.street
+
+    def in_hand(self):
+        """Seats that haven't folded."""
+        return [seat for seat in range(self.seats) if not self.folded[seat]]
+
+    def payouts(self, scores: dict):
+        """Split the pot, including side pots, between the seats still in the
+        hand. scores maps each of those seats to its hand score; a higher
+        score wins. Returns the chips won by each seat. Odd chips go to the
+        first winners after the button."""
+        remaining = list(self.committed)
+        won = [0] * self.seats
+        in_hand = self.in_hand()
+        order = [(self.button + 1 + i) % self.seats for i in range(self.seats)]
+        while True:
+            contributors = [seat for seat in range(self.seats) if remaining[seat] > 0]
+            if len(contributors) == 0:
+                return won
+            level = min(remaining[seat] for seat in contributors)
+            pot = level * len(contributors)
+            for seat in contributors:
+                remaining[seat] -= level
+            eligible = [seat for seat in contributors if not self.folded[seat]]
+            if len(eligible) == 0:
+                eligible = in_hand
+            best = max(scores[seat] for seat in eligible)
+            winners = [seat for seat in order if seat in eligible and scores[seat] == best]
+            share = pot // len(winners)
+            for seat in winners:
+                won[seat] += share
+            for seat in winners[:int(pot - share * len(winners))]:
+                won[seat] += 1
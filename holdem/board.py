@@ -0,0 +1,101 @@
+"""Board texture and draw analysis over the revealed cards of a Table. The
+analyzer keeps suit counts, per-suit rank bitmasks and a 52-bit mask of seen
+cards, updated one card at a time as Table.reveal_card adds cards, so players'
+flush and straight draws and outs come from a handful of bit operations."""
+from holdem.evaluator import BIT_COUNT, STRAIGHT_HIGH, category_name, evaluate
+
+class BoardAnalyzer:
+    """Running summary of the revealed cards, as card ids."""
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Forget every revealed card."""
+        self.cards = []
+        self.suit_counts = [0, 0, 0, 0]
+        self.suit_masks = [0, 0, 0, 0]
+        self.rank_counts = [0] * 13
+        self.rank_mask = 0
+        self.card_mask = 0
+
+    def add_card(self, card_id: int):
+        """Add a revealed card."""
+        rank = card_id >> 2
+        suit = card_id & 3
+        self.cards.append(card_id)
+        self.suit_counts[suit] += 1
+        self.suit_masks[suit] |= 1 << rank
+        self.rank_counts[rank] += 1
+        self.rank_mask |= 1 << rank
+        self.card_mask |= 1 << card_id
+
+    def texture(self):
+        """Describe the board: 'monotone', 'two-tone' or 'rainbow', whether it
+        is paired, and whether a flush or straight is possible."""
+        largest_suit = max(self.suit_counts)
+        if len(self.cards) != 0 and largest_suit == len(self.cards):
+            suits = 'monotone'
+        elif largest_suit >= 2:
+            suits = 'two-tone'
+        else:
+            suits = 'rainbow'
+        straight_possible = False
+        for first in range(13):
+            for second in range(first, 13):
+                if STRAIGHT_HIGH[self.rank_mask | 1 << first | 1 << second] >= 0:
+                    straight_possible = True
+                    break
+            if straight_possible:
+                break
+        return {
+            'suits': suits,
+            'paired': max(self.rank_counts) >= 2,
+            'flush_possible': largest_suit >= 3,
+            'straight_possible': straight_possible
+        }
+
+    def analyze(self, hole: tuple):
+        """Draws and outs for a player's hole card ids: the made hand, the
+        flush draw suit (or None), the straight draw ('open-ended', 'gutshot'
+        or None) and the cards that complete a flush or straight, as a count
+        and as a 52-bit mask of card ids."""
+        suit_masks = list(self.suit_masks)
+        rank_counts = list(self.rank_counts)
+        rank_mask = self.rank_mask
+        seen = self.card_mask
+        for card in hole:
+            suit_masks[card & 3] |= 1 << (card >> 2)
+            rank_counts[card >> 2] += 1
+            rank_mask |= 1 << (card >> 2)
+            seen |= 1 << card
+        total = len(self.cards) + len(hole)
+        made = category_name(evaluate(tuple(self.cards) + tuple(hole))) if total >= 5 else None
+        outs = 0
+        flush_draw = None
+        straight_draw = None
+        if total < 7:
+            for suit in range(4):
+                if BIT_COUNT[suit_masks[suit]] == 4:
+                    flush_draw = suit
+                    for rank in range(13):
+                        card = rank * 4 + suit
+                        if not seen >> card & 1:
+                            outs |= 1 << card
+            if STRAIGHT_HIGH[rank_mask] < 0:
+                completing = [rank for rank in range(13) if not rank_mask >> rank & 1 and STRAIGHT_HIGH[rank_mask | 1 << rank] >= 0]
+                if len(completing) >= 2:
+                    straight_draw = 'open-ended'
+                elif len(completing) == 1:
+                    straight_draw = 'gutshot'
+                for rank in completing:
+                    for suit in range(4):
+                        card = rank * 4 + suit
+                        if not seen >> card & 1:
+                            outs |= 1 << card
+        return {
+            'made': made,
+            'flush_draw': flush_draw,
+            'straight_draw': straight_draw,
+            'outs': bin(outs).count('1'),
+            'outs_mask': outs
+        }
@@ -0,0 +1,78 @@
+"""Cards and Decks for Texas Hold'Em."""
+from enum import Enum
+from rng import GameRandom
+
+ ### SUIT ###
+class Suit(Enum):
+    """Card suits"""
+    SPADES = 0
+    HEARTS = 1
+    DIAMONDS = 2
+    CLUBS = 3
+
+ ### CARD ###
+class Card:
+    """Cards"""
+    suits = (Suit.SPADES, Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS)
+    values = ('A','2','3','4','5','6','7','8','9','10','J','Q','K')
+    ranks = ('2','3','4','5','6','7','8','9','10','J','Q','K','A')
+    suit: Suit
+    value: str
+
+    def __init__(self, suit: Suit, value: str | int):
+        self.suit = suit
+        self.value = str(value)
+
+    @property
+    def card_id(self):
+        """Compact card encoding from 0 to 51: rank index (2 low, A high)
+        times 4 plus the suit value."""
+        return self.ranks.index(self.value) * 4 + self.suit.value
+
+    @classmethod
+    def from_id(cls, card_id: int):
+        """Create a Card from its compact encoding."""
+        return cls(Suit(card_id % 4), cls.ranks[card_id // 4])
+
+    def print_card(self):
+        """Print card details."""
+        print(self.value, self.suit.name)
+
+    def change_value(self, new_value: str | int):
+        """Change the value of the card."""
+        if isinstance(new_value, int):
+            if 0 <= new_value < 14:
+                self.value = self.values[new_value]
+        elif isinstance(new_value, str):
+            for value in self.values:
+                if value == new_value:
+                    self.value = new_value
+                    return
+            raise ValueError('Entered value does not match available')
+
+ ### DECK ###
+class Deck:
+    """Deck of Cards. Shuffled with its own GameRandom, so a seeded Deck
+    always deals the same cards."""
+    def __init__(self, rng: GameRandom | None = None):
+        self.cards = [Card(suit, value) for suit in Card.suits for value in Card.values]
+        self.rng = rng if rng is not None else GameRandom()
+
+    def print_cards(self):
+        """Print each card value and its suit to the console."""
+        print('DECK:')
+        for item in self.cards:
+            print(item.value, item.suit.name)
+
+    def add_card(self, card: Card):
+        """Add a card to the deck."""
+        self.cards.append(card)
+
+    def flip_top_card(self):
+        """Reveal the top card of the deck."""
+        print(self.cards[0].value, self.cards[0].suit.name)
+
+    def shuffle(self):
+        """Shuffle the Deck"""
+        self.rng.shuffle(self.cards)
+        return self
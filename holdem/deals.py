@@ -0,0 +1,75 @@
+"""Bulk Texas Hold'Em dealing for generating training data. Deals are made
+from the compact card encoding (Card.card_id, 0 to 51) without creating
+Table, PlayerTexasHoldEm, Pool or Card objects. NumPy is used for the array
+and memory-mapped file paths when it is installed."""
+from holdem.cards import Card
+from rng import GameRandom
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+DECK_SIZE = 52
+BOARD_SIZE = 5
+
+def deal_size(seats: int):
+    """Number of cards used by one deal: 2 hole cards per seat and the board."""
+    return 2 * seats + BOARD_SIZE
+
+def deal_hands(deals: int, seats: int, rng: GameRandom | None = None):
+    """Yield deals as (hole cards per seat, board) tuples of card ids. Hole
+    cards are dealt two at a time to each seat, like Table.deal_cards."""
+    if rng is None:
+        rng = GameRandom()
+    size = deal_size(seats)
+    if size > DECK_SIZE:
+        raise ValueError(f'Cannot deal to {seats} seats from one deck.')
+    sample = rng.sample
+    deck = range(DECK_SIZE)
+    hole_end = 2 * seats
+    for i in range(deals):
+        cards = sample(deck, size)
+        yield tuple(zip(cards[0:hole_end:2], cards[1:hole_end:2])), tuple(cards[hole_end:])
+
+def split_deal(row, seats: int):
+    """Split one row of deal_array into (hole cards per seat, board)."""
+    row = [int(card) for card in row]
+    hole_end = 2 * seats
+    return tuple(zip(row[0:hole_end:2], row[1:hole_end:2])), tuple(row[hole_end:])
+
+def require_numpy():
+    """Raise ImportError if NumPy isn't installed."""
+    if numpy is None:
+        raise ImportError('NumPy is required for deal arrays.')
+
+def to_cards(card_ids):
+    """Convert card ids to Cards."""
+    return [Card.from_id(card_id) for card_id in card_ids]
+
+def deal_array(deals: int, seats: int, rng: GameRandom | None = None):
+    """Deal into a (deals, 2 * seats + 5) uint8 NumPy array. Each row holds
+    the hole cards of seat 0, seat 1, ... followed by the board. The cards
+    come from the NumPy stream of rng, so the same seed deals different
+    hands than deal_hands."""
+    require_numpy()
+    if rng is None:
+        rng = GameRandom()
+    size = deal_size(seats)
+    if size > DECK_SIZE:
+        raise ValueError(f'Cannot deal to {seats} seats from one deck.')
+    decks = numpy.tile(numpy.arange(DECK_SIZE, dtype=numpy.uint8), (deals, 1))
+    return numpy.ascontiguousarray(rng.get_generator().permuted(decks, axis=1)[:, :size])
+
+def write_deals(path: str, deals: int, seats: int, rng: GameRandom | None = None, chunk_size: int = 100000):
+    """Deal into a memory-mapped .npy file in chunks, so the number of deals
+    isn't limited by memory. Load it with numpy.load(path, mmap_mode='r')."""
+    require_numpy()
+    if rng is None:
+        rng = GameRandom()
+    output = numpy.lib.format.open_memmap(path, mode='w+', dtype=numpy.uint8, shape=(deals, deal_size(seats)))
+    for start in range(0, deals, chunk_size):
+        stop = min(start + chunk_size, deals)
+        output[start:stop] = deal_array(stop - start, seats, rng)
+    output.flush()
+    return output
@@ -0,0 +1,131 @@
+"""Texas Hold'Em hand evaluator over compact card ids (Card.card_id). A hand
+of 5 to 7 cards is scored as a single int; a higher score is a better hand
+and equal scores tie. Rank bitmasks and lookup tables built at import keep
+an evaluation to a few dictionary and list lookups."""
+from rng import GameRandom
+
+HIGH_CARD = 0
+PAIR = 1
+TWO_PAIR = 2
+THREE_OF_A_KIND = 3
+STRAIGHT = 4
+FLUSH = 5
+FULL_HOUSE = 6
+FOUR_OF_A_KIND = 7
+STRAIGHT_FLUSH = 8
+CATEGORY_NAMES = ('High Card', 'Pair', 'Two Pairs', 'Three of a Kind', 'Straight',
+                  'Flush', 'Full House', 'Four of a Kind', 'Straight Flush')
+CATEGORY_SHIFT = 20
+
+def build_straight_table():
+    """Highest straight rank for every 13-bit rank mask, or -1. A bit
+    survives the shifted ands only where five ranks in a row start."""
+    table = [-1] * 8192
+    wheel = 0b1000000001111 # A-2-3-4-5
+    for mask in range(8192):
+        starts = mask & mask >> 1 & mask >> 2 & mask >> 3 & mask >> 4
+        if starts:
+            table[mask] = starts.bit_length() + 3
+        elif mask & wheel == wheel:
+            table[mask] = 3
+    return table
+
+def build_ranks_table():
+    """Ranks in every 13-bit rank mask, highest first. Each mask extends
+    the ranks of the mask without its highest bit."""
+    table = [()] * 8192
+    for mask in range(1, 8192):
+        high = mask.bit_length() - 1
+        table[mask] = (high,) + table[mask ^ 1 << high]
+    return table
+
+STRAIGHT_HIGH = build_straight_table()
+RANKS_DESC = build_ranks_table()
+BIT_COUNT = [len(ranks) for ranks in RANKS_DESC]
+
+def pack(category: int, ranks):
+    """Pack a category and up to 5 ranks into a score."""
+    score = category
+    for i in range(5):
+        score = score << 4 | (ranks[i] if i < len(ranks) else 0)
+    return score
+
+def evaluate(cards):
+    """Score the best 5-card hand from 5 to 7 card ids."""
+    suit_masks = [0, 0, 0, 0]
+    counts = [0] * 13
+    for card in cards:
+        rank = card >> 2
+        counts[rank] += 1
+        suit_masks[card & 3] |= 1 << rank
+    for mask in suit_masks:
+        if BIT_COUNT[mask] >= 5:
+            high = STRAIGHT_HIGH[mask]
+            if high >= 0:
+                return pack(STRAIGHT_FLUSH, (high,))
+            return pack(FLUSH, RANKS_DESC[mask])
+    rank_mask = suit_masks[0] | suit_masks[1] | suit_masks[2] | suit_masks[3]
+    quads = -1
+    trips = []
+    pairs = []
+    for rank in RANKS_DESC[rank_mask]:
+        count = counts[rank]
+        if count == 4:
+            quads = rank
+        elif count == 3:
+            trips.append(rank)
+        elif count == 2:
+            pairs.append(rank)
+    if quads >= 0:
+        return pack(FOUR_OF_A_KIND, (quads, RANKS_DESC[rank_mask & ~(1 << quads)][0]))
+    if len(trips) != 0 and (len(trips) > 1 or len(pairs) != 0):
+        pair = max(trips[1] if len(trips) > 1 else -1, pairs[0] if len(pairs) != 0 else -1)
+        return pack(FULL_HOUSE, (trips[0], pair))
+    high = STRAIGHT_HIGH[rank_mask]
+    if high >= 0:
+        return pack(STRAIGHT, (high,))
+    if len(trips) != 0:
+        return pack(THREE_OF_A_KIND, (trips[0],) + RANKS_DESC[rank_mask & ~(1 << trips[0])][:2])
+    if len(pairs) > 1:
+        return pack(TWO_PAIR, (pairs[0], pairs[1], RANKS_DESC[rank_mask & ~(1 << pairs[0]) & ~(1 << pairs[1])][0]))
+    if len(pairs) == 1:
+        return pack(PAIR, (pairs[0],) + RANKS_DESC[rank_mask & ~(1 << pairs[0])][:3])
+    return pack(HIGH_CARD, RANKS_DESC[rank_mask][:5])
+
+def category(score: int):
+    """Category of a score, e.g. FLUSH."""
+    return score >> CATEGORY_SHIFT
+
+def category_name(score: int):
+    """Name of the category of a score, e.g. 'Flush'."""
+    return CATEGORY_NAMES[score >> CATEGORY_SHIFT]
+
+def equity(hero: tuple, opponents: int, board: tuple = (), trials: int = 1000, rng: GameRandom | None = None):
+    """Monte Carlo equity of hero's hole cards against a number of random
+    opponent hands, with the rest of the board dealt at random. Ties count
+    as a share of the pot."""
+    if rng is None:
+        rng = GameRandom()
+    dead = set(hero) | set(board)
+    deck = [card for card in range(52) if card not in dead]
+    missing = 5 - len(board)
+    needed = missing + 2 * opponents
+    sample = rng.sample
+    board = tuple(board)
+    won = 0.0
+    for i in range(trials):
+        cards = sample(deck, needed)
+        full_board = board + tuple(cards[:missing])
+        best = evaluate(hero + full_board)
+        ties = 1
+        for seat in range(opponents):
+            start = missing + 2 * seat
+            score = evaluate((cards[start], cards[start + 1]) + full_board)
+            if score > best:
+                ties = 0
+                break
+            if score == best:
+                ties += 1
+        if ties:
+            won += 1 / ties
+    return won / trials
@@ -0,0 +1,210 @@
+"""Write-ahead ledger of chip movements at a Texas Hold'Em Table. Each bet,
+pot award and balance change is appended to an in-memory buffer and written
+to the log with a single fsync per group of records (group commit), so
+recording an action costs microseconds. Snapshots of every balance are
+written periodically and the log restarts after each one. After a crash,
+opening the ledger again replays the snapshot and the log; a torn record at
+the end of the log is dropped. A hand's pot awards only count once its
+HAND_END record is in the log, so a crash while the pot is being paid out
+leaves the bets in the pot for refund_open_hand instead of paying twice."""
+import json
+import os
+import struct
+import time
+import zlib
+from money import Money
+
+SET = 0
+BET = 1
+AWARD = 2
+HAND_END = 3
+RECORD = struct.Struct('<IQBqH')
+BODY = struct.Struct('<QBqH')
+CHECKSUM = struct.Struct('<I')
+LOG_NAME = 'ledger.wal'
+SNAPSHOT_NAME = 'ledger.snapshot'
+
+class ChipLedger:
+    """Durable chip balances by player name, kept in directory. Records
+    are committed once group_size are pending or group_interval seconds have
+    passed since the last commit, and on commit() and close(). A snapshot is
+    taken every snapshot_every records."""
+    def __init__(self, directory: str, group_size: int = 64, group_interval: float = 0.05, snapshot_every: int = 10000):
+        os.makedirs(directory, exist_ok=True)
+        self.log_path = os.path.join(directory, LOG_NAME)
+        self.snapshot_path = os.path.join(directory, SNAPSHOT_NAME)
+        self.group_size = group_size
+        self.group_interval = group_interval
+        self.snapshot_every = snapshot_every
+        self.balances = {}
+        self.in_pot = {}
+        self.sequence = 0
+        self.since_snapshot = 0
+        self.pending = bytearray()
+        self.pending_count = 0
+        self.settling = False
+        self.recover()
+        self.file = open(self.log_path, 'ab')
+        self.last_commit = time.monotonic()
+
+    def recover(self):
+        """Load the snapshot, then replay every whole record in the log after
+        it and cut off anything after the last whole record. Awards are held
+        back until their hand's HAND_END; awards of a hand that never ended
+        are cut off too, so the log matches the balances."""
+        snapshot_sequence = 0
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path) as file:
+                data = json.load(file)
+            snapshot_sequence = data['sequence']
+            self.sequence = snapshot_sequence
+            self.balances = {name: Money(value) for name, value in data['balances'].items()}
+            self.in_pot = {name: Money(value) for name, value in data['in_pot'].items()}
+        if not os.path.exists(self.log_path):
+            return
+        with open(self.log_path, 'rb') as file:
+            data = file.read()
+        offset = 0
+        awards = []
+        awards_offset = None
+        awards_sequence = self.sequence
+        while offset + RECORD.size <= len(data):
+            checksum, sequence, kind, amount, name_size = RECORD.unpack_from(data, offset)
+            end = offset + RECORD.size + name_size
+            if end > len(data) or zlib.crc32(data[offset + 4:end]) != checksum:
+                break
+            if sequence > snapshot_sequence:
+                name = data[offset + RECORD.size:end].decode()
+                if kind == AWARD:
+                    if awards_offset is None:
+                        awards_offset = offset
+                        awards_sequence = self.sequence
+                    awards.append((name, Money(amount)))
+                else:
+                    if kind == HAND_END:
+                        for award in awards:
+                            self.apply(AWARD, *award)
+                        self.since_snapshot += len(awards)
+                        awards.clear()
+                        awards_offset = None
+                    self.apply(kind, name, Money(amount))
+                    self.since_snapshot += 1
+                self.sequence = sequence
+            offset = end
+        if awards_offset is not None:
+            offset = awards_offset
+            self.sequence = awards_sequence
+        if offset != len(data):
+            with open(self.log_path, 'r+b') as file:
+                file.truncate(offset)
+                file.flush()
+                os.fsync(file.fileno())
+
+    def apply(self, kind: int, name: str, amount: Money):
+        """Apply a record to the balances."""
+        if kind == SET:
+            self.balances[name] = amount
+        elif kind == BET:
+            self.balances[name] = self.balances.get(name, Money(0)) - amount
+            self.in_pot[name] = self.in_pot.get(name, Money(0)) + amount
+        elif kind == AWARD:
+            self.balances[name] = self.balances.get(name, Money(0)) + amount
+        elif kind == HAND_END:
+            self.in_pot.clear()
+
+    def append(self, kind: int, name: str = '', amount: Money = Money(0)):
+        """Apply a record and add it to the pending group."""
+        self.apply(kind, name, amount)
+        if kind == AWARD:
+            self.settling = True
+        elif kind == HAND_END:
+            self.settling = False
+        self.sequence += 1
+        encoded = name.encode()
+        body = BODY.pack(self.sequence, kind, amount, len(encoded)) + encoded
+        self.pending += CHECKSUM.pack(zlib.crc32(body)) + body
+        self.pending_count += 1
+        self.since_snapshot += 1
+        if self.pending_count >= self.group_size or time.monotonic() - self.last_commit >= self.group_interval:
+            self.commit()
+
+    def set_balance(self, name: str, amount: Money):
+        """Record a Player's balance, e.g. their starting chips."""
+        self.append(SET, name, amount)
+
+    def bet(self, name: str, amount: Money):
+        """Record chips a Player put in the pot."""
+        self.append(BET, name, amount)
+
+    def award(self, name: str, amount: Money):
+        """Record chips a Player won from the pot."""
+        self.append(AWARD, name, amount)
+
+    def end_hand(self):
+        """Record the end of a hand and commit."""
+        self.append(HAND_END)
+        self.commit()
+
+    def refund_open_hand(self):
+        """Give back the chips bet in a hand that never ended, e.g. after a
+        crash. Returns the refunds by name."""
+        refunds = dict(self.in_pot)
+        if len(refunds) != 0:
+            for name, amount in refunds.items():
+                self.award(name, amount)
+            self.end_hand()
+        return refunds
+
+    def write_pending(self):
+        """Write and fsync the pending records as one group."""
+        if self.pending_count != 0:
+            self.file.write(self.pending)
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.pending.clear()
+            self.pending_count = 0
+
+    def commit(self):
+        """Write the pending records, and take a snapshot if one is due. No
+        snapshot is taken while a pot is being paid out."""
+        self.write_pending()
+        self.last_commit = time.monotonic()
+        if self.since_snapshot >= self.snapshot_every and not self.settling:
+            self.snapshot()
+
+    def snapshot(self):
+        """Write every balance to the snapshot atomically, then restart the
+        log. Records already in the snapshot are skipped on recovery, so a
+        crash between the two steps is safe."""
+        self.write_pending()
+        data = {
+            'sequence': self.sequence,
+            'balances': {name: int(value) for name, value in self.balances.items()},
+            'in_pot': {name: int(value) for name, value in self.in_pot.items()}
+        }
+        temporary_path = self.snapshot_path + '.tmp'
+        with open(temporary_path, 'w') as file:
+            json.dump(data, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self.snapshot_path)
+        fsync_directory(os.path.dirname(self.snapshot_path))
+        self.file.close()
+        self.file = open(self.log_path, 'wb')
+        self.since_snapshot = 0
+
+    def close(self):
+        """Commit the pending records and close the log."""
+        self.commit()
+        self.file.close()
+
+def fsync_directory(directory: str):
+    """Make a rename in a directory durable. Only POSIX systems can fsync a
+    directory."""
+    if os.name != 'posix':
+        return
+    descriptor = os.open(directory or '.', os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
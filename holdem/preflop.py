@@ -0,0 +1,124 @@
+"""Precomputed preflop equity of the 169 canonical Texas Hold'Em starting
+hands against 1 to 9 random opponents. The table is generated once by
+simulation (python -m holdem.preflop) and shipped as preflop_equity.bin next
+to this module, so a preflop decision is a single lookup."""
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import os
+import struct
+import sys
+from holdem.evaluator import equity
+from profiling import merge, profiled_call, write_collapsed
+from rng import GameRandom
+
+RANK_LABELS = ('2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K', 'A')
+MAX_OPPONENTS = 9
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'preflop_equity.bin')
+HEADER = struct.Struct('<4sHHI')
+MAGIC = b'PFEQ'
+VERSION = 1
+
+def build_labels():
+    """The 169 canonical hands: pairs, then suited and offsuit hands, from
+    the highest ranks down."""
+    labels = []
+    for high in range(12, -1, -1):
+        labels.append(RANK_LABELS[high] * 2)
+        for low in range(high - 1, -1, -1):
+            labels.append(RANK_LABELS[high] + RANK_LABELS[low] + 's')
+            labels.append(RANK_LABELS[high] + RANK_LABELS[low] + 'o')
+    return labels
+
+HAND_LABELS = build_labels()
+HAND_INDEX = {label: index for index, label in enumerate(HAND_LABELS)}
+
+def hand_label(card1: int, card2: int):
+    """Canonical label of two hole card ids, e.g. 'AKs', 'T9o' or 'QQ'."""
+    high, low = max(card1 >> 2, card2 >> 2), min(card1 >> 2, card2 >> 2)
+    if high == low:
+        return RANK_LABELS[high] * 2
+    suited = 's' if card1 & 3 == card2 & 3 else 'o'
+    return RANK_LABELS[high] + RANK_LABELS[low] + suited
+
+def representative(label: str):
+    """Hole card ids for a canonical label."""
+    high = RANK_LABELS.index(label[0])
+    low = RANK_LABELS.index(label[1])
+    if len(label) == 3 and label[2] == 's':
+        return (high * 4, low * 4)
+    return (high * 4, low * 4 + 1)
+
+def simulate_hand(label: str, trials: int, seed: int):
+    """Equity of one canonical hand against 1 to MAX_OPPONENTS opponents."""
+    rng = GameRandom(seed)
+    hero = representative(label)
+    return [equity(hero, opponents, (), trials, rng) for opponents in range(1, MAX_OPPONENTS + 1)]
+
+def build_table(trials: int = 5000, seed: int = 0, workers: int | None = None,
+                profile: str | None = None, profile_path: str = 'preflop.folded'):
+    """Simulate every canonical hand in a process pool. Returns one list of
+    equities per hand, in HAND_LABELS order. If profile is 'cprofile' or
+    'sample', each worker's simulations are profiled and the collapsed
+    stacks of all of them are written to profile_path."""
+    rng = GameRandom(seed)
+    seeds = [rng.spawn(index).seed for index in range(len(HAND_LABELS))]
+    function = simulate_hand if profile is None else partial(profiled_call, profile, simulate_hand)
+    with ProcessPoolExecutor(workers) as executor:
+        results = list(executor.map(function, HAND_LABELS, [trials] * len(HAND_LABELS), seeds))
+    if profile is None:
+        return results
+    write_collapsed(profile_path, merge(stacks for rows, stacks in results))
+    return [rows for rows, stacks in results]
+
+def write_table(path: str, rows: list, trials: int):
+    """Write equities as unsigned 16-bit fractions of 65535 after a header."""
+    values = array('H', (round(value * 65535) for row in rows for value in row))
+    if sys.byteorder != 'little':
+        values.byteswap()
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, MAX_OPPONENTS, trials))
+        file.write(values.tobytes())
+
+class PreflopTable:
+    """Preflop equity lookups from a table file."""
+    def __init__(self, path: str = TABLE_PATH):
+        with open(path, 'rb') as file:
+            data = file.read()
+        magic, version, max_opponents, trials = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'{path} is not a preflop equity table.')
+        self.max_opponents = max_opponents
+        self.trials = trials
+        self.values = array('H')
+        self.values.frombytes(data[HEADER.size:])
+        if sys.byteorder != 'little':
+            self.values.byteswap()
+
+    def equity_of_label(self, label: str, opponents: int):
+        """Equity of a canonical hand label against a number of opponents."""
+        if not 1 <= opponents <= self.max_opponents:
+            raise ValueError(f'Opponents must be between 1 and {self.max_opponents}.')
+        return self.values[HAND_INDEX[label] * self.max_opponents + opponents - 1] / 65535
+
+    def equity(self, card1: int, card2: int, opponents: int):
+        """Equity of two hole card ids against a number of opponents."""
+        return self.equity_of_label(hand_label(card1, card2), opponents)
+
+    def ranked_labels(self, opponents: int = 1):
+        """Canonical hands sorted from the highest equity down."""
+        return sorted(HAND_LABELS, key=lambda label: self.equity_of_label(label, opponents), reverse=True)
+
+default_table = None
+
+def preflop_equity(card1: int, card2: int, opponents: int):
+    """Equity of two hole card ids from the shipped table, loading it on
+    first use."""
+    global default_table
+    if default_table is None:
+        default_table = PreflopTable()
+    return default_table.equity(card1, card2, opponents)
+
+if __name__ == '__main__':
+    TRIALS = 5000
+    write_table(TABLE_PATH, build_table(TRIALS), TRIALS)
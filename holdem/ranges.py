@@ -0,0 +1,222 @@
+"""Hand ranges and range against range equity for Texas Hold'Em.
+
+A range is a comma separated list of:
+    QQ        a pair               QQ+       QQ, KK and AA
+    22-55     pairs from 22 to 55  AKs       suited, AKo offsuit, AK both
+    ATs+      ATs up to AKs        A2s-A5s   A2s to A5s
+    AhKh      a single combo       10%       the top 10% of hands by
+                                             heads-up preflop equity
+Any of these can end in :weight, e.g. AKo:0.5, to count its combos at a
+fraction of their usual frequency."""
+from functools import lru_cache
+from holdem import preflop
+from holdem.evaluator import evaluate
+from holdem.preflop import RANK_LABELS
+from rng import GameRandom
+
+SUIT_LABELS = ('s', 'h', 'd', 'c')
+TOTAL_COMBOS = 1326
+
+def parse_card(text: str):
+    """Card id from text like 'Ah' or '10d'."""
+    rank = text[:-1].upper()
+    if rank == '10':
+        rank = 'T'
+    if rank not in RANK_LABELS or text[-1].lower() not in SUIT_LABELS:
+        raise ValueError(f'Invalid card: {text!r}')
+    return RANK_LABELS.index(rank) * 4 + SUIT_LABELS.index(text[-1].lower())
+
+def card_text(card_id: int):
+    """Text like 'Ah' for a card id."""
+    return RANK_LABELS[card_id >> 2] + SUIT_LABELS[card_id & 3]
+
+def parse_cards(cards):
+    """Tuple of card ids from text like 'AhKd7c', card ids or Cards."""
+    if isinstance(cards, str):
+        text = cards.replace(' ', '').replace(',', '')
+        parsed = []
+        i = 0
+        while i < len(text):
+            size = 3 if text[i:i + 2] == '10' else 2
+            parsed.append(parse_card(text[i:i + size]))
+            i += size
+        return tuple(parsed)
+    return tuple(card if isinstance(card, int) else card.card_id for card in cards)
+
+def label_combos(label: str):
+    """Every combo of hole card ids for a canonical label like 'AKs'."""
+    high = RANK_LABELS.index(label[0])
+    low = RANK_LABELS.index(label[1])
+    if high == low:
+        return [(high * 4 + s1, low * 4 + s2) for s1 in range(4) for s2 in range(s1 + 1, 4)]
+    if len(label) == 3 and label[2] == 's':
+        return [(high * 4 + suit, low * 4 + suit) for suit in range(4)]
+    if len(label) == 3 and label[2] == 'o':
+        return [(high * 4 + s1, low * 4 + s2) for s1 in range(4) for s2 in range(4) if s1 != s2]
+    return label_combos(label + 's') + label_combos(label + 'o')
+
+def labels_between(first: str, last: str):
+    """Labels from first to last that share a pattern, e.g. A2s to A5s."""
+    suffix = first[2:]
+    if first[0] == first[1]:
+        low, high = sorted((RANK_LABELS.index(first[0]), RANK_LABELS.index(last[0])))
+        return [RANK_LABELS[rank] * 2 for rank in range(low, high + 1)]
+    if first[0] != last[0] or first[2:] != last[2:]:
+        raise ValueError(f'Invalid range: {first}-{last}')
+    low, high = sorted((RANK_LABELS.index(first[1]), RANK_LABELS.index(last[1])))
+    return [first[0] + RANK_LABELS[rank] + suffix for rank in range(low, high + 1)]
+
+def labels_plus(label: str):
+    """Labels for 'QQ+' or 'ATs+'."""
+    high = RANK_LABELS.index(label[0])
+    low = RANK_LABELS.index(label[1])
+    if high == low:
+        return [RANK_LABELS[rank] * 2 for rank in range(low, 13)]
+    return [label[0] + RANK_LABELS[rank] + label[2:] for rank in range(low, high)]
+
+def top_percent(percent: float):
+    """Labels of the best hands by heads-up preflop equity, covering about
+    percent of all combos."""
+    if preflop.default_table is None:
+        preflop.default_table = preflop.PreflopTable()
+    labels = []
+    combos = 0
+    for label in preflop.default_table.ranked_labels(1):
+        if combos >= TOTAL_COMBOS * percent / 100:
+            break
+        labels.append(label)
+        combos += len(label_combos(label))
+    return labels
+
+def normalize_label(text: str):
+    """Put the higher rank first, e.g. 'KA' becomes 'AK'."""
+    text = text.replace('10', 'T')
+    ranks = text[:2].upper()
+    if len(ranks) != 2 or ranks[0] not in RANK_LABELS or ranks[1] not in RANK_LABELS:
+        raise ValueError(f'Invalid hand: {text!r}')
+    if RANK_LABELS.index(ranks[0]) < RANK_LABELS.index(ranks[1]):
+        ranks = ranks[1] + ranks[0]
+    return ranks + text[2:].lower()
+
+def parse_token(token: str):
+    """Combos for one comma separated part of a range."""
+    if token.endswith('%'):
+        labels = top_percent(float(token[:-1]))
+    elif '-' in token:
+        first, last = token.split('-')
+        labels = labels_between(normalize_label(first), normalize_label(last))
+    elif token.endswith('+'):
+        labels = labels_plus(normalize_label(token[:-1]))
+    elif len(token.replace('10', 'T')) == 4 and token[-1].lower() in SUIT_LABELS:
+        return [tuple(sorted(parse_cards(token), reverse=True))]
+    else:
+        labels = [normalize_label(token)]
+    combos = []
+    for label in labels:
+        combos.extend(label_combos(label))
+    return combos
+
+@lru_cache(maxsize=1024)
+def parse_range(text: str):
+    """Parse a range into a tuple of ((card1, card2), weight) pairs."""
+    weights = {}
+    for token in text.split(','):
+        token = token.strip().replace(' ', '')
+        if token == '':
+            continue
+        weight = 1.0
+        if ':' in token:
+            token, weight_text = token.split(':')
+            weight = float(weight_text)
+        if token.lower().startswith('top'):
+            token = token[3:]
+        for combo in parse_token(token):
+            weights[tuple(sorted(combo, reverse=True))] = weight
+    return tuple((combo, weight) for combo, weight in weights.items() if weight > 0)
+
+def live_combos(combos: tuple, dead: set):
+    """Remove combos that use a dead card."""
+    return [(combo, weight) for combo, weight in combos if combo[0] not in dead and combo[1] not in dead]
+
+class WeightedSampler:
+    """Draw combos in proportion to their weights."""
+    def __init__(self, combos: list, rng: GameRandom):
+        self.combos = [combo for combo, weight in combos]
+        self.cumulative = []
+        total = 0.0
+        for combo, weight in combos:
+            total += weight
+            self.cumulative.append(total)
+        self.rng = rng
+
+    def draw(self, count: int):
+        """Draw count combos."""
+        return self.rng.choices(self.combos, self.cumulative, count)
+
+def range_equity(range1: str, range2: str, board='', trials: int = 20000, seed: int = 0):
+    """Equity of range1 against range2 on a board. Combos that conflict with
+    the board or with each other are removed. A full board is enumerated
+    exactly; otherwise the runout is sampled. Results are cached by ranges,
+    board, trials and seed."""
+    return cached_range_equity(range1.replace(' ', ''), range2.replace(' ', ''), parse_cards(board), trials, seed)
+
+@lru_cache(maxsize=4096)
+def cached_range_equity(range1: str, range2: str, board: tuple, trials: int, seed: int):
+    """range_equity with normalized, hashable arguments."""
+    dead = set(board)
+    combos1 = live_combos(parse_range(range1), dead)
+    combos2 = live_combos(parse_range(range2), dead)
+    if len(combos1) == 0 or len(combos2) == 0:
+        raise ValueError('A range has no combos left on this board.')
+    if len(board) == 5:
+        return exact_equity(combos1, combos2, board)
+    rng = GameRandom(seed)
+    sampler1 = WeightedSampler(combos1, rng)
+    sampler2 = WeightedSampler(combos2, rng)
+    missing = 5 - len(board)
+    sample = rng.sample
+    deck = [card for card in range(52) if card not in dead]
+    won = 0.0
+    played = 0
+    drawn = 0
+    batch = 1024
+    while played < trials:
+        if drawn > 100 * trials and played == 0:
+            raise ValueError('The ranges have no combos that can be dealt together.')
+        count = min(batch, trials - played)
+        drawn += count
+        for hand1, hand2 in zip(sampler1.draw(count), sampler2.draw(count)):
+            if hand1[0] in hand2 or hand1[1] in hand2:
+                continue
+            used = (hand1[0], hand1[1], hand2[0], hand2[1])
+            cards = sample(deck, missing + 4)
+            runout = board + tuple(item for item in cards if item not in used)[:missing]
+            score1 = evaluate(hand1 + runout)
+            score2 = evaluate(hand2 + runout)
+            if score1 > score2:
+                won += 1
+            elif score1 == score2:
+                won += 0.5
+            played += 1
+    return won / played
+
+def exact_equity(combos1: list, combos2: list, board: tuple):
+    """Weighted equity of every pair of non-conflicting combos on a full
+    board."""
+    scores2 = [(combo, weight, evaluate(combo + board)) for combo, weight in combos2]
+    won = 0.0
+    total = 0.0
+    for combo1, weight1 in combos1:
+        score1 = evaluate(combo1 + board)
+        for combo2, weight2, score2 in scores2:
+            if combo1[0] in combo2 or combo1[1] in combo2:
+                continue
+            weight = weight1 * weight2
+            total += weight
+            if score1 > score2:
+                won += weight
+            elif score1 == score2:
+                won += weight / 2
+    if total == 0:
+        raise ValueError('The ranges have no combos that can be dealt together.')
+    return won / total
@@ -0,0 +1,138 @@
+"""Seats around a Texas Hold'Em Table. Seats dealt into hands are linked in a
+ring, so moving the button and finding the blinds each hand follows a couple
+of links instead of rebuilding the turn order; players who sit out or bust
+are unlinked and skipped."""
+MAX_SEATS = 10
+
+class SeatRing:
+    """Fixed seats holding Players, with the dealer button."""
+    def __init__(self, players: list = [], size: int = MAX_SEATS):
+        if len(players) > size:
+            raise ValueError(f'A table has at most {size} seats.')
+        self.size = size
+        self.players = [None] * size
+        self.sitting_out = [False] * size
+        self.next_seat = [(seat + 1) % size for seat in range(size)]
+        self.previous_seat = [(seat - 1) % size for seat in range(size)]
+        self.linked = [False] * size
+        self.seat_numbers = {}
+        self.active_count = 0
+        self.button = None
+        for player in players:
+            self.sit(player)
+
+    def __len__(self):
+        return len(self.seat_numbers)
+
+    def seat_of(self, player):
+        """Seat number of a Player, or None."""
+        return self.seat_numbers.get(id(player))
+
+    def is_active(self, seat: int):
+        """Check if a seat is dealt into the next hand."""
+        return self.linked[seat]
+
+    def link(self, seat: int):
+        """Add a seat to the ring between the nearest active seats."""
+        if self.active_count == 0:
+            self.next_seat[seat] = seat
+            self.previous_seat[seat] = seat
+        else:
+            after = (seat + 1) % self.size
+            while not self.linked[after]:
+                after = (after + 1) % self.size
+            before = self.previous_seat[after]
+            self.next_seat[seat] = after
+            self.previous_seat[seat] = before
+            self.next_seat[before] = seat
+            self.previous_seat[after] = seat
+        self.linked[seat] = True
+        self.active_count += 1
+
+    def unlink(self, seat: int):
+        """Remove a seat from the ring."""
+        before = self.previous_seat[seat]
+        after = self.next_seat[seat]
+        self.next_seat[before] = after
+        self.previous_seat[after] = before
+        self.linked[seat] = False
+        self.active_count -= 1
+
+    def sit(self, player, seat: int | None = None):
+        """Seat a Player in a seat, or in the first empty seat. Returns the
+        seat number."""
+        if id(player) in self.seat_numbers:
+            raise ValueError(f'Player {player.name} is already seated.')
+        if seat is None:
+            seat = self.players.index(None) if None in self.players else None
+        if seat is None or self.players[seat] is not None:
+            raise ValueError('No empty seat.')
+        self.players[seat] = player
+        self.seat_numbers[id(player)] = seat
+        self.sitting_out[seat] = False
+        self.link(seat)
+        return seat
+
+    def leave(self, seat: int):
+        """Empty a seat. Returns the Player who left."""
+        player = self.players[seat]
+        if self.linked[seat]:
+            self.unlink(seat)
+        self.players[seat] = None
+        self.sitting_out[seat] = False
+        self.seat_numbers.pop(id(player))
+        return player
+
+    def sit_out(self, seat: int):
+        """Stop dealing a seat into hands, e.g. when its Player is busted."""
+        if self.linked[seat]:
+            self.unlink(seat)
+        self.sitting_out[seat] = True
+
+    def sit_in(self, seat: int):
+        """Deal a sitting out seat into hands again."""
+        if self.players[seat] is not None and not self.linked[seat]:
+            self.link(seat)
+        self.sitting_out[seat] = False
+
+    def next_active(self, seat: int):
+        """First active seat after seat. If the seat itself isn't active, the
+        seats after it are searched in order."""
+        if self.linked[seat]:
+            return self.next_seat[seat]
+        seat = (seat + 1) % self.size
+        while not self.linked[seat]:
+            seat = (seat + 1) % self.size
+        return seat
+
+    def advance_button(self):
+        """Move the button to the next active seat. Returns the button."""
+        if self.active_count == 0:
+            raise ValueError('No active seats.')
+        if self.button is None:
+            self.button = self.next_active(self.size - 1)
+        else:
+            self.button = self.next_active(self.button)
+        return self.button
+
+    def blinds(self):
+        """Small and big blind seats for the current button. Heads up, the
+        button posts the small blind."""
+        if self.active_count == 2:
+            small = self.button
+        else:
+            small = self.next_seat[self.button]
+        return small, self.next_seat[small]
+
+    def hand_seats(self):
+        """Active seats in order from the button."""
+        seats = [self.button]
+        seat = self.next_seat[self.button]
+        while seat != self.button:
+            seats.append(seat)
+            seat = self.next_seat[seat]
+        return seats
+
+    def hand_players(self):
+        """Active Players in order from the button."""
+        return [self.players[seat] for seat in self.hand_seats()]
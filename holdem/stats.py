@@ -0,0 +1,162 @@
+"""Player statistics for Texas Hold'Em: VPIP, PFR, aggression factor and
+big blinds won per 100 hands. Each action and each finished hand updates a
+few counters, and finished hands can be appended to a history file of one
+JSON line per hand, so stats across sessions come from summing the lines
+one at a time without loading the whole history."""
+import json
+import os
+from holdem.betting import Action, Street
+from money import Money
+
+class PlayerStats:
+    """Running totals for one player. net is in Money minor units."""
+    __slots__ = ('hands', 'vpip_hands', 'pfr_hands', 'aggressive', 'calls', 'net', 'big_blinds_won')
+
+    def __init__(self):
+        self.hands = 0
+        self.vpip_hands = 0
+        self.pfr_hands = 0
+        self.aggressive = 0
+        self.calls = 0
+        self.net = 0
+        self.big_blinds_won = 0.0
+
+    def add_hand(self, vpip: bool, pfr: bool, aggressive: int, calls: int, net: int, big_blind: int):
+        """Add one finished hand."""
+        self.hands += 1
+        self.vpip_hands += vpip
+        self.pfr_hands += pfr
+        self.aggressive += aggressive
+        self.calls += calls
+        self.net += net
+        self.big_blinds_won += net / big_blind if big_blind else 0.0
+
+    def merge(self, other):
+        """Add another player's totals to these."""
+        self.hands += other.hands
+        self.vpip_hands += other.vpip_hands
+        self.pfr_hands += other.pfr_hands
+        self.aggressive += other.aggressive
+        self.calls += other.calls
+        self.net += other.net
+        self.big_blinds_won += other.big_blinds_won
+
+    @property
+    def vpip(self):
+        """Fraction of hands where chips went in voluntarily preflop."""
+        return self.vpip_hands / self.hands if self.hands else 0.0
+
+    @property
+    def pfr(self):
+        """Fraction of hands with a preflop bet or raise."""
+        return self.pfr_hands / self.hands if self.hands else 0.0
+
+    @property
+    def aggression_factor(self):
+        """Bets and raises per call. Infinite if the player never called."""
+        if self.calls == 0:
+            return float('inf') if self.aggressive else 0.0
+        return self.aggressive / self.calls
+
+    @property
+    def bb_per_100(self):
+        """Big blinds won per 100 hands."""
+        return self.big_blinds_won * 100 / self.hands if self.hands else 0.0
+
+    def summary(self):
+        """Stats as a dict."""
+        return {
+            'hands': self.hands,
+            'vpip': self.vpip,
+            'pfr': self.pfr,
+            'aggression_factor': self.aggression_factor,
+            'bb_per_100': self.bb_per_100,
+            'net': Money(self.net)
+        }
+
+class StatsTracker:
+    """Stats by player name, fed actions as a hand is played. If
+    history_path is given, each finished hand is appended to it, and
+    load_history adds the hands of earlier sessions."""
+    def __init__(self, history_path: str | None = None):
+        self.players = {}
+        self.history_path = history_path
+        self.history_file = None
+        self.big_blind = 0
+        self.current = {}
+
+    def load_history(self):
+        """Add the stats of every hand in the history file."""
+        if self.history_path is not None and os.path.exists(self.history_path):
+            self.merge(aggregate_history([self.history_path]))
+
+    def get(self, name: str):
+        """Stats of a player, created if needed."""
+        stats = self.players.get(name)
+        if stats is None:
+            stats = self.players[name] = PlayerStats()
+        return stats
+
+    def start_hand(self, names: list, big_blind: int):
+        """Start tracking a hand between players."""
+        self.big_blind = int(big_blind)
+        self.current = {name: [False, False, 0, 0] for name in names}
+
+    def record_action(self, name: str, action: Action, street: Street):
+        """Count an action. Posting a blind isn't an action."""
+        hand = self.current[name]
+        if action == Action.CALL:
+            hand[3] += 1
+            if street == Street.PREFLOP:
+                hand[0] = True
+        elif action == Action.BET or action == Action.RAISE:
+            hand[2] += 1
+            if street == Street.PREFLOP:
+                hand[0] = True
+                hand[1] = True
+
+    def end_hand(self, net: dict):
+        """Finish the hand with the chips each player won or lost."""
+        players = {}
+        for name, (vpip, pfr, aggressive, calls) in self.current.items():
+            won = int(net.get(name, 0))
+            self.get(name).add_hand(vpip, pfr, aggressive, calls, won, self.big_blind)
+            players[name] = [int(vpip), int(pfr), aggressive, calls, won]
+        if self.history_path is not None:
+            if self.history_file is None:
+                directory = os.path.dirname(self.history_path)
+                if directory != '':
+                    os.makedirs(directory, exist_ok=True)
+                self.history_file = open(self.history_path, 'a')
+            self.history_file.write(json.dumps({'bb': self.big_blind, 'players': players}) + '\n')
+            self.history_file.flush()
+        self.current = {}
+
+    def close(self):
+        """Flush and close the history file."""
+        if self.history_file is not None:
+            self.history_file.close()
+            self.history_file = None
+
+    def merge(self, other):
+        """Add another tracker's stats to these."""
+        for name, stats in other.players.items():
+            self.get(name).merge(stats)
+
+    def summary(self):
+        """Stats of every player as dicts, by name."""
+        return {name: stats.summary() for name, stats in self.players.items()}
+
+def aggregate_history(paths: list):
+    """Stats from history files, read one hand at a time."""
+    tracker = StatsTracker()
+    for path in paths:
+        with open(path) as file:
+            for line in file:
+                if line.strip() == '':
+                    continue
+                hand = json.loads(line)
+                big_blind = hand['bb']
+                for name, (vpip, pfr, aggressive, calls, net) in hand['players'].items():
+                    tracker.get(name).add_hand(vpip, pfr, aggressive, calls, net, big_blind)
+    return tracker
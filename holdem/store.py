@@ -0,0 +1,142 @@
+"""SQLite store for Texas Hold'Em players, chip balances and session
+results. The database runs in WAL mode so readers don't block the writer,
+connections come from a small pool and keep their prepared statements
+cached, and saves are batched with executemany in one transaction."""
+from contextlib import contextmanager
+from queue import Queue
+import sqlite3
+import time
+from money import Money
+from holdem.table import PlayerTexasHoldEm
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    name TEXT PRIMARY KEY,
+    chips INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    started REAL NOT NULL,
+    ended REAL
+);
+CREATE TABLE IF NOT EXISTS session_results (
+    session_id INTEGER NOT NULL REFERENCES sessions (id),
+    name TEXT NOT NULL REFERENCES players (name),
+    buy_in INTEGER NOT NULL,
+    cash_out INTEGER NOT NULL,
+    hands INTEGER NOT NULL,
+    PRIMARY KEY (session_id, name)
+);
+"""
+SAVE_PLAYER = 'INSERT INTO players (name, chips) VALUES (?, ?) ON CONFLICT (name) DO UPDATE SET chips = excluded.chips'
+LOAD_PLAYER = 'SELECT chips FROM players WHERE name = ?'
+LOAD_ALL_PLAYERS = 'SELECT name, chips FROM players ORDER BY name'
+LOAD_PLAYERS = 'SELECT name, chips FROM players WHERE name IN ({})'
+NAMES_PER_QUERY = 500
+START_SESSION = 'INSERT INTO sessions (started) VALUES (?)'
+END_SESSION = 'UPDATE sessions SET ended = ? WHERE id = ?'
+SAVE_RESULT = ('INSERT INTO session_results (session_id, name, buy_in, cash_out, hands) VALUES (?, ?, ?, ?, ?) '
+               'ON CONFLICT (session_id, name) DO UPDATE SET cash_out = excluded.cash_out, hands = excluded.hands')
+LOAD_RESULTS = 'SELECT name, buy_in, cash_out, hands FROM session_results WHERE session_id = ? ORDER BY name'
+
+class ConnectionPool:
+    """A fixed number of connections to one database, shared between
+    threads."""
+    def __init__(self, path: str, size: int = 4):
+        self.path = path
+        self.connections = Queue()
+        for i in range(size):
+            self.connections.put(self.connect())
+
+    def connect(self):
+        """Open a connection in WAL mode."""
+        connection = sqlite3.connect(self.path, check_same_thread=False, cached_statements=256)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute('PRAGMA foreign_keys=ON')
+        return connection
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection inside a transaction, committed on success and
+        rolled back on error."""
+        connection = self.connections.get()
+        try:
+            with connection:
+                yield connection
+        finally:
+            self.connections.put(connection)
+
+    def close(self):
+        """Close every connection."""
+        while not self.connections.empty():
+            self.connections.get().close()
+
+class PlayerStore:
+    """Players, their chip balances and session results in a SQLite
+    database. Chip amounts are stored as Money minor units."""
+    def __init__(self, path: str, pool_size: int = 4):
+        self.pool = ConnectionPool(path, pool_size)
+        with self.pool.connection() as connection:
+            connection.executescript(SCHEMA)
+
+    def save_players(self, players: list):
+        """Save the chip balance of every Player in one transaction."""
+        with self.pool.connection() as connection:
+            connection.executemany(SAVE_PLAYER, ((player.name, int(player.chips.chip_value)) for player in players))
+
+    def save_balances(self, balances: dict):
+        """Save chip balances by Player name in one transaction."""
+        with self.pool.connection() as connection:
+            connection.executemany(SAVE_PLAYER, ((name, int(chips)) for name, chips in balances.items()))
+
+    def load_balance(self, name: str):
+        """Chip balance of a Player, or None if they haven't been saved."""
+        with self.pool.connection() as connection:
+            row = connection.execute(LOAD_PLAYER, (name,)).fetchone()
+        return None if row is None else Money(row[0])
+
+    def load_balances(self, names: list | None = None):
+        """Chip balances by name of the saved Players among names, or of every
+        saved Player. Names are looked up NAMES_PER_QUERY at a time, to stay
+        under SQLite's limit on query parameters."""
+        with self.pool.connection() as connection:
+            if names is None:
+                rows = connection.execute(LOAD_ALL_PLAYERS).fetchall()
+            else:
+                names = list(names)
+                rows = []
+                for start in range(0, len(names), NAMES_PER_QUERY):
+                    batch = names[start:start + NAMES_PER_QUERY]
+                    rows += connection.execute(LOAD_PLAYERS.format(', '.join('?' * len(batch))), batch).fetchall()
+        return {name: Money(chips) for name, chips in rows}
+
+    def load_players(self, table=None):
+        """Every saved Player, with their chips."""
+        return [PlayerTexasHoldEm(name, table, chips) for name, chips in self.load_balances().items()]
+
+    def start_session(self):
+        """Start a session. Returns its id."""
+        with self.pool.connection() as connection:
+            return connection.execute(START_SESSION, (time.time(),)).lastrowid
+
+    def save_results(self, session_id: int, results: list):
+        """Save (name, buy_in, cash_out, hands) results for a session in one
+        transaction. The Players must be saved first."""
+        with self.pool.connection() as connection:
+            connection.executemany(SAVE_RESULT, ((session_id, name, int(buy_in), int(cash_out), hands) for name, buy_in, cash_out, hands in results))
+
+    def end_session(self, session_id: int):
+        """Mark a session as ended."""
+        with self.pool.connection() as connection:
+            connection.execute(END_SESSION, (time.time(), session_id))
+
+    def load_results(self, session_id: int):
+        """(name, buy_in, cash_out, hands) results of a session."""
+        with self.pool.connection() as connection:
+            rows = connection.execute(LOAD_RESULTS, (session_id,)).fetchall()
+        return [(name, Money(buy_in), Money(cash_out), hands) for name, buy_in, cash_out, hands in rows]
+
+    def close(self):
+        """Close the database."""
+        self.pool.close()
@@ -0,0 +1,296 @@
+"""Chips, Pool, Players and the Table for Texas Hold'Em."""
+import os
+import time
+from rng import GameRandom
+from money import Money
+from holdem.board import BoardAnalyzer
+from holdem.cards import Card, Deck, Suit
+
+ ### CHIPS ###
+class Chips:
+    """Chips for playing Poker games. Values are Money; starting_chip_value
+    is Money, text in major units like '100.50' or an int in minor units."""
+    def __init__(self, player, table, starting_chip_value: int | str | Money):
+        self.player = player
+        self.table = table
+        self.chip_value = Money.parse(starting_chip_value)
+        self.current_bet_final = Money(0)
+        self.current_bet_draft = Money(0)
+        self.last_bet = Money(0)
+
+    def add_current_bet_to_pool(self):
+        """Add the final current bet to the Player's bet."""
+        self.table.pool.add_player_bet(self.player.name, self.current_bet_final)
+
+    def reset_bets(self):
+        """Reset the Player's bets to 0 and set the last bet based
+        on the previous final current bet."""
+        self.last_bet = self.current_bet_final
+        self.table.pool.player_bets[self.player.name] = Money(0)
+        self.current_bet_final = Money(0)
+        self.current_bet_draft = Money(0)
+
+    def set_bet(self, amount: Money):
+        """Set bet and confirm."""
+        self.current_bet_draft = amount
+        user_input = input(f'Confirm your bet of {self.current_bet_draft} (y/n). ')
+        if user_input == 'y':
+            self.current_bet_final += self.current_bet_draft
+            self.current_bet_draft = Money(0)
+        elif user_input == 'n':
+            self.set_bet(amount)
+        else:
+            print('Invalid selection!')
+            self.set_bet(amount)
+
+ ### POOL ###
+class Pool:
+    """Chip Pool. Values are Money; blinds is parsed like Money.parse. If a
+    ChipLedger is given, every bet is recorded in it."""
+    def __init__(self, blinds: int | str | Money, ledger=None):
+        self.ledger = ledger
+        self.total_value = Money(0)
+        self.player_bets = {}
+        self.blinds = Money.parse(blinds)
+        self.call_value = self.blinds
+
+    def add_player(self, player):
+        """Add Player to the Pool."""
+        self.player_bets[player.name] = Money(0)
+
+    def add_players(self, players: list):
+        """Add multiple Players to the Pool."""
+        for player in players:
+            self.add_player(player)
+
+    def add_player_bet(self, player: str, amount: Money):
+        """Increase Player bet by an amount."""
+        self.player_bets[player] += amount
+        self.total_value += amount
+        if self.ledger is not None:
+            self.ledger.bet(player, amount)
+        self.raise_bet(self.player_bets[player])
+
+    def remove_player(self, player: str):
+        """Remove Player from the Pool"""
+        if player in self.player_bets:
+            self.player_bets.pop(player)
+
+    def raise_bet(self, new_bet: Money):
+        """Add a BET to the Pool"""
+        self.call_value = new_bet
+
+ ### PLAYER TEXAS HOLD'EM ###
+class PlayerTexasHoldEm:
+    """Player"""
+    name = None
+    hand = (None,None)
+    table = None
+    chips = 0
+    points = 0
+
+    def __init__(self, name: str, table = None, starting_chips: int | str | Money = Money.major(100)):
+        self.name = name
+        self.table = table
+        self.chips = Chips(self, self.table, starting_chips)
+
+    def check_table_error(self):
+        """Raise LookupError if check_table method fails."""
+        raise LookupError("""Method check_table() failed. Make sure table attribute
+                          contains source Player in its players attribute.""")
+
+    def check_table(self):
+        """Check if Player is a member of the Table they're playing on."""
+        for player in self.table.players:
+            if self == player:
+                return True
+        return False
+
+    def set_table(self, new_table):
+        """Set the Table the Player is playing on."""        
+        self.table = new_table
+
+    def discard_hand(self, discard_pile=None):
+        """Discard the Player's hand. If discard_pile is input, move cards to
+        the discard_pile before discarding the Player's hand."""
+        if discard_pile is not None:
+            discard_pile.extend([self.hand[0], self.hand[1]])
+        self.hand = (None, None)
+
+    def draw_cards(self, deck: Deck):
+        """Draw the top card from the deck."""
+        self.hand = (deck.cards.pop(0), deck.cards.pop(0))
+
+    def print_hand(self):
+        """Print the Player's hand to the console."""
+        print(self.name+'\'s Hand:')
+        for item in self.hand:
+            item.print_card()
+
+    def peek_cards(self):
+        """View cards for only 1.5 seconds"""
+        self.print_hand()
+        time.sleep(1.5)
+        os.system('clear')
+
+ ### TABLE ###
+class Table:
+    """Table for playing card games/Dealer. If rng is given, the Table's
+    Deck is shuffled with it."""
+    def __init__(self, deck: Deck, players = [], rng: GameRandom | None = None):
+        self.deck = deck
+        if rng is not None:
+            self.deck.rng = rng
+        self.discard_pile = []
+        self.players = players
+        if self.players is not None:
+            self.set_player_table()
+        self.pool = Pool(Money.major(10))
+        self.revealed_cards = []
+        self.revealed_cards_string = ''
+        self.board = BoardAnalyzer()
+
+    def set_blinds(self, blinds: int | str | Money):
+        """Set blinds for beginning a hand, in major units."""
+        self.pool.blinds = Money.parse(blinds)
+
+    def award_pot(self, player, amount: Money):
+        """Move chips from the Pool to a Player."""
+        player.chips.chip_value += amount
+        self.pool.total_value -= amount
+        if self.pool.ledger is not None:
+            self.pool.ledger.award(player.name, amount)
+
+    def shuffle_deck(self):
+        """Shuffle Table Deck"""
+        self.deck.shuffle()
+
+    def list_players(self):
+        """List players and the index associated with each one"""
+        p_value = 0
+        for player in self.players:
+            print(p_value, player.name)
+            p_value += 1
+
+    def reveal_card(self):
+        """Reveal a single card"""
+        card = self.deck.cards.pop(0)
+        self.revealed_cards.append(card)
+        self.board.add_card(card.card_id)
+
+    def return_revealed_cards(self):
+        """Move the revealed cards back to the Deck and reset the board."""
+        self.deck.cards.extend(self.revealed_cards)
+        self.revealed_cards.clear()
+        self.board.reset()
+
+    def analyze_player(self, player):
+        """Draws and outs for a Player's hand on the revealed cards."""
+        return self.board.analyze((player.hand[0].card_id, player.hand[1].card_id))
+
+    def reveal_three(self):
+        """Initial card reveal"""
+        for i in range(3):
+            self.reveal_card()
+
+    def reveal_card_and_print(self):
+        """Reveal a card and print all revealed cards to the console"""
+        self.reveal_card()
+        revealed = enumerate(self.revealed_cards)
+        print('TABLE:')
+        for i in revealed:
+            print(str(i[0]+1)+'.', i[1].value, i[1].suit.name)
+
+    def print_revealed_cards(self):
+        """Print each revealed card to the console."""
+        for card in self.revealed_cards:
+            print(card[0].value, card[0].suit.name)
+
+    def create_revealed_cards_string(self):
+        """Create revealed cards string for printing."""
+        cards = enumerate(self.revealed_cards)
+        self.revealed_cards_string = ''
+        for item in cards:
+            self.revealed_cards_string += item[1].value+' '+item[1].suit.name+'\n'
+
+    def deal_cards(self):
+        """Deal cards to each player"""
+        for player in self.players:
+            player.draw_cards(self.deck)
+
+    def add_card(self, card: Card):
+        """Add Card to Deck on Table"""
+        self.deck.add_card(card)
+
+    def reform_deck(self):
+        """Add cards from Players' hands and the discard pile back to the
+        Deck on the Table"""
+        for player in self.players:
+            if player.hand[0] is not None:
+                player.discard_hand(self.deck.cards)
+        self.deck.cards.extend(self.discard_pile)
+        self.discard_pile.clear()
+
+    def set_player_table(self):
+        """Set Player's table to self."""
+        for item in self.players:
+            item.set_table(self)
+
+ ### TEXAS HOLD'EM POINTS ###
+class TexasHoldEmPoints:
+    """Point system for figuring out who wins a hand"""
+    points = 0
+    suit_points = 0
+    cards = None
+    points_list = {
+        'High Card Four': 0.01, # 0.01
+        'High Card Ace': 0.12, # 0.12
+        'High Card Rules': 'Four is the lowest high card, therefore 4 is 0.01 and A is 0.12',
+        'Pair of Twos': (2/100)*7, # 0.14
+        'Pair of Aces': (14/100)*7, # 0.98 
+        'Pair Rules': 'Value of the card (2)/100, then multiplied by 7',
+        'Two Pairs Twos Threes': (2+3)/5, # 1
+        'Two Pairs Kings Aces': (13+14)/5, # 27/5 or 5.4
+        'Two Pairs Rules': 'Add card values together, then divide by 5.',
+        'Three of a Kind Twos': (2+2+2), # 6
+        'Three of a Kind Aces': (14+14+14), # 42
+        'Three of a Kind Rules': """Multiply the values of all three cards, 
+                                 then raise that to the power of 3.""",
+        'Straight 2-3-4-5-6': ((2+3+4+5+6)*2)+3, # 43
+        'Straight 10-J-Q-K-A': ((10+11+12+13+14)*2)+3, # 123
+        'Straight Rules': """Add all values of cards in the straight together, 
+                          multiply by 2, then add 3.""",
+        'Flush 2-3-4-5-7': 123+7, # 129
+        'Flush 2-3-5-10-A': 123+14, # 137
+    }
+    sorted_values = {
+        '2': [],
+        '3': [],
+        '4': [],
+        '5': [],
+        '6': [],
+        '7': [],
+        '8': [],
+        '9': [],
+        '10': [],
+        'J': [],
+        'Q': [],
+        'K': [],
+        'A': []
+    }
+    sorted_suits = {
+        Suit.SPADES: [],
+        Suit.HEARTS: [],
+        Suit.DIAMONDS: [],
+        Suit.CLUBS: []
+    }
+
+    def create_card_tuple(self, cards: list):
+        """Create a tuple from the """
+        self.cards = tuple(cards)
+
+    def assign_value_suit_lists(self):
+        """Assign cards to lists to begin counting Player's points"""
+        for card in self.cards:
+            self.sorted_values[card.value].append(card)
+            self.sorted_suits[card.suit].append(card)
@@ -0,0 +1,162 @@
+"""Counters and latency histograms for the game engines. Instrumentation is
+off by default: hooks check one flag, and timers return a shared no-op
+context manager, so a disabled hook costs a method call. When enabled,
+a snapshot can be written to a local file as JSON or in the Prometheus text
+format.
+
+    from instrumentation import instruments
+    instruments.enable()
+    with instruments.timer('holdem.deal'):
+        ...
+    instruments.count('gameplay.graveyard_moves')
+    instruments.write_prometheus('metrics.prom')"""
+from bisect import bisect_left
+import json
+import os
+import re
+import time
+
+# Upper bounds in seconds, from 1 microsecond to 10 seconds.
+BUCKETS = (0.000001, 0.0000025, 0.000005, 0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+           0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class Histogram:
+    """Counts of observed values in fixed buckets, with their sum."""
+    __slots__ = ('counts', 'total', 'count')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        """Add a value."""
+        self.counts[bisect_left(BUCKETS, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def snapshot(self):
+        """Cumulative bucket counts by upper bound, the sum and the count."""
+        buckets = {}
+        cumulative = 0
+        for bound, count in zip(BUCKETS + (float('inf'),), self.counts):
+            cumulative += count
+            buckets['+Inf' if bound == float('inf') else repr(bound)] = cumulative
+        return {'buckets': buckets, 'sum': self.total, 'count': self.count}
+
+class NullTimer:
+    """Timer used while instrumentation is disabled."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        return False
+
+NULL_TIMER = NullTimer()
+
+class Timer:
+    """Adds the time spent inside a with block to a histogram."""
+    __slots__ = ('histogram', 'start')
+
+    def __init__(self, histogram: Histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exception):
+        self.histogram.observe(time.perf_counter() - self.start)
+        return False
+
+class Instruments:
+    """Named counters and latency histograms."""
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.counters = {}
+        self.histograms = {}
+
+    def enable(self):
+        """Start recording."""
+        self.enabled = True
+
+    def disable(self):
+        """Stop recording. Recorded values are kept."""
+        self.enabled = False
+
+    def reset(self):
+        """Forget every recorded value."""
+        self.counters.clear()
+        self.histograms.clear()
+
+    def count(self, name: str, amount: int = 1):
+        """Add to a counter."""
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def histogram(self, name: str):
+        """Histogram for a name, created if needed."""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        return histogram
+
+    def observe(self, name: str, seconds: float):
+        """Add a latency to a histogram."""
+        if self.enabled:
+            self.histogram(name).observe(seconds)
+
+    def timer(self, name: str):
+        """Context manager timing a with block into a histogram."""
+        if not self.enabled:
+            return NULL_TIMER
+        return Timer(self.histogram(name))
+
+    def snapshot(self):
+        """Every counter and histogram as a dict."""
+        return {
+            'counters': dict(self.counters),
+            'histograms': {name: histogram.snapshot() for name, histogram in self.histograms.items()}
+        }
+
+    def prometheus_text(self):
+        """Snapshot in the Prometheus text exposition format. Dots in names
+        become underscores and latencies are in seconds."""
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            metric = metric_name(name) + '_total'
+            lines.append(f'# TYPE {metric} counter')
+            lines.append(f'{metric} {value}')
+        for name, histogram in sorted(self.histograms.items()):
+            metric = metric_name(name) + '_seconds'
+            data = histogram.snapshot()
+            lines.append(f'# TYPE {metric} histogram')
+            for bound, count in data['buckets'].items():
+                lines.append(f'{metric}_bucket{{le="{bound}"}} {count}')
+            lines.append(f'{metric}_sum {data["sum"]!r}')
+            lines.append(f'{metric}_count {data["count"]}')
+        return '\n'.join(lines) + '\n'
+
+    def write_json(self, path: str):
+        """Write a snapshot to a JSON file."""
+        write_atomic(path, json.dumps(self.snapshot(), indent=2))
+
+    def write_prometheus(self, path: str):
+        """Write a snapshot to a Prometheus text file."""
+        write_atomic(path, self.prometheus_text())
+
+def metric_name(name: str):
+    """Prometheus metric name for an instrument name."""
+    return re.sub(r'[^a-zA-Z0-9_]', '_', name)
+
+def write_atomic(path: str, text: str):
+    """Replace a file's contents in one step, so readers never see a partial
+    snapshot."""
+    temporary_path = path + '.tmp'
+    with open(temporary_path, 'w') as file:
+        file.write(text)
+    os.replace(temporary_path, path)
+
+instruments = Instruments()
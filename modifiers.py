@@ -0,0 +1,77 @@
+"""Layered STR/FOR modifiers for creatures in play. Each layer keeps its
+modifiers by source and a running total, and the effective stats are cached,
+so reading a creature's STR or FOR doesn't add up its active effects."""
+from enum import Enum
+
+class Layer(Enum):
+    """Modifier layers. BASE holds permanent changes, AURA holds changes from
+    auras in play and END_OF_TURN holds changes that last until the end of
+    the turn."""
+    BASE = 0
+    AURA = 1
+    END_OF_TURN = 2
+
+class StatModifiers:
+    """Modifier stack for one creature. The effective stats are kept in
+    StatModifiers.strength, StatModifiers.fortitude and
+    StatModifiers.max_fortitude and are updated only when a modifier is
+    added or removed or the creature takes damage."""
+    __slots__ = ('base_strength', 'base_fortitude', 'damage', 'sources', 'layer_strength',
+                 'layer_fortitude', 'strength', 'fortitude', 'max_fortitude')
+
+    def __init__(self, strength: int | None, fortitude: int | None):
+        self.base_strength = strength or 0
+        self.base_fortitude = fortitude or 0
+        self.damage = 0
+        self.sources = ({}, {}, {})
+        self.layer_strength = [0, 0, 0]
+        self.layer_fortitude = [0, 0, 0]
+        self.strength = self.base_strength
+        self.fortitude = self.base_fortitude
+        self.max_fortitude = self.base_fortitude
+
+    def update(self):
+        """Recalculate the cached effective stats."""
+        self.strength = self.base_strength + self.layer_strength[0] + self.layer_strength[1] + self.layer_strength[2]
+        self.max_fortitude = self.base_fortitude + self.layer_fortitude[0] + self.layer_fortitude[1] + self.layer_fortitude[2]
+        self.fortitude = self.max_fortitude - self.damage
+
+    def add(self, layer: Layer, source, strength: int = 0, fortitude: int = 0):
+        """Add a STR/FOR modifier from a source to a layer. Modifiers from the
+        same source in the same layer add together."""
+        sources = self.sources[layer.value]
+        current = sources.get(source, (0, 0))
+        sources[source] = (current[0] + strength, current[1] + fortitude)
+        self.layer_strength[layer.value] += strength
+        self.layer_fortitude[layer.value] += fortitude
+        self.update()
+
+    def remove(self, layer: Layer, source):
+        """Remove every modifier from a source in a layer."""
+        modifier = self.sources[layer.value].pop(source, None)
+        if modifier is not None:
+            self.layer_strength[layer.value] -= modifier[0]
+            self.layer_fortitude[layer.value] -= modifier[1]
+            self.update()
+
+    def clear(self, layer: Layer):
+        """Remove every modifier in a layer."""
+        if len(self.sources[layer.value]) != 0:
+            self.sources[layer.value].clear()
+            self.layer_strength[layer.value] = 0
+            self.layer_fortitude[layer.value] = 0
+            self.update()
+
+    def set_strength(self, strength: int):
+        """Set the effective STR by permanently changing the base STR."""
+        self.base_strength += strength - self.strength
+        self.update()
+
+    def set_fortitude(self, fortitude: int):
+        """Set the effective FOR by changing the damage taken. Healing past
+        the max FOR permanently raises the base FOR."""
+        self.damage = self.max_fortitude - fortitude
+        if self.damage < 0:
+            self.base_fortitude -= self.damage
+            self.damage = 0
+        self.update()
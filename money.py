@@ -0,0 +1,104 @@
+"""Fixed-point money for chip accounting. Amounts are ints in minor units
+(cents), so adding up bets, pots and ledgers is exact integer math with no
+float rounding or string coercion."""
+from decimal import Decimal, InvalidOperation
+
+MINOR_UNITS = 100
+
+class Money(int):
+    """An amount in minor units. Arithmetic with ints or Money gives Money,
+    treating ints as minor units; str() and f-strings show major units, e.g.
+    Money(1050) is '10.50'."""
+    __slots__ = ()
+
+    @classmethod
+    def parse(cls, value):
+        """Money from an int in minor units, like in arithmetic, or from
+        major units: a float, Decimal or text like '10', '10.5' or
+        '$1,000.25'. Raises ValueError for anything that isn't a whole number
+        of minor units."""
+        if isinstance(value, Money):
+            return value
+        if isinstance(value, int):
+            return cls(value)
+        text = str(value).strip().replace('$', '').replace(',', '')
+        try:
+            amount = Decimal(text) * MINOR_UNITS
+        except InvalidOperation:
+            raise ValueError(f'Invalid amount: {value!r}') from None
+        if not amount.is_finite() or amount != amount.to_integral_value():
+            raise ValueError(f'Invalid amount: {value!r}')
+        return cls(int(amount))
+
+    @classmethod
+    def major(cls, units: int):
+        """Money from whole major units, e.g. Money.major(10) is '10.00'."""
+        return cls(units * MINOR_UNITS)
+
+    @classmethod
+    def total(cls, amounts):
+        """Sum of many amounts, added as plain ints."""
+        return cls(sum(map(int, amounts)))
+
+    def parts(self):
+        """Whole major units and the remaining minor units."""
+        return divmod(int(self), MINOR_UNITS)
+
+    def __str__(self):
+        units, cents = divmod(abs(int(self)), MINOR_UNITS)
+        sign = '-' if self < 0 else ''
+        return f'{sign}{units}.{cents:02d}'
+
+    def __repr__(self):
+        return f'Money({str(self)!r})'
+
+    def __format__(self, spec: str):
+        if spec == '':
+            return str(self)
+        return format(self.decimal(), spec)
+
+    def decimal(self):
+        """The amount in major units as an exact Decimal."""
+        return (Decimal(int(self)) / MINOR_UNITS).quantize(Decimal(1) / MINOR_UNITS)
+
+    def __add__(self, other):
+        if not isinstance(other, int):
+            return NotImplemented
+        return Money(int(self) + other)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if not isinstance(other, int):
+            return NotImplemented
+        return Money(int(self) - other)
+
+    def __rsub__(self, other):
+        if not isinstance(other, int):
+            return NotImplemented
+        return Money(other - int(self))
+
+    def __mul__(self, other):
+        if not isinstance(other, int):
+            return NotImplemented
+        return Money(int(self) * other)
+
+    __rmul__ = __mul__
+
+    def __floordiv__(self, other):
+        if not isinstance(other, int):
+            return NotImplemented
+        if isinstance(other, Money):
+            return int(self) // int(other)
+        return Money(int(self) // other)
+
+    def __mod__(self, other):
+        if not isinstance(other, int):
+            return NotImplemented
+        return Money(int(self) % other)
+
+    def __neg__(self):
+        return Money(-int(self))
+
+    def __abs__(self):
+        return Money(abs(int(self)))
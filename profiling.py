@@ -0,0 +1,110 @@
+"""Profiling for headless simulation runs. A Profiler captures either a
+cProfile run ('cprofile') or periodic stack samples of the profiled thread
+('sample'), as collapsed stacks: 'outer;inner;innermost' mapped to a
+weight. Collapsed stacks from worker processes add together, and
+write_collapsed writes them in the format flamegraph.pl, speedscope and
+inferno read.
+
+cProfile only records which function called which, so its stacks are
+caller;callee pairs weighted by the microseconds spent in the callee's own
+code. Samples give full stacks weighted by sample count."""
+from collections import Counter
+import cProfile
+import os
+import sys
+import threading
+
+MODES = ('cprofile', 'sample')
+
+def frame_label(code):
+    """Name of a function in a collapsed stack."""
+    return f'{os.path.basename(code.co_filename)}:{code.co_name}'
+
+def function_label(key: tuple):
+    """Name of a cProfile (file, line, function) key in a collapsed stack."""
+    filename, line, name = key
+    if filename == '~':
+        return name
+    return f'{os.path.basename(filename)}:{name}'
+
+class Profiler:
+    """Profile the thread that starts it, in 'cprofile' or 'sample' mode.
+    Samples are taken every interval seconds."""
+    def __init__(self, mode: str = 'sample', interval: float = 0.001):
+        if mode not in MODES:
+            raise ValueError(f'Profile mode must be one of {MODES}.')
+        self.mode = mode
+        self.interval = interval
+        self.stacks = Counter()
+        self.profile = None
+        self.thread = None
+        self.stopped = threading.Event()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exception):
+        self.stop()
+        return False
+
+    def start(self):
+        """Start profiling."""
+        if self.mode == 'cprofile':
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        else:
+            self.stopped.clear()
+            self.thread = threading.Thread(target=self.sample, args=(threading.get_ident(),), daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        """Stop profiling and add what was captured to the stacks. Returns
+        the stacks."""
+        if self.mode == 'cprofile':
+            self.profile.disable()
+            self.profile.create_stats()
+            for key, (calls, total_calls, own_time, cumulative_time, callers) in self.profile.stats.items():
+                if len(callers) == 0:
+                    self.stacks[function_label(key)] += round(own_time * 1000000)
+                for caller, caller_stats in callers.items():
+                    self.stacks[function_label(caller) + ';' + function_label(key)] += round(caller_stats[2] * 1000000)
+            self.profile = None
+        else:
+            self.stopped.set()
+            self.thread.join()
+            self.thread = None
+        return self.stacks
+
+    def sample(self, thread_id: int):
+        """Record the profiled thread's stack every interval until stopped."""
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            labels = []
+            while frame is not None:
+                labels.append(frame_label(frame.f_code))
+                frame = frame.f_back
+            if len(labels) != 0:
+                self.stacks[';'.join(reversed(labels))] += 1
+
+def profiled_call(mode: str, function, *args):
+    """Call a function under a Profiler, e.g. in a worker process. Returns
+    the result and the collapsed stacks."""
+    with Profiler(mode) as profiler:
+        result = function(*args)
+    return result, profiler.stacks
+
+def merge(stacks: list):
+    """Add collapsed stacks from several runs or workers together."""
+    total = Counter()
+    for item in stacks:
+        total.update(item)
+    return total
+
+def write_collapsed(path: str, stacks: Counter):
+    """Write collapsed stacks, one 'stack weight' line each, heaviest
+    first."""
+    with open(path, 'w') as file:
+        for stack, weight in stacks.most_common():
+            if weight > 0:
+                file.write(f'{stack} {weight}\n')
@@ -0,0 +1,187 @@
+"""Pygame rendering helpers for the card game clients. Card faces are drawn
+once into a single texture atlas and blitted from it by area. A
+DirtyRenderer keeps a background surface and the items drawn over it, and
+redraws only the rectangles that changed since the last frame."""
+import pygame
+
+CARD_SIZE = (48, 68)
+SUMMONER_CARD_SIZE = (84, 112)
+CHIP_RADIUS = 7
+SUIT_SYMBOLS = ('S', 'H', 'D', 'C')
+SUIT_COLORS = ('black', 'red', 'red', 'black')
+RANK_TEXT = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A')
+CARD_BACK = 'back'
+CHIP = 'chip'
+
+class SpriteAtlas:
+    """Images packed into one texture in rows of fixed-size cells."""
+    def __init__(self, cell_size: tuple, columns: int = 16, rows: int = 4):
+        self.cell_size = cell_size
+        self.columns = columns
+        self.texture = pygame.Surface((cell_size[0] * columns, cell_size[1] * rows), pygame.SRCALPHA)
+        self.rects = {}
+
+    def __contains__(self, key):
+        return key in self.rects
+
+    def add(self, key, image: pygame.Surface):
+        """Copy an image into the next free cell. The texture grows by a row
+        when it is full."""
+        index = len(self.rects)
+        column, row = index % self.columns, index // self.columns
+        width, height = self.cell_size
+        if (row + 1) * height > self.texture.get_height():
+            texture = pygame.Surface((self.texture.get_width(), self.texture.get_height() + height), pygame.SRCALPHA)
+            texture.blit(self.texture, (0, 0))
+            self.texture = texture
+        rect = pygame.Rect(column * width, row * height, image.get_width(), image.get_height())
+        self.texture.blit(image, rect)
+        self.rects[key] = rect
+        return rect
+
+    def convert(self):
+        """Convert the texture to the display's pixel format for faster
+        blits. Needs the display mode to be set."""
+        self.texture = self.texture.convert_alpha()
+        return self
+
+    def size(self, key):
+        """Width and height of an image."""
+        return self.rects[key].size
+
+    def blit(self, target: pygame.Surface, key, position: tuple):
+        """Draw an image from the atlas onto a surface."""
+        target.blit(self.texture, position, self.rects[key])
+
+def text_surface(font: pygame.font.Font, text: str, color='white'):
+    """Rendered text."""
+    return font.render(text, True, color)
+
+def draw_holdem_card(font: pygame.font.Font, card_id: int | None):
+    """Face of a hold'em card id, or the back of a card for None."""
+    surface = pygame.Surface(CARD_SIZE, pygame.SRCALPHA)
+    rect = surface.get_rect()
+    if card_id is None:
+        pygame.draw.rect(surface, 'navy', rect, border_radius=5)
+        pygame.draw.rect(surface, 'white', rect.inflate(-8, -8), 2, border_radius=4)
+        return surface
+    pygame.draw.rect(surface, 'white', rect, border_radius=5)
+    pygame.draw.rect(surface, 'gray40', rect, 1, border_radius=5)
+    color = SUIT_COLORS[card_id & 3]
+    rank = text_surface(font, RANK_TEXT[card_id >> 2], color)
+    suit = text_surface(font, SUIT_SYMBOLS[card_id & 3], color)
+    surface.blit(rank, (5, 4))
+    surface.blit(suit, suit.get_rect(center=rect.center))
+    return surface
+
+def draw_chip():
+    """A single chip."""
+    surface = pygame.Surface((CHIP_RADIUS * 2, CHIP_RADIUS * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surface, 'gold', (CHIP_RADIUS, CHIP_RADIUS), CHIP_RADIUS)
+    pygame.draw.circle(surface, 'darkgoldenrod', (CHIP_RADIUS, CHIP_RADIUS), CHIP_RADIUS - 3, 2)
+    return surface
+
+def build_holdem_atlas(font: pygame.font.Font):
+    """Atlas of the 52 card faces by card id, the card back and a chip."""
+    atlas = SpriteAtlas(CARD_SIZE, 14, 4)
+    for card_id in range(52):
+        atlas.add(card_id, draw_holdem_card(font, card_id))
+    atlas.add(CARD_BACK, draw_holdem_card(font, None))
+    atlas.add(CHIP, draw_chip())
+    return atlas
+
+def draw_summoner_card(font: pygame.font.Font, name: str, mana_cost: int):
+    """Face of a Summoner card without its current stats."""
+    surface = pygame.Surface(SUMMONER_CARD_SIZE, pygame.SRCALPHA)
+    rect = surface.get_rect()
+    pygame.draw.rect(surface, 'bisque', rect, border_radius=6)
+    pygame.draw.rect(surface, 'saddlebrown', rect, 2, border_radius=6)
+    words = name.split()
+    for line, word in enumerate(words[:3]):
+        surface.blit(text_surface(font, word, 'black'), (6, 6 + line * 16))
+    pygame.draw.circle(surface, 'royalblue', (rect.right - 14, 14), 10)
+    cost = text_surface(font, str(mana_cost))
+    surface.blit(cost, cost.get_rect(center=(rect.right - 14, 14)))
+    return surface
+
+class DirtyRenderer:
+    """Items drawn over a background, by key and in the order they were
+    first set. Changing, moving or removing an item marks its old and new
+    rectangles dirty; draw() repaints only those rectangles."""
+    def __init__(self, background: pygame.Surface, atlas: SpriteAtlas | None = None):
+        self.background = background
+        self.atlas = atlas
+        self.items = {}
+        self.dirty = [background.get_rect()]
+
+    def rect_of(self, image, position: tuple):
+        """Rectangle covered by an atlas key or a Surface at a position."""
+        if isinstance(image, pygame.Surface):
+            return pygame.Rect(position, image.get_size())
+        return pygame.Rect(position, self.atlas.size(image))
+
+    def set(self, key, image, position: tuple):
+        """Draw an atlas key or a Surface at a position from now on."""
+        position = (round(position[0]), round(position[1]))
+        old = self.items.get(key)
+        if old is not None and old[0] is image and old[1] == position:
+            return
+        if old is not None:
+            self.dirty.append(old[2])
+        rect = self.rect_of(image, position)
+        self.items[key] = (image, position, rect)
+        self.dirty.append(rect)
+
+    def remove(self, key):
+        """Stop drawing an item."""
+        old = self.items.pop(key, None)
+        if old is not None:
+            self.dirty.append(old[2])
+
+    def invalidate(self):
+        """Repaint everything on the next draw."""
+        self.dirty = [self.background.get_rect()]
+
+    def draw(self, target: pygame.Surface):
+        """Repaint the dirty rectangles. Returns them for
+        pygame.display.update."""
+        if len(self.dirty) == 0:
+            return []
+        dirty = self.dirty
+        self.dirty = []
+        if len(dirty) > 32:
+            dirty = [dirty[0].unionall(dirty[1:])]
+        items = list(self.items.values())
+        rects = [item[2] for item in items]
+        for area in dirty:
+            target.set_clip(area)
+            target.blit(self.background, area, area)
+            for index in area.collidelistall(rects):
+                image, position, rect = items[index]
+                if isinstance(image, pygame.Surface):
+                    target.blit(image, position)
+                else:
+                    self.atlas.blit(target, image, position)
+        target.set_clip(None)
+        return dirty
+
+class Tween:
+    """Movement of an item from one point to another over a duration."""
+    __slots__ = ('key', 'image', 'start', 'end', 'duration', 'elapsed')
+
+    def __init__(self, key, image, start: tuple, end: tuple, duration: float):
+        self.key = key
+        self.image = image
+        self.start = start
+        self.end = end
+        self.duration = duration
+        self.elapsed = 0.0
+
+    def advance(self, dt: float):
+        """Move forward in time. Returns the position and whether the
+        movement is finished."""
+        self.elapsed = min(self.elapsed + dt, self.duration)
+        t = self.elapsed / self.duration if self.duration else 1.0
+        t = t * t * (3 - 2 * t)
+        position = (self.start[0] + (self.end[0] - self.start[0]) * t, self.start[1] + (self.end[1] - self.start[1]) * t)
+        return position, self.elapsed >= self.duration
@@ -0,0 +1,83 @@
+"""Seedable random number streams for the card games. Every game gets its
+own GameRandom instead of sharing the random module's global state, so a game
+can be replayed from its seed and parallel workers never share a stream.
+NumPy is used for batch shuffles when it is installed. The NumPy Generator
+is a separate stream from the Python one, so a seed only replays the batch
+methods (get_generator, permutations) on machines that have NumPy."""
+from hashlib import blake2b
+import random
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class GameRandom:
+    """Random number stream for one game. If no seed is given, a random seed
+    is picked and kept in GameRandom.seed so the game can be replayed."""
+    def __init__(self, seed: int | None = None):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        self.seed = seed
+        self.random = random.Random(seed)
+        self.generator = None
+
+    def spawn(self, index: int):
+        """Return an independent GameRandom for a worker or game index. The
+        same seed and index always give the same stream."""
+        digest = blake2b(f'{self.seed}:{index}'.encode(), digest_size=8).digest()
+        return GameRandom(int.from_bytes(digest, 'little'))
+
+    def split(self, count: int):
+        """Return count independent GameRandoms, one for each worker."""
+        return [self.spawn(index) for index in range(count)]
+
+    def get_generator(self):
+        """Return the NumPy Generator for this stream, creating it on first
+        use. Raises ImportError if NumPy isn't installed."""
+        if numpy is None:
+            raise ImportError('NumPy is required for batch shuffles.')
+        if self.generator is None:
+            self.generator = numpy.random.default_rng(self.seed)
+        return self.generator
+
+    def shuffle(self, items: list):
+        """Shuffle a list in place."""
+        self.random.shuffle(items)
+        return items
+
+    def randrange(self, *args):
+        """Random integer from range(*args)."""
+        return self.random.randrange(*args)
+
+    def random_float(self):
+        """Random float in [0, 1)."""
+        return self.random.random()
+
+    def choice(self, items):
+        """Random item from a sequence."""
+        return self.random.choice(items)
+
+    def sample(self, items, count: int):
+        """count unique random items from a sequence."""
+        return self.random.sample(items, count)
+
+    def choices(self, items, cum_weights=None, count: int = 1):
+        """count random items from a sequence, with replacement, weighted
+        by cumulative weights if given."""
+        return self.random.choices(items, cum_weights=cum_weights, k=count)
+
+    def permutation(self, size: int):
+        """Random ordering of range(size)."""
+        order = list(range(size))
+        self.random.shuffle(order)
+        return order
+
+    def permutations(self, count: int, size: int):
+        """count random orderings of range(size). With NumPy this is a
+        (count, size) array shuffled in one call, otherwise a list of lists.
+        The two give different orderings for the same seed."""
+        if numpy is not None:
+            order = numpy.tile(numpy.arange(size, dtype=numpy.int16 if size < 32768 else numpy.int64), (count, 1))
+            return self.get_generator().permuted(order, axis=1)
+        return [self.permutation(size) for i in range(count)]
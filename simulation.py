@@ -0,0 +1,124 @@
+"""Headless Summoner matches for testing Decks against each other without
+console input or output. The rules are a simplified version of gameplay.py:
+each Summoner gains a mana crystal every turn, casts the most expensive
+creatures they can afford and attacks with every creature that has been in
+play since their last turn."""
+from deckbuild import Card, CardType
+from rng import GameRandom
+
+class SimCreature:
+    """Creature in play during a simulated match."""
+    __slots__ = ('card', 'strength', 'fortitude', 'ready_to_attack')
+
+    def __init__(self, card: Card):
+        self.card = card
+        self.strength = card.strength or 0
+        self.fortitude = card.fortitude or 0
+        self.ready_to_attack = False
+
+class SimSummoner:
+    """Summoner taking part in a simulated match."""
+    def __init__(self, cards: list, rng: GameRandom, opening_hand: int = 7):
+        self.library = list(cards)
+        rng.shuffle(self.library)
+        self.hand = []
+        self.creatures = []
+        self.fortitude = 40
+        self.mana_crystals = 0
+        self.mana = 0
+        for i in range(opening_hand):
+            self.draw_card()
+
+    def draw_card(self):
+        """Move the top card of the library to the hand."""
+        if len(self.library) != 0:
+            self.hand.append(self.library.pop())
+
+    def cast_phase(self):
+        """Play a mana crystal if one is in hand, then cast the most
+        expensive creatures the Summoner can afford."""
+        for item in self.hand:
+            if item.card_type == CardType.MANA_CRYSTAL:
+                self.hand.remove(item)
+                self.mana_crystals += 1
+                self.mana += 1
+                break
+        self.hand.sort(key=lambda item: item.mana_cost, reverse=True)
+        for item in list(self.hand):
+            if item.card_type == CardType.CREATURE and item.mana_cost <= self.mana:
+                self.mana -= item.mana_cost
+                self.hand.remove(item)
+                self.creatures.append(SimCreature(item))
+
+    def attack_phase(self, opponent):
+        """Attack with every ready creature. The opponent blocks with the
+        weakest creature that survives the attack, or chump blocks if the
+        attack would otherwise be lethal."""
+        attackers = sorted((item for item in self.creatures if item.ready_to_attack), key=lambda item: item.strength, reverse=True)
+        incoming = sum(item.strength for item in attackers)
+        blockers = sorted(opponent.creatures, key=lambda item: item.fortitude)
+        for attacker in attackers:
+            blocker = None
+            for item in blockers:
+                if item.fortitude > attacker.strength:
+                    blocker = item
+                    break
+            if blocker is None and incoming >= opponent.fortitude and len(blockers) != 0:
+                blocker = blockers[0]
+            incoming -= attacker.strength
+            if blocker is None:
+                opponent.fortitude -= attacker.strength
+            else:
+                blockers.remove(blocker)
+                blocker.fortitude -= attacker.strength
+                if blocker.fortitude <= 0:
+                    opponent.creatures.remove(blocker)
+        for item in self.creatures:
+            item.ready_to_attack = True
+
+    def take_turn(self, opponent):
+        """Draw, gain mana, cast and attack."""
+        self.mana_crystals = min(self.mana_crystals + 1, 10)
+        self.mana = self.mana_crystals
+        self.draw_card()
+        self.cast_phase()
+        self.attack_phase(opponent)
+
+def play_match(cards1: list, cards2: list, seed: int | None = None, max_turns: int = 60):
+    """Play a simulated match between two lists of Cards. Returns 1 if the
+    first Summoner wins, 2 if the second Summoner wins and 0 for a draw."""
+    rng = GameRandom(seed)
+    summoner1 = SimSummoner(cards1, rng)
+    summoner2 = SimSummoner(cards2, rng)
+    for turn in range(max_turns):
+        summoner1.take_turn(summoner2)
+        if summoner2.fortitude <= 0:
+            return 1
+        summoner2.take_turn(summoner1)
+        if summoner1.fortitude <= 0:
+            return 2
+    return 0
+
+def win_rate(cards: list, opponents: list, games: int = 10, seed: int = 0):
+    """Fraction of games won by a list of Cards against each list of Cards in
+    opponents, alternating who takes the first turn. Draws count as half."""
+    rng = GameRandom(seed)
+    score = 0.0
+    total = 0
+    for opponent_index, opponent in enumerate(opponents):
+        for game in range(games):
+            game_seed = rng.spawn(opponent_index * games + game).seed
+            if game % 2 == 0:
+                result = play_match(cards, opponent, game_seed)
+                won = result == 1
+            else:
+                result = play_match(opponent, cards, game_seed)
+                won = result == 2
+            if won:
+                score += 1
+            elif result == 0:
+                score += 0.5
+            total += 1
+    if total == 0:
+        return 0.0
+    return score / total
@@ -0,0 +1,117 @@
+"""Stack of fast spells waiting to resolve, with priority passing between
+the two Summoners."""
+from deckbuild import Card, CardType
+
+class ResponseTracker:
+    """Fast spells in a Summoner's hand, counted by mana cost. The cheapest
+    cost is kept up to date as cards enter and leave the hand, so checking
+    if the Summoner can respond is a single comparison with their mana."""
+    def __init__(self):
+        self.cost_counts = {}
+        self.min_cost = None
+
+    def add(self, card: Card):
+        """Count a card entering the hand."""
+        if card.card_type != CardType.FAST_SPELL:
+            return
+        self.cost_counts[card.mana_cost] = self.cost_counts.get(card.mana_cost, 0) + 1
+        if self.min_cost is None or card.mana_cost < self.min_cost:
+            self.min_cost = card.mana_cost
+
+    def remove(self, card: Card):
+        """Stop counting a card leaving the hand."""
+        if card.card_type != CardType.FAST_SPELL or card.mana_cost not in self.cost_counts:
+            return
+        self.cost_counts[card.mana_cost] -= 1
+        if self.cost_counts[card.mana_cost] == 0:
+            self.cost_counts.pop(card.mana_cost)
+            if card.mana_cost == self.min_cost:
+                self.min_cost = min(self.cost_counts, default=None)
+
+    def can_respond(self, mana: int):
+        """Check if a fast spell in hand can be cast with this much mana."""
+        return self.min_cost is not None and self.min_cost <= mana
+
+class StackEntry:
+    """A spell waiting on the stack."""
+    def __init__(self, card: Card, summoner, targets: list | None = None):
+        self.card = card
+        self.summoner = summoner
+        self.targets = targets
+
+class SpellStack:
+    """Spells resolve last in, first out. After a spell is cast, priority
+    passes to the opponent; when both Summoners pass in a row, the top spell
+    resolves and priority returns to the Summoner whose turn it is."""
+    def __init__(self, battlefield):
+        self.battlefield = battlefield
+        self.entries = []
+        self.priority = None
+        self.passes = 0
+
+    def is_empty(self):
+        """Check if there are no spells on the stack."""
+        return len(self.entries) == 0
+
+    def active_summoner(self):
+        """The Summoner whose turn it is."""
+        if self.battlefield.summoner2.turn:
+            return self.battlefield.summoner2
+        return self.battlefield.summoner1
+
+    def can_respond(self, summoner):
+        """Check if a Summoner has a fast spell they can afford."""
+        return summoner.responses.can_respond(summoner.mana)
+
+    def anyone_can_respond(self):
+        """Check if either Summoner has a fast spell they can afford."""
+        return self.can_respond(self.battlefield.summoner1) or self.can_respond(self.battlefield.summoner2)
+
+    def cast(self, summoner, card: Card, targets: list | None = None):
+        """Cast a spell from a Summoner's hand onto the stack. Slow spells
+        can only be cast on the Summoner's own turn with an empty stack and
+        fast spells only while holding priority. Returns True if the spell
+        was cast."""
+        if card.card_type == CardType.SLOW_SPELL:
+            if not summoner.turn or not self.is_empty():
+                return False
+        elif card.card_type == CardType.FAST_SPELL:
+            if not self.is_empty() and self.priority != summoner:
+                return False
+        else:
+            return False
+        if card.mana_cost > summoner.mana or card not in summoner.hand:
+            return False
+        summoner.spend_mana(card)
+        summoner.remove_from_hand(card)
+        self.entries.append(StackEntry(card, summoner, targets))
+        self.priority = self.battlefield.opponent(summoner)
+        self.passes = 0
+        return True
+
+    def pass_priority(self):
+        """The Summoner holding priority passes. If both have passed, the top
+        spell resolves."""
+        if self.is_empty():
+            return
+        self.passes += 1
+        if self.passes >= 2:
+            self.resolve_top()
+        else:
+            self.priority = self.battlefield.opponent(self.priority)
+
+    def resolve_top(self):
+        """Resolve the top spell on the stack and send it to the graveyard."""
+        entry = self.entries.pop()
+        self.battlefield.resolve_spell(entry.card, entry.summoner, entry.targets)
+        self.passes = 0
+        self.priority = self.active_summoner() if not self.is_empty() else None
+
+    def settle(self):
+        """Pass priority for every Summoner who can't respond, resolving
+        spells until the stack is empty or the Summoner holding priority can
+        respond."""
+        while not self.is_empty():
+            if self.can_respond(self.priority):
+                return
+            self.pass_priority()
@@ -0,0 +1,24 @@
+from holdem.betting import Action, BettingRound
+
+def test_incomplete_all_in_raise_does_not_reopen_betting():
+    betting = BettingRound([1000, 1000, 130], 10, button=2)
+    betting.act(Action.BET, 100)
+    betting.act(Action.CALL)
+    betting.act(Action.RAISE, 130)
+    assert betting.last_aggressor == 0
+    assert betting.min_raise_to() == 230
+    assert betting.acting == 0
+    assert not betting.is_legal(Action.RAISE, 300)
+    assert betting.act(Action.CALL) == 30
+    assert not betting.round_complete()
+    assert not betting.is_legal(Action.RAISE, 300)
+    betting.act(Action.CALL)
+    assert betting.round_complete()
+
+def test_full_raise_reopens_betting():
+    betting = BettingRound([1000, 1000, 1000], 10, button=2)
+    betting.act(Action.BET, 100)
+    betting.act(Action.CALL)
+    betting.act(Action.RAISE, 200)
+    assert betting.last_aggressor == 2
+    assert betting.is_legal(Action.RAISE, 300)
@@ -0,0 +1,14 @@
+from math import comb
+from deckanalytics import hypergeometric_at_least
+
+def test_at_least_more_than_draws():
+    assert hypergeometric_at_least(40, 10, 2, 5) == 0.0
+
+def test_at_least_more_than_successes():
+    assert hypergeometric_at_least(40, 2, 10, 3) == 0.0
+
+def test_at_least_one():
+    assert abs(hypergeometric_at_least(40, 10, 7, 1) - (1 - comb(30, 7) / comb(40, 7))) < 1e-12
+
+def test_at_least_zero():
+    assert hypergeometric_at_least(40, 0, 7, 0) == 1.0
@@ -0,0 +1,27 @@
+from deckbuild import Card, CardFaction, CardRarity, CardTribe, CardType, Deck
+from gameplay import Battlefield, Phase, PlayedCard, Summoner
+
+def creature(name: str, ability: str | None = None):
+    return Card(name, CardFaction.NONE, CardTribe.NONE, 1, ability, CardType.CREATURE, CardRarity.COMMON, 1, 1)
+
+def battlefield():
+    summoner1 = Summoner(Deck('One'), CardFaction.NONE)
+    summoner2 = Summoner(Deck('Two'), CardFaction.NONE)
+    field = Battlefield(summoner1, summoner2)
+    summoner1.set_battlefield(field)
+    summoner2.set_battlefield(field)
+    return field, summoner1, summoner2
+
+def test_end_of_turn_buff_expires():
+    field, summoner1, summoner2 = battlefield()
+    summoner1.fortitude = 30
+    summoner1.start_turn()
+    target = PlayedCard(field, summoner1, creature('Squire'))
+    PlayedCard(field, summoner1, creature('Cleric', 'At the end of your turn, heal your summoner for 3.'))
+    herald = PlayedCard(field, summoner1, creature('Herald', 'Give a creature you control +2 STR/+2 FOR until the end of your turn.'))
+    herald.use_ability([target])
+    assert (target.strength, target.fortitude) == (3, 3)
+    summoner2.start_turn()
+    assert summoner1.phase == Phase.END and not summoner1.turn
+    assert summoner1.fortitude == 33
+    assert (target.strength, target.fortitude) == (1, 1)
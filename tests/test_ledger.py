@@ -0,0 +1,60 @@
+import os
+from holdem.ledger import LOG_NAME, RECORD, ChipLedger
+from money import Money
+
+def total(ledger):
+    return sum(ledger.balances.values(), Money(0))
+
+def start_hand(directory):
+    ledger = ChipLedger(directory, group_interval=0)
+    ledger.set_balance('A', Money.parse('10'))
+    ledger.set_balance('B', Money.parse('10'))
+    ledger.bet('A', Money.parse('1'))
+    ledger.bet('B', Money.parse('1'))
+    return ledger
+
+def test_crash_after_award_does_not_create_chips(tmp_path):
+    ledger = start_hand(str(tmp_path))
+    ledger.award('B', Money.parse('2'))
+    ledger.commit()
+    ledger.file.close()
+    recovered = ChipLedger(str(tmp_path))
+    recovered.refund_open_hand()
+    assert total(recovered) == Money.parse('20')
+    assert recovered.balances == {'A': Money.parse('10'), 'B': Money.parse('10')}
+    recovered.close()
+    assert total(ChipLedger(str(tmp_path))) == Money.parse('20')
+
+def test_log_truncated_after_award(tmp_path):
+    ledger = start_hand(str(tmp_path))
+    ledger.commit()
+    path = os.path.join(str(tmp_path), LOG_NAME)
+    before_award = os.path.getsize(path)
+    ledger.award('B', Money.parse('2'))
+    ledger.end_hand()
+    ledger.close()
+    with open(path, 'r+b') as file:
+        file.truncate(before_award + RECORD.size + 1)
+    recovered = ChipLedger(str(tmp_path))
+    recovered.refund_open_hand()
+    assert recovered.balances == {'A': Money.parse('10'), 'B': Money.parse('10')}
+
+def test_settled_hand_survives_reopen(tmp_path):
+    ledger = start_hand(str(tmp_path))
+    ledger.award('B', Money.parse('2'))
+    ledger.end_hand()
+    ledger.close()
+    recovered = ChipLedger(str(tmp_path))
+    assert recovered.refund_open_hand() == {}
+    assert recovered.balances == {'A': Money.parse('9'), 'B': Money.parse('11')}
+
+def test_snapshot_waits_for_hand_end(tmp_path):
+    ledger = ChipLedger(str(tmp_path), group_interval=0, snapshot_every=1)
+    ledger.set_balance('A', Money.parse('10'))
+    ledger.set_balance('B', Money.parse('10'))
+    ledger.bet('A', Money.parse('1'))
+    ledger.award('A', Money.parse('1'))
+    ledger.file.close()
+    recovered = ChipLedger(str(tmp_path))
+    recovered.refund_open_hand()
+    assert total(recovered) == Money.parse('20')
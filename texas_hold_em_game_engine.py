@@ -1,6 +1,20 @@
 """Texas Hold'Em Game Engine"""
-from texas_hold_em import *
-from collections import deque
+from functools import cached_property
+import os
+import sys
+import time
+from holdem import (Action, BettingRound, Chips, Deck, PlayerTexasHoldEm, Pool, SeatRing, Street, Table,
+                    category_name, evaluate)
+from holdem.ledger import ChipLedger
+from holdem.stats import StatsTracker
+from holdem.store import PlayerStore
+from instrumentation import instruments
+from money import Money
+
+DATA_DIRECTORY = os.path.join(os.environ.get('XDG_DATA_HOME') or os.path.join(os.path.expanduser('~'), '.local', 'share'), 'card_game_prototype')
+HISTORY_NAME = 'holdem_history.jsonl'
+LEDGER_NAME = 'ledger'
+STORE_NAME = 'players.sqlite3'
 
 class Menu:
     """Menu system for starting and running Texas Hold'Em."""
@@ -36,7 +50,7 @@ class TexasHoldEmEngine:
     game_running = False
     engine_running = True
 
-    def __init__(self, players = []):
+    def __init__(self, players = [], ledger=None, store=None, history_path: str | None = None):
         """Create players and their chips first, add them to a 
         list then create the Game Engine object using the list.
         -------------------------------------------------------
@@ -53,11 +67,19 @@ class TexasHoldEmEngine:
         self.call_value ................. Table.pool.call_value
         self.total_pool_value .......... Table.pool.total_value
         -------------------------------------------------------
-        See texas_hold_em.py for information on associated 
-        attributes and methods related to each class."""
+        See the holdem package for information on associated 
+        attributes and methods related to each class.
+        -------------------------------------------------------
+        If a ChipLedger is given, chip movements are recorded
+        in it and Players' balances are restored from it. If a
+        PlayerStore is given, balances are loaded from it when
+        play starts and saved with the session's results when
+        play stops. If history_path is given, finished hands are
+        appended to it; stats.load_history() adds the hands of
+        earlier sessions from it."""
 
         self.table = Table(Deck(), players)
-        self.table.pool = Pool(10)
+        self.table.pool = Pool(Money.major(10), ledger)
         self.pool = self.table.pool
         self.revealed_cards = self.table.revealed_cards
         self.players = self.table.players
@@ -67,7 +89,35 @@ class TexasHoldEmEngine:
         self.blinds = self.pool.blinds
         self.call_value = self.pool.call_value
         self.total_pool_value = self.pool.total_value
-        self.main_menu = Menu([
+        self.players_list_menu_submenu = ''
+        self.players_list_remove_menu = Menu([
+                'PLAYERS:',
+                self.players_list_menu_submenu
+            ], 'Enter the NUMBER of the Player to remove: ')
+        self.add_remove_players_boolean = True
+        self.create_players_list()
+        self.revealed_cards_menu = Menu([
+            'Revealed Cards:',
+            self.table.revealed_cards_string
+        ])
+        self.players_list_play = Menu([
+            'Players:',
+            self.players_list_menu_submenu
+        ])
+        self.turn = None
+        self.betting = None
+        self.seats = None
+        self.hand_players = []
+        self.store = store
+        self.session = None
+        self.buy_ins = {}
+        self.hands_played = 0
+        self.stats = StatsTracker(history_path)
+
+    @cached_property
+    def main_menu(self):
+        """Main Menu, built on first use."""
+        return Menu([
             'TEXAS HOLD\'EM',
             '1. Play',
             '2. Add/Remove Players',
@@ -76,57 +126,99 @@ class TexasHoldEmEngine:
             '5. Set Starting Chips',
             '6. Quit'
         ], '> ')
-        self.blinds_menu = Menu([
+
+    @cached_property
+    def blinds_menu(self):
+        """Blinds Menu, built on first use."""
+        return Menu([
             'BLINDS',
         ], 'Set blinds: ')
-        self.starting_chips_menu = Menu([
+
+    @cached_property
+    def starting_chips_menu(self):
+        """Starting Chips Menu, built on first use."""
+        return Menu([
             'STARTING CHIPS'
         ], 'Set Starting Chips value: ')
-        self.add_remove_players_menu = Menu([
+
+    @cached_property
+    def add_remove_players_menu(self):
+        """Add/Remove Players Menu, built on first use."""
+        return Menu([
             'ADD/REMOVE PLAYERS',
             '1. Add Player',
             '2. Remove Player',
             '3. Back'
         ], '> ')
-        self.players_list_menu_submenu = ''
-        self.players_list_remove_menu = Menu([
-                'PLAYERS:',
-                self.players_list_menu_submenu
-            ], 'Enter the NUMBER of the Player to remove: ')
-        self.add_remove_players_boolean = True
-        self.create_players_list()
-        self.select_option_menu = Menu([
+
+    @cached_property
+    def select_option_menu(self):
+        """Select Option Menu, built on first use."""
+        return Menu([
             'Choose your action:',
             '1. Check/Call',
             '2. Raise Bet',
             '3. Fold',
             '4. Peek Cards'
         ], '> ')
-        self.revealed_cards_menu = Menu([
-            'Revealed Cards:',
-            self.table.revealed_cards_string
-        ])
-        self.players_list_play = Menu([
-            'Players:',
-            self.players_list_menu_submenu
-        ])
-        self.turn = None
-        self.first_player = self.players[0]
-        self.queue = deque(self.players)
-        self.round = 0
 
     def play_game(self):
         """Start the game."""
-        if len(self.players) == 0:
-            self.menu_response('There are no players at the table...')
+        if len(self.players) < 2:
+            self.menu_response('There must be at least 2 players at the table...')
             self.stop_game()
             return
         else:
+            self.seats = SeatRing(self.players)
+            self.load_balances()
+            self.restore_balances()
+            self.start_session()
             self.game_running = True
 
+    def load_balances(self):
+        """Set each saved Player's chips from the store."""
+        if self.store is None:
+            return
+        balances = self.store.load_balances([player.name for player in self.players])
+        for player in self.players:
+            if player.name in balances:
+                player.chips.chip_value = balances[player.name]
+
+    def start_session(self):
+        """Start a session in the store and remember each Player's buy in."""
+        if self.store is None:
+            return
+        self.session = self.store.start_session()
+        self.buy_ins = {player.name: player.chips.chip_value for player in self.players}
+        self.hands_played = 0
+
+    def end_session(self):
+        """Save the Players and the session's results to the store."""
+        if self.store is None or self.session is None:
+            return
+        self.store.save_players(self.players)
+        self.store.save_results(self.session, [(player.name, self.buy_ins[player.name], player.chips.chip_value, self.hands_played) for player in self.players])
+        self.store.end_session(self.session)
+        self.session = None
+
+    def restore_balances(self):
+        """Refund any hand left open in the ledger, then set each Player's
+        chips from it, or record the chips of Players it doesn't know."""
+        ledger = self.pool.ledger
+        if ledger is None:
+            return
+        ledger.refund_open_hand()
+        for player in self.players:
+            if player.name in ledger.balances:
+                player.chips.chip_value = ledger.balances[player.name]
+            else:
+                ledger.set_balance(player.name, player.chips.chip_value)
+        ledger.commit()
+
     def stop_game(self):
         """Stop the game."""
         self.game_running = False
+        self.end_session()
 
     def create_revealed_cards_string(self):
         """Create Revealed Cards string and recreate the Revealed Cards Menu."""
@@ -136,14 +228,6 @@ class TexasHoldEmEngine:
             self.table.revealed_cards_string
         ])
 
-    def create_new_queue(self):
-        """Create a new turn queue for the new list of players."""
-        self.queue = deque(self.players)
-
-    def next_turn(self):
-        """Move the current player to the back of the queue."""
-        self.queue.append(self.queue.popleft())
-
     def print_play_menu_get_response(self):
         """Print play menu including the Revealed Cards Menu, the Players List Menu
         (without user input), and the Select Option Menu, and get a response to 
@@ -153,67 +237,157 @@ class TexasHoldEmEngine:
         return self.select_option_menu()
 
     def create_players_list_current_turn(self):
-        """Set the current Player's turn to the first person in the queue. Then
-        recreate the Player's List Menus, and the Player's List."""
-        self.turn = self.queue[0]
+        """Set the current Player's turn to the acting seat of the betting
+        round. Then recreate the Player's List Menus, and the Player's List."""
+        self.turn = self.hand_players[self.betting.acting]
         self.create_players_list_submenu()
         self.create_players_list()
 
     def game_loop(self):
-        """ADD CODE AS METHODS AND ATTRIBUTES ARE DEVELOPED."""
+        """Play hands until the players stop."""
         self.players_list_menu()
         self.cls()
         while self.game_running:
-            self.table.deal_cards()
-            self.create_players_list_current_turn()
-            self.player_turn()
-            if self.turn == self.first_player and self.round == 0:
-                self.round += 1
-                if self.round == 1:
-                    self.table.reveal_three()
-                    self.create_revealed_cards_string()
-            elif self.turn == self.first_player and self.round == 1:
-                self.round += 1
-                if self.round == 2 or self.round == 3:
-                    self.table.reveal_card()
-                    self.create_revealed_cards_string()
-
-            
+            self.start_hand()
+            while not self.betting.hand_over():
+                if self.betting.round_complete():
+                    self.next_street()
+                else:
+                    self.create_players_list_current_turn()
+                    self.player_turn()
+            self.end_hand()
+            if self.seats.active_count < 2:
+                self.menu_response('Not enough players with chips to continue...')
+                self.stop_game()
+            elif input('Play another hand? (y/n) ') != 'y':
+                self.stop_game()
+
+    def start_hand(self):
+        """Gather the cards, move the button, shuffle, deal, post the blinds
+        and start the betting. Pool.blinds is the big blind."""
+        self.table.reform_deck()
+        self.table.return_revealed_cards()
+        self.table.shuffle_deck()
+        self.seats.advance_button()
+        hand_seats = self.seats.hand_seats()
+        self.hand_players = [self.seats.players[seat] for seat in hand_seats]
+        with instruments.timer('holdem.deal'):
+            for player in self.hand_players:
+                player.draw_cards(self.deck)
+        self.create_revealed_cards_string()
+        small, big = (hand_seats.index(seat) for seat in self.seats.blinds())
+        big_blind = self.pool.blinds
+        self.betting = BettingRound([player.chips.chip_value for player in self.hand_players], big_blind,
+                                    blinds={small: big_blind // 2, big: big_blind}, first_to_act=(big + 1) % len(self.hand_players))
+        for index in (small, big):
+            self.turn = self.hand_players[index]
+            self.place_bet(self.betting.committed[index])
+            print(self.turn.name, 'POSTS', '$'+str(self.betting.committed[index])+'.')
+        self.stats.start_hand([player.name for player in self.hand_players], big_blind)
+        print('Dealer:', self.hand_players[0].name)
+
+    def next_street(self):
+        """Start the next betting round and reveal its cards."""
+        street = self.betting.next_street()
+        with instruments.timer('holdem.reveal'):
+            if street == Street.FLOP:
+                self.table.reveal_three()
+            elif street == Street.TURN or street == Street.RIVER:
+                self.table.reveal_card()
+        self.create_revealed_cards_string()
+
+    def end_hand(self):
+        """Pay the pot to the winners and reset the bets."""
+        board = tuple(card.card_id for card in self.revealed_cards)
+        scores = {}
+        for seat in self.betting.in_hand():
+            hand = self.hand_players[seat].hand
+            with instruments.timer('holdem.evaluate'):
+                scores[seat] = evaluate((hand[0].card_id, hand[1].card_id) + board) if len(board) == 5 else 0
+        net = {}
+        for seat, amount in enumerate(self.betting.payouts(scores)):
+            player = self.hand_players[seat]
+            net[player.name] = amount - self.betting.committed[seat]
+            if amount > 0:
+                self.table.award_pot(player, amount)
+                if len(scores) > 1:
+                    print(f'{player.name} wins ${amount} with {category_name(scores[seat])}.')
+                else:
+                    print(f'{player.name} wins ${amount}.')
+            self.player_bets[player.name] = Money(0)
+            if player.chips.chip_value == 0:
+                self.seats.sit_out(self.seats.seat_of(player))
+        self.pool.call_value = self.pool.blinds
+        self.hands_played += 1
+        self.stats.end_hand(net)
+        if self.pool.ledger is not None:
+            self.pool.ledger.end_hand()
+
+    def place_bet(self, amount: Money):
+        """Move chips from the current Player to the Pool."""
+        self.turn.chips.chip_value -= amount
+        self.pool.add_player_bet(self.turn.name, amount)
+
+    def act(self, action: Action, amount: Money = Money(0)):
+        """Take a betting action for the current Player and count it in
+        their stats once it is accepted. Returns the chips put in."""
+        street = self.betting.street
+        with instruments.timer('holdem.action'):
+            put_in = self.betting.act(action, amount)
+        self.stats.record_action(self.turn.name, action, street)
+        instruments.count('holdem.actions.' + action.name.lower())
+        return put_in
+
     def player_turn(self):
         """Display the Play Menu for the current Player's turn, and based on
         the response, perform the appropriate actions."""
         response = self.print_play_menu_get_response()
         if response == '1':
-            self.turn.call(self.turn.name)
-            print('Player', self.turn.name, 'CALLS', self.call_value+'.')
-            self.next_turn()
+            if self.betting.is_legal(Action.CHECK):
+                self.act(Action.CHECK)
+                print(self.turn.name, 'CHECKS.')
+            else:
+                self.place_bet(self.act(Action.CALL))
+                print(self.turn.name, 'CALLS', '$'+str(self.betting.current_bet)+'.')
         elif response == '2':
-            self.turn.raise_bet(self.get_bet_amount())
-            self.next_turn()
+            action = Action.BET if self.betting.current_bet == 0 else Action.RAISE
+            if not self.betting.is_legal(action, self.betting.max_raise_to()):
+                self.menu_response('Not enough chips to raise!')
+                self.player_turn()
+                return
+            amount = self.get_bet_amount(action)
+            if amount is None:
+                self.cls()
+                self.player_turn()
+                return
+            self.place_bet(self.act(action, amount))
+            print(self.turn.name, action.name + 'S', '$'+str(amount)+'.')
         elif response == '3':
-            self.turn.discard_cards(self.table.discard_pile)
+            self.act(Action.FOLD)
+            self.turn.discard_hand(self.table.discard_pile)
             print(self.turn.name, 'FOLDS.')
-            self.next_turn()
         elif response == '4':
             self.turn.peek_cards()
             self.cls()
             self.player_turn()
         self.cls()
 
-    def get_bet_amount(self):
-        """Get the bet amount. If bet is invalid, get another bet_amount."""
-        bet_amount = input('Enter your bet: ')
-        if bet_amount == 0 or self.player_bets[self.turn.name] < self.call_value and bet_amount+self.player_bets[self.turn.name] <= self.call_value:
+    def get_bet_amount(self, action: Action):
+        """Get the total bet to raise to, asking again until it is legal.
+        Returns None if the Player leaves it blank to go back."""
+        low = min(self.betting.min_raise_to(), self.betting.max_raise_to())
+        high = self.betting.max_raise_to()
+        while True:
+            response = input(f'Enter your bet (${low} to ${high}, blank to go back): ')
+            if response.strip() == '':
+                return None
+            try:
+                bet_amount = Money.parse(response)
+            except ValueError:
+                bet_amount = None
+            if bet_amount is not None and self.betting.is_legal(action, bet_amount):
+                return bet_amount
             print('Invalid bet!')
-            bet_amount = self.get_bet_amount()
-        return bet_amount
-
-    def reveal_card(self):
-        """Reveal cards in three rounds."""
-        if self.round == 1:
-            self.table.reveal_three()
-        elif 3 == self.round == 2:
-            self.table.reveal_card()
 
     def menu_response(self, text):
         """Menu response that displays text to the console, waits for 1.2 seconds,
@@ -298,9 +472,9 @@ class TexasHoldEmEngine:
         self.players_list_menu_submenu = ''
         for player in players_enum:
             if player[1] == self.turn:
-                self.players_list_menu_submenu += '>>>'+str(player[0]+1)+' '+player[1].name+': $'+self.player_bets[player[1].name]+' (Chips: '+player[1].chips.chip_value+')\n'
+                self.players_list_menu_submenu += '>>>'+str(player[0]+1)+' '+player[1].name+': $'+str(self.player_bets[player[1].name])+' (Chips: '+str(player[1].chips.chip_value)+')\n'
             else:
-                self.players_list_menu_submenu += str(player[0]+1)+' '+player[1].name+': $'+self.player_bets[player[1].name]+' (Chips: '+player[1].chips.chip_value+')\n'
+                self.players_list_menu_submenu += str(player[0]+1)+' '+player[1].name+': $'+str(self.player_bets[player[1].name])+' (Chips: '+str(player[1].chips.chip_value)+')\n'
 
     def remove_player(self):
         """TO BE ADDED"""
@@ -316,6 +490,16 @@ class TexasHoldEmEngine:
             return name
         return ''
 
+    def shutdown(self):
+        """Flush and close the stats history, the chip ledger and the
+        player store, saving the session if it is still open."""
+        self.stats.close()
+        if self.pool.ledger is not None:
+            self.pool.ledger.close()
+        if self.store is not None:
+            self.end_session()
+            self.store.close()
+
     def run_engine(self):
         """Run Engine."""
         while self.engine_running:
@@ -338,29 +522,32 @@ class TexasHoldEmEngine:
                 self.create_players_list()
                 self.players_list_menu()
             elif response == '4':
-                blinds_response = self.blinds_menu()
-                if blinds_response.isdigit():
-                    if float(blinds_response) >= 0:
-                        self.blinds = blinds_response
+                try:
+                    blinds = Money.parse(self.blinds_menu())
+                except ValueError:
+                    self.menu_response('Blinds value must be a number...')
+                else:
+                    if blinds >= 0:
+                        self.table.set_blinds(blinds)
+                        self.blinds = self.pool.blinds
                         self.menu_response(f'Blinds set to ${self.blinds}.')
                     else:
                         self.menu_response('Blinds value must be non-negative...')
-                else:
-                    self.menu_response('Blinds value must be a number...')
             elif response == '5':
-                chips_response = self.starting_chips_menu()
-                if chips_response.isdigit():
-                    if float(chips_response) > 0:
+                try:
+                    starting_chips = Money.parse(self.starting_chips_menu())
+                except ValueError:
+                    self.menu_response('Starting Chips value must be a number...')
+                else:
+                    if starting_chips > 0:
                         if self.players is not None:
                             for player in self.players:
-                                player.chips = Chips(player, self.table, chips_response)
-                            self.menu_response(f'Starting Chip value set to ${chips_response}.')
+                                player.chips = Chips(player, self.table, starting_chips)
+                            self.menu_response(f'Starting Chip value set to ${starting_chips}.')
                         else:
                             self.menu_response('There are no players at the table...')
                     else:
                         self.menu_response('Starting Chip value must be greater than 0...')
-                else:
-                    self.menu_response('Starting Chips value must be a number...')
             elif response == '6':
                 self.cls()
                 self.menu_response('GOODBYE!')
@@ -369,8 +556,24 @@ class TexasHoldEmEngine:
                 self.menu_response('Invalid input! Please try again.')
             while self.game_running:
                 self.game_loop()
+        self.shutdown()
+
+def main(data_directory: str = DATA_DIRECTORY):
+    """Run the engine with the default Players, keeping the stats history,
+    the chip ledger and the player store in data_directory. Chips left in a
+    hand that never ended are refunded before play, and the stats of earlier
+    sessions are loaded. The directory is a per-user data directory outside
+    the repository unless given as the first command line argument."""
+    os.makedirs(data_directory, exist_ok=True)
+    players = [PlayerTexasHoldEm('Evan'), PlayerTexasHoldEm('Connor')]
+    ledger = ChipLedger(os.path.join(data_directory, LEDGER_NAME))
+    ledger.refund_open_hand()
+    store = PlayerStore(os.path.join(data_directory, STORE_NAME))
+    engine = TexasHoldEmEngine(players, ledger, store, os.path.join(data_directory, HISTORY_NAME))
+    engine.stats.load_history()
+    engine.table.set_player_table()
+    engine.table.pool.add_players(players)
+    engine.run_engine()
 
-engine = TexasHoldEmEngine([PlayerTexasHoldEm('Evan'), PlayerTexasHoldEm('Connor')])
-engine.table.set_player_table()
-engine.table.pool.add_players([PlayerTexasHoldEm('Evan'), PlayerTexasHoldEm('Connor')])
-engine.run_engine()
+if __name__ == '__main__':
+    main(sys.argv[1] if len(sys.argv) > 1 else DATA_DIRECTORY)
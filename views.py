@@ -0,0 +1,235 @@
+"""Views drawing game state through a DirtyRenderer. Game logic hands a view
+a snapshot of plain values with update(); the view compares it with the
+last snapshot and only touches the items that changed, so a frame where
+nothing happened repaints nothing. Chip movement is animated by animate(),
+which runs every frame independently of game updates."""
+import math
+import pygame
+from render import CARD_BACK, CARD_SIZE, CHIP, SUMMONER_CARD_SIZE, DirtyRenderer, SpriteAtlas, Tween, draw_summoner_card, text_surface
+
+CHIP_SECONDS = 0.35
+
+def holdem_state(names: list, betting, holes: list, board: tuple, button: int, shown: bool = False, won: list | None = None):
+    """Snapshot of a hand of hold'em from a BettingRound. holes are the hole
+    card ids by seat and board the card ids dealt so far. Hole cards other
+    than seat 0's are face down unless shown."""
+    return {
+        'names': tuple(names),
+        'stacks': tuple(betting.stacks),
+        'bets': tuple(betting.street_bets),
+        'pot': betting.pot - sum(betting.street_bets),
+        'folded': tuple(betting.folded),
+        'acting': betting.acting,
+        'holes': tuple(None if betting.folded[seat] else hole if shown or seat == 0 else (None, None) for seat, hole in enumerate(holes)),
+        'board': tuple(board),
+        'button': button,
+        'street': betting.street.name,
+        'won': tuple(won) if won is not None else None
+    }
+
+def creature_state(creature):
+    """Snapshot of a creature in play: name, cost, strength and fortitude."""
+    return (creature.card.name, creature.card.mana_cost, creature.strength, creature.fortitude)
+
+def summoner_state(name: str, summoner):
+    """Snapshot of a simulation SimSummoner."""
+    return {
+        'name': name,
+        'fortitude': summoner.fortitude,
+        'mana': summoner.mana,
+        'mana_crystals': summoner.mana_crystals,
+        'hand': len(summoner.hand),
+        'library': len(summoner.library),
+        'creatures': tuple(creature_state(item) for item in summoner.creatures)
+    }
+
+def match_state(names: list, summoners: list, turn: int, result: int | None = None):
+    """Snapshot of a Summoner match between SimSummoners."""
+    return {
+        'summoners': tuple(summoner_state(name, summoner) for name, summoner in zip(names, summoners)),
+        'turn': turn,
+        'result': result
+    }
+
+class View:
+    """Labels and chip animations shared by the game views. Rendered text is
+    cached so an unchanged label keeps the same Surface and isn't redrawn."""
+    def __init__(self, renderer: DirtyRenderer, font: pygame.font.Font):
+        self.renderer = renderer
+        self.font = font
+        self.labels = {}
+        self.tweens = []
+        self.chips_moved = 0
+        self.state = None
+
+    def label(self, text: str, color='white'):
+        """Rendered text, cached."""
+        key = (text, color)
+        surface = self.labels.get(key)
+        if surface is None:
+            if len(self.labels) > 512:
+                self.labels.clear()
+            surface = self.labels[key] = text_surface(self.font, text, color)
+        return surface
+
+    def set_label(self, key, text: str, position: tuple, color='white', centered: bool = True):
+        """Draw a label, centered on a position by default."""
+        surface = self.label(text, color)
+        if centered:
+            position = (position[0] - surface.get_width() // 2, position[1] - surface.get_height() // 2)
+        self.renderer.set(key, surface, position)
+
+    def move_chip(self, start: tuple, end: tuple):
+        """Animate a chip from one point to another."""
+        self.chips_moved += 1
+        key = ('chip', self.chips_moved)
+        self.tweens.append(Tween(key, CHIP, start, end, CHIP_SECONDS))
+
+    def animate(self, dt: float):
+        """Advance the chip animations by dt seconds."""
+        remaining = []
+        for tween in self.tweens:
+            position, finished = tween.advance(dt)
+            if finished:
+                self.renderer.remove(tween.key)
+            else:
+                self.renderer.set(tween.key, tween.image, position)
+                remaining.append(tween)
+        self.tweens = remaining
+
+    def animating(self):
+        """Check if any animation is still running."""
+        return len(self.tweens) != 0
+
+class HoldemView(View):
+    """Hold'em table: seats around an oval with their hole cards, stacks and
+    bets, the board and the pot in the middle."""
+    def __init__(self, renderer: DirtyRenderer, font: pygame.font.Font, seats: int):
+        super().__init__(renderer, font)
+        width, height = renderer.background.get_size()
+        self.center = (width // 2, height // 2)
+        self.seats = []
+        for seat in range(seats):
+            angle = math.pi / 2 + 2 * math.pi * seat / seats
+            x = self.center[0] + math.cos(angle) * width * 0.38
+            y = self.center[1] + math.sin(angle) * height * 0.36
+            bet_x = self.center[0] + math.cos(angle) * width * 0.22
+            bet_y = self.center[1] + math.sin(angle) * height * 0.2
+            self.seats.append(((round(x), round(y)), (round(bet_x), round(bet_y))))
+        self.pot_position = (self.center[0], self.center[1] + CARD_SIZE[1] // 2 + 14)
+
+    def seat_cards(self, seat: int, index: int):
+        """Top left corner of a hole card."""
+        x, y = self.seats[seat][0]
+        return (x - CARD_SIZE[0] - 2 + index * (CARD_SIZE[0] + 4), y - CARD_SIZE[1] // 2 - 12)
+
+    def board_card(self, index: int):
+        """Top left corner of a board card."""
+        return (self.center[0] - (5 * CARD_SIZE[0] + 16) // 2 + index * (CARD_SIZE[0] + 4), self.center[1] - CARD_SIZE[1] // 2 - 8)
+
+    def update(self, state: dict):
+        """Redraw the parts of the table that changed since the last
+        snapshot."""
+        old = self.state or {}
+        self.state = state
+        for seat, (position, bet_position) in enumerate(self.seats):
+            if old.get('holes', (False,) * len(self.seats))[seat] != state['holes'][seat]:
+                hole = state['holes'][seat]
+                for index in range(2):
+                    if hole is None:
+                        self.renderer.remove(('hole', seat, index))
+                    else:
+                        card = hole[index]
+                        self.renderer.set(('hole', seat, index), CARD_BACK if card is None else card, self.seat_cards(seat, index))
+            if old.get('names') != state['names'] or old.get('acting') != state['acting'] or old.get('folded') != state['folded']:
+                color = 'gray50' if state['folded'][seat] else 'yellow' if state['acting'] == seat else 'white'
+                self.set_label(('name', seat), state['names'][seat], (position[0], position[1] + CARD_SIZE[1] // 2 + 2), color)
+            if old.get('stacks') is None or old['stacks'][seat] != state['stacks'][seat]:
+                self.set_label(('stack', seat), str(state['stacks'][seat]), (position[0], position[1] + CARD_SIZE[1] // 2 + 18))
+            if old.get('bets') is None or old['bets'][seat] != state['bets'][seat]:
+                bet = state['bets'][seat]
+                if bet == 0:
+                    self.renderer.remove(('bet', seat))
+                    if old.get('bets') is not None and old['bets'][seat] > 0:
+                        self.move_chip(bet_position, self.pot_position)
+                else:
+                    self.set_label(('bet', seat), str(bet), (bet_position[0], bet_position[1] + 14), 'gold')
+                    if old.get('bets') is not None and bet > old['bets'][seat]:
+                        self.move_chip(position, bet_position)
+            if old.get('button') != state['button']:
+                if state['button'] == seat:
+                    self.set_label('button', 'D', (position[0] + CARD_SIZE[0] + 14, position[1]), 'orange')
+        if old.get('board') != state['board']:
+            for index in range(5):
+                if index < len(state['board']):
+                    self.renderer.set(('board', index), state['board'][index], self.board_card(index))
+                else:
+                    self.renderer.remove(('board', index))
+        if old.get('pot') != state['pot']:
+            self.set_label('pot', f"Pot {state['pot']}" if state['pot'] else '', self.pot_position, 'gold')
+        if old.get('street') != state['street']:
+            self.set_label('street', state['street'].title(), (self.center[0], 14), 'gray80')
+        if state['won'] is not None and old.get('won') != state['won']:
+            for seat, amount in enumerate(state['won']):
+                if amount > 0:
+                    self.move_chip(self.pot_position, self.seats[seat][0])
+
+class BattlefieldView(View):
+    """Summoner match: each Summoner's creatures in a row, the first
+    Summoner at the bottom, with their fortitude, mana and card counts.
+    Card faces are added to the atlas the first time a card is seen."""
+    def __init__(self, renderer: DirtyRenderer, font: pygame.font.Font):
+        super().__init__(renderer, font)
+        self.atlas = renderer.atlas
+        width, height = renderer.background.get_size()
+        self.size = (width, height)
+        self.rows = (height - SUMMONER_CARD_SIZE[1] - 40, 40)
+
+    def card_key(self, name: str, mana_cost: int):
+        """Atlas key for a Summoner card, drawing its face if needed."""
+        key = ('summoner', name)
+        if key not in self.atlas:
+            self.atlas.add(key, draw_summoner_card(self.font, name, mana_cost))
+        return key
+
+    def creature_position(self, row: int, index: int):
+        """Top left corner of a creature."""
+        return (12 + index * (SUMMONER_CARD_SIZE[0] + 6), self.rows[row])
+
+    def update(self, state: dict):
+        """Redraw the creatures and counters that changed since the last
+        snapshot."""
+        old = self.state or {}
+        self.state = state
+        old_summoners = old.get('summoners', (None, None))
+        width, height = self.size
+        for row, summoner in enumerate(state['summoners']):
+            previous = old_summoners[row] or {}
+            old_creatures = previous.get('creatures', ())
+            creatures = summoner['creatures']
+            for index in range(max(len(creatures), len(old_creatures))):
+                if index >= len(creatures):
+                    self.renderer.remove(('creature', row, index))
+                    self.renderer.remove(('stats', row, index))
+                    continue
+                if index < len(old_creatures) and old_creatures[index] == creatures[index]:
+                    continue
+                name, mana_cost, strength, fortitude = creatures[index]
+                x, y = self.creature_position(row, index)
+                self.renderer.set(('creature', row, index), self.card_key(name, mana_cost), (x, y))
+                self.set_label(('stats', row, index), f'{strength}/{fortitude}', (x + 6, y + SUMMONER_CARD_SIZE[1] - 20), 'black', False)
+            info = (summoner['name'], summoner['fortitude'], summoner['mana'], summoner['mana_crystals'], summoner['hand'], summoner['library'])
+            old_info = tuple(previous.get(field) for field in ('name', 'fortitude', 'mana', 'mana_crystals', 'hand', 'library'))
+            if info != old_info:
+                y = self.rows[row] - 18 if row == 0 else self.rows[row] + SUMMONER_CARD_SIZE[1] + 18
+                text = f'{info[0]}  FOR {info[1]}  Mana {info[2]}/{info[3]}  Hand {info[4]}  Library {info[5]}'
+                self.set_label(('summoner', row), text, (width // 2, y))
+        if old.get('turn') != state['turn'] or old.get('result') != state['result']:
+            text = f"Turn {state['turn']}"
+            if state['result'] is not None:
+                text += ' - Draw' if state['result'] == 0 else f" - {state['summoners'][state['result'] - 1]['name']} wins"
+            self.set_label('turn', text, (width // 2, height // 2), 'gray80')
+
+def summoner_atlas():
+    """Empty atlas for Summoner card faces."""
+    return SpriteAtlas(SUMMONER_CARD_SIZE, 10, 2)